@@ -0,0 +1,65 @@
+# ----------------------
+# Morse alphabet registry benchmark
+#
+#   python benchmarks/bench_alphabets.py [--size 1M] [--repeat 3]
+#
+# Times encoding/decoding through each registered alphabet, and
+# switching between alphabets call by call.  The round trips over every
+# table are checked in tests/test_alphabets.py.
+# ----------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import ALPHABETS, decode_from_morse, encode_to_morse
+from benchmarks.bench_encode import best_time, parse_size
+
+
+def make_text(alphabet, size, rng):
+    letters = [char for char in alphabet.table if char != ' ']
+    words = []
+    length = 0
+    while length < size:
+        word = ''.join(rng.choices(letters, k=rng.randint(2, 9)))
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:size]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', default='1M')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    size = parse_size(args.size)
+    rng = random.Random(17)
+
+    print(f"{'alphabet':<14} {'chars':>6} {'aliases':>8} {'encode MB/s':>12} {'decode MB/s':>12}")
+    for alphabet in ALPHABETS.values():
+        chars, aliases = len(alphabet.table), len(alphabet.aliases)
+        text = make_text(alphabet, size, rng)
+        code = alphabet.encode(text)
+        encode = best_time(alphabet.encode, text, args.repeat)
+        decode = best_time(alphabet.decode, code, args.repeat)
+        print(f"{alphabet.name:<14} {chars:>6} {aliases:>8} "
+              f"{size / encode / 1e6:>12.2f} {size / decode / 1e6:>12.2f}")
+
+    # Switching: short messages, a different alphabet on every call
+    messages = [(name, make_text(alphabet, 40, rng)) for name, alphabet in ALPHABETS.items()]
+    calls = 20000
+    start = time.perf_counter()
+    for i in range(calls):
+        name, text = messages[i % len(messages)]
+        decode_from_morse(encode_to_morse(text, name), name)
+    switching = time.perf_counter() - start
+    print(f"\nswitching alphabets every call: {switching / calls * 1e6:.1f} us per "
+          f"40 char round trip")
+
+
+if __name__ == "__main__":
+    main()
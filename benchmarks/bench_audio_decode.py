@@ -0,0 +1,53 @@
+# ----------------------
+# CW audio decoder benchmark: round trip through morse.tone with noise
+#
+#   python benchmarks/bench_audio_decode.py [--minutes 10] [--noise 0,0.3,0.8]
+#
+# Noise is the standard deviation of white noise added to a tone of
+# amplitude 0.8.  Accuracy is the difflib similarity of decoded text.
+# ----------------------
+
+import argparse
+import difflib
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import audio, encode_to_morse, tone
+
+TEXT = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG 0123456789 "
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--minutes', type=float, default=10)
+    parser.add_argument('--wpm', default='12,20,30')
+    parser.add_argument('--noise', default='0,0.3,0.8,1.2')
+    parser.add_argument('--rate', type=int, default=8000)
+    parser.add_argument('--frequency', type=float, default=650)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'wpm':>5} {'noise':>6} {'audio s':>9} {'decode s':>9} {'x realtime':>11} {'accuracy':>9}")
+    for wpm in map(float, args.wpm.split(',')):
+        # 55 characters of TEXT is about 13 PARIS words
+        text = (TEXT * max(1, int(args.minutes * wpm / 13))).strip()
+        clean = tone.render(encode_to_morse(text), wpm=wpm, frequency=args.frequency,
+                            sample_rate=args.rate)
+        for noise in map(float, args.noise.split(',')):
+            samples = clean + rng.normal(0, noise, len(clean)).astype(np.float32) if noise else clean
+            start = time.perf_counter()
+            decoded = audio.decode_samples(samples, args.rate)
+            seconds = time.perf_counter() - start
+            accuracy = difflib.SequenceMatcher(None, text, decoded, autojunk=False).ratio()
+            length = len(samples) / args.rate
+            print(f"{wpm:>5.0f} {noise:>6.2f} {length:>9.1f} {seconds:>9.3f} "
+                  f"{length / seconds:>11.0f} {accuracy:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# ----------------------
+# Directory batch runner benchmark
+#
+#   python benchmarks/bench_batch.py [--files 2000] [--size 16K] [--workers 1,4]
+#
+# Writes a tree of text files, encodes it with morse.batch at each worker
+# count, then reruns once to time the resume check with nothing to do.
+# ----------------------
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import batch
+from benchmarks.bench_encode import make_corpus, parse_size
+
+
+def write_tree(root, files, size):
+    text = make_corpus(size)
+    lines = '\n'.join(text[i:i + 72] for i in range(0, len(text), 72))
+    for i in range(files):
+        directory = os.path.join(root, f"d{i % 16:02d}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"f{i:05d}.txt"), 'w', encoding='utf-8') as f:
+            f.write(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=2000)
+    parser.add_argument('--size', default='16K')
+    parser.add_argument('--workers', default=f"1,{os.cpu_count() or 1}")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'src')
+        write_tree(source, args.files, parse_size(args.size))
+        print(f"{args.files} files of {args.size}")
+        print(f"{'workers':>8} {'seconds':>9} {'files/s':>9} {'MB/s':>8}")
+        for workers in dict.fromkeys(map(int, args.workers.split(','))):
+            output = os.path.join(tmp, 'out')
+            shutil.rmtree(output, ignore_errors=True)
+            progress = batch.run('encode', source, output, workers, stream=io.StringIO())
+            seconds, files, data = progress.rates()
+            print(f"{workers:>8} {seconds:>9.2f} {files:>9.0f} {data / 1e6:>8.2f}")
+
+        start = time.perf_counter()
+        progress = batch.run('encode', source, output, stream=io.StringIO())
+        assert progress.files == 0
+        print(f"resume with everything done: {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
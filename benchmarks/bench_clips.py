@@ -0,0 +1,70 @@
+# ----------------------
+# Clip-assembled vs synthesized audio benchmark
+#
+#   python benchmarks/bench_clips.py [--minutes 60] [--wpm 20] [--rates 8000,44100]
+#
+# Renders the same long message with tone.render_pcm16 (every sample
+# synthesized) and with ClipRenderer (per-letter PCM clips copied into a
+# preallocated buffer), checks both give the same length and key-down
+# timing, and reports the speed of each.
+# ----------------------
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import encode_to_morse, tone
+from morse.clips import ClipRenderer
+from benchmarks.bench_encode import best_time, make_corpus
+
+
+def key_edges(pcm, sample_rate):
+    # Starts of silences longer than 10 ms: letter and word gaps
+    silent = np.concatenate(([0], (pcm == 0).astype(np.int8), [0]))
+    change = np.diff(silent)
+    starts, ends = np.flatnonzero(change == 1), np.flatnonzero(change == -1)
+    return starts[ends - starts > sample_rate // 100]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--minutes', type=float, default=60)
+    parser.add_argument('--wpm', type=float, default=20)
+    parser.add_argument('--farnsworth', type=float, default=None)
+    parser.add_argument('--rates', default='8000,44100')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Ordinary text at about the right length for the requested minutes
+    words = int(args.minutes * (args.farnsworth or args.wpm))
+    morse = encode_to_morse(make_corpus(words * 6))
+
+    print(f"{'rate':>8} {'audio s':>10} {'synth s':>9} {'x realtime':>11} "
+          f"{'clips s':>9} {'x realtime':>11} {'speed-up':>9} {'setup ms':>9}")
+    for rate in map(int, args.rates.split(',')):
+        options = {'wpm': args.wpm, 'farnsworth_wpm': args.farnsworth, 'sample_rate': rate}
+        start = time.perf_counter()
+        renderer = ClipRenderer(**options)
+        setup = time.perf_counter() - start
+
+        synthesized = tone.render_pcm16(morse, **options)
+        assembled = renderer.render_pcm16(morse)
+        assert len(synthesized) == len(assembled)
+        drift = np.abs(key_edges(synthesized, rate) - key_edges(assembled, rate)).max()
+        assert drift <= rate // 1000, f"gap edges differ by {drift} samples"
+
+        synth = best_time(lambda code: tone.render_pcm16(code, **options), morse, args.repeat)
+        clips = best_time(renderer.render_pcm16, morse, args.repeat)
+        audio = len(synthesized) / rate
+        print(f"{rate:>8} {audio:>10.0f} {synth:>9.3f} {audio / synth:>11.0f} "
+              f"{clips:>9.3f} {audio / clips:>11.0f} {synth / clips:>8.1f}x {setup * 1000:>9.1f}")
+        print(f"{'':>8} clip cache: {renderer.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# ----------------------
+# Decoder throughput benchmark
+#
+#   python benchmarks/bench_decode.py [--sizes 1K,1M,200M] [--repeat 3]
+#
+# Sizes are of the encoded Morse input.
+# ----------------------
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import MORSE_CODE_DICT, REVERSE_MORSE_CODE_DICT, MorseDecoder, MorseEncoder
+from benchmarks.bench_encode import best_time, make_corpus, parse_size
+
+
+# The implementation the table-driven decoder replaces
+def legacy_decode_from_morse(code):
+    words = code.strip().split(' / ')
+    decoded_words = []
+    for word in words:
+        letters = word.strip().split()
+        decoded_word = ''.join(REVERSE_MORSE_CODE_DICT.get(l, '?') for l in letters)
+        decoded_words.append(decoded_word)
+    return ' '.join(decoded_words)
+
+
+def make_morse_corpus(size):
+    # Morse averages a little over 4 characters per encoded letter
+    code = MorseEncoder(MORSE_CODE_DICT).encode(make_corpus(size // 4 + 1))
+    cut = code.rfind(' ', 0, size)
+    return code[:cut] if cut > 0 else code
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='1K,1M,200M')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    decoder = MorseDecoder(REVERSE_MORSE_CODE_DICT)
+    candidates = [
+        ('legacy decode_from_morse', legacy_decode_from_morse),
+        ('MorseDecoder.decode', decoder.decode),
+    ]
+
+    print(f"{'size':>8}  {'implementation':<26} {'seconds':>10} {'MB/s':>10}")
+    for label in args.sizes.split(','):
+        code = make_morse_corpus(parse_size(label))
+        for name, func in candidates:
+            seconds = best_time(func, code, args.repeat)
+            print(f"{label:>8}  {name:<26} {seconds:>10.4f} {len(code) / seconds / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
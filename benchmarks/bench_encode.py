@@ -0,0 +1,87 @@
+# ----------------------
+# Encoder throughput benchmark
+#
+#   python benchmarks/bench_encode.py [--sizes 1K,1M,100M] [--repeat 3]
+# ----------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import MORSE_CODE_DICT, MorseEncoder
+
+SIZES = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_size(text):
+    text = text.strip().upper()
+    if text[-1] in SIZES:
+        return int(text[:-1]) * SIZES[text[-1]]
+    return int(text)
+
+
+def make_corpus(size, seed=0):
+    rng = random.Random(seed)
+    alphabet = 'ETAOINSHRDLUetaoinshrdlu      .,?0123456789'
+    block = ''.join(rng.choice(alphabet) for _ in range(min(size, 1 << 16)))
+    return (block * (size // len(block) + 1))[:size]
+
+
+# The implementations the table-driven encoder replaces
+def legacy_encode_to_morse(text):
+    return ' '.join(MORSE_CODE_DICT.get(char.upper(), '?') for char in text)
+
+
+def legacy_text_to_morse(message):
+    morse_message = ''
+    for char in message.upper():
+        if char in MORSE_CODE_DICT:
+            morse_message += MORSE_CODE_DICT[char] + ' '
+        else:
+            morse_message += '? '
+    return morse_message.strip()
+
+
+def best_time(func, arg, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='1K,1M,100M')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy-over', default='16M',
+                        help="don't time the quadratic text_to_morse above this size")
+    args = parser.parse_args()
+
+    encoder = MorseEncoder(MORSE_CODE_DICT)
+    quadratic_limit = parse_size(args.skip_legacy_over)
+    candidates = [
+        ('legacy encode_to_morse', legacy_encode_to_morse, None),
+        ('legacy text_to_morse', legacy_text_to_morse, quadratic_limit),
+        ('MorseEncoder.encode', encoder.encode, None),
+    ]
+
+    print(f"{'size':>8}  {'implementation':<24} {'seconds':>10} {'Mchars/s':>10}")
+    for label in args.sizes.split(','):
+        size = parse_size(label)
+        corpus = make_corpus(size)
+        for name, func, limit in candidates:
+            if limit is not None and size > limit:
+                print(f"{label:>8}  {name:<24} {'skipped':>10}")
+                continue
+            seconds = best_time(func, corpus, args.repeat)
+            print(f"{label:>8}  {name:<24} {seconds:>10.4f} {size / seconds / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# ----------------------
+# As-you-type conversion latency benchmark
+#
+#   python benchmarks/bench_incremental.py [--size 1M] [--line 72] [--keystrokes 500]
+#
+# Types single characters (and the odd backspace) at random places in a
+# large buffer and times each LineMirror update against re-encoding the
+# whole buffer, which is what the Encode button does.
+# ----------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import encode_to_morse
+from morse.incremental import LineMirror
+from benchmarks.bench_encode import make_corpus, parse_size
+
+
+def make_buffer(size, line):
+    text = make_corpus(size)
+    return '\n'.join(text[i:i + line] for i in range(0, len(text), line))
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', default='1M')
+    parser.add_argument('--line', type=int, default=72)
+    parser.add_argument('--keystrokes', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    text = make_buffer(parse_size(args.size), args.line)
+    mirror = LineMirror(encode_to_morse, text)
+
+    timings = []
+    for _ in range(args.keystrokes):
+        position = rng.randrange(len(text))
+        if rng.random() < 0.2:
+            text = text[:position] + text[position + 1:]
+        else:
+            text = text[:position] + rng.choice('etaoin ') + text[position:]
+        start = time.perf_counter()
+        mirror.update(text)
+        timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    full = encode_to_morse(text)
+    full_seconds = time.perf_counter() - start
+    assert mirror.output == [encode_to_morse(line) for line in text.split('\n')]
+
+    print(f"buffer: {len(text) / 1e6:.2f} MB, {text.count(chr(10)) + 1} lines, "
+          f"{args.keystrokes} keystrokes")
+    print(f"incremental  median {percentile(timings, 0.5) * 1000:8.3f} ms   "
+          f"p99 {percentile(timings, 0.99) * 1000:8.3f} ms")
+    print(f"full encode         {full_seconds * 1000:8.3f} ms   ({len(full) / 1e6:.1f} MB out)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# ----------------------
+# Instrumentation overhead benchmark
+#
+#   python benchmarks/bench_instrument.py [--calls 200000] [--length 40]
+#
+# Times encode_to_morse / decode_from_morse on GUI-sized messages with
+# morse.instrument off, on, and off again.  Off must leave the original
+# functions in place, so the first and last rows should match.
+# ----------------------
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import codec, decode_from_morse, encode_to_morse, instrument
+from benchmarks.bench_encode import make_corpus
+
+
+def per_call(func, arg, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func(arg)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=200000)
+    parser.add_argument('--length', type=int, default=40)
+    args = parser.parse_args()
+    text = make_corpus(args.length)
+    code = encode_to_morse(text)
+    originals = codec.MorseEncoder.encode, codec.MorseDecoder.decode
+
+    print(f"{'instrumentation':<16} {'encode us':>10} {'decode us':>10}")
+    for label in ('off', 'on', 'off again'):
+        if label == 'on':
+            instrument.enable()
+        else:
+            instrument.disable()
+        encode = per_call(encode_to_morse, text, args.calls)
+        decode = per_call(decode_from_morse, code, args.calls)
+        print(f"{label:<16} {encode * 1e6:>10.3f} {decode * 1e6:>10.3f}")
+    assert (codec.MorseEncoder.encode, codec.MorseDecoder.decode) == originals
+    print()
+    print(instrument.report())
+
+
+if __name__ == "__main__":
+    main()
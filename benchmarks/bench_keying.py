@@ -0,0 +1,120 @@
+# ----------------------
+# Key event decoder benchmark
+#
+#   python benchmarks/bench_keying.py [--hours 2] [--wpm 20] [--drift 10]
+#                                     [--jitter 0.12] [--farnsworth 1.0] [--bounce 0.05]
+#
+# Simulates a hand-keyed capture: every element and gap is stretched by
+# random jitter, the speed wanders by up to --drift WPM over the run,
+# --farnsworth stretches letter and word gaps and --bounce is the chance
+# of contact bounce on each key-down.  The events are decoded with
+# KeyDecoder and checked word by word against the text that was sent.
+# ----------------------
+
+import argparse
+import difflib
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import MORSE_CODE_DICT
+from morse.keying import KeyDecoder, decode_events
+
+LETTERS = 'ETAOINSHRDLUCMFWYPGBVKXQJZ0123456789'
+
+
+def make_capture(hours, wpm, drift, jitter, farnsworth, bounce, seed=0):
+    # -> (sent words, [(state, timestamp)])
+    rng = random.Random(seed)
+    words, events = [], []
+    now = 0.0
+    end = hours * 3600
+
+    def stretch(units, speed, gap_scale=1.0):
+        return units * gap_scale * 1.2 / speed * math.exp(rng.gauss(0, jitter))
+
+    while now < end:
+        # Speed follows a slow sine over the run, so a long capture sees
+        # it both rise and fall
+        speed = wpm + drift * math.sin(2 * math.pi * now / max(end, 1) * 3)
+        word = ''.join(rng.choice(LETTERS) for _ in range(rng.randint(1, 8)))
+        words.append(word)
+        for i, letter in enumerate(word):
+            for j, symbol in enumerate(MORSE_CODE_DICT[letter]):
+                if bounce and rng.random() < bounce:
+                    events.append((True, now))
+                    events.append((False, now + rng.uniform(0.0005, 0.003)))
+                    now += 0.004
+                events.append((True, now))
+                now += stretch(1 if symbol == '.' else 3, speed)
+                events.append((False, now))
+                if j < len(MORSE_CODE_DICT[letter]) - 1:
+                    now += stretch(1, speed)
+            if i < len(word) - 1:
+                now += stretch(3, speed, farnsworth)
+        now += stretch(7, speed, farnsworth)
+    return words, events
+
+
+def compare(sent, decoded):
+    # -> (words decoded right, words decoded, index of the first wrong
+    #    word); words are aligned, so a missed or extra word space only
+    #    costs the words around it
+    got = decoded.split()
+    blocks = difflib.SequenceMatcher(None, sent, got, autojunk=False).get_matching_blocks()
+    matches = sum(block.size for block in blocks)
+    first = blocks[0].a if blocks[0].a or blocks[0].b else blocks[0].size
+    return matches, len(got), first if first < len(sent) else None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--hours', type=float, default=2.0)
+    parser.add_argument('--wpm', type=float, default=20)
+    parser.add_argument('--drift', type=float, default=10, help="WPM swing over the run")
+    parser.add_argument('--jitter', type=float, default=0.12,
+                        help="log-normal spread of each element and gap")
+    parser.add_argument('--farnsworth', type=float, default=1.0,
+                        help="letter and word gap stretch")
+    parser.add_argument('--bounce', type=float, default=0.05)
+    parser.add_argument('--start-wpm', type=float, default=20, help="decoder's first guess")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sent, events = make_capture(args.hours, args.wpm, args.drift, args.jitter,
+                                args.farnsworth, args.bounce)
+    print(f"capture: {args.hours:g} h, {len(sent):,} words, {len(events):,} events "
+          f"(built in {time.perf_counter() - start:.1f} s)")
+
+    start = time.perf_counter()
+    decoded = decode_events(events, wpm=args.start_wpm)
+    seconds = time.perf_counter() - start
+    print(f"decode_events  {seconds:8.3f} s   {len(events) / seconds / 1e6:6.2f} M events/s   "
+          f"{seconds / len(events) * 1e6:6.3f} us/event   "
+          f"{args.hours * 3600 / seconds:,.0f}x real time")
+
+    # Live use: a poll between every two events as well, as the Tk timer
+    # would do
+    keys = KeyDecoder(wpm=args.start_wpm)
+    start = time.perf_counter()
+    pieces = []
+    for (down, timestamp), (_, following) in zip(events, events[1:] + [(False, math.inf)]):
+        pieces.append(keys.feed(down, timestamp))
+        pieces.append(keys.poll(min(timestamp + 0.02, (timestamp + following) / 2)))
+    pieces.append(keys.flush())
+    seconds = time.perf_counter() - start
+    print(f"feed + poll    {seconds:8.3f} s   {seconds / len(events) * 1e6:6.3f} us/event")
+
+    matches, count, first = compare(sent, decoded)
+    print(f"accuracy: {matches:,}/{len(sent):,} words ({matches / len(sent):.2%}), "
+          f"{count:,} decoded, first mismatch at word {first}, "
+          f"final estimate {keys.wpm:.1f} WPM")
+    assert ''.join(pieces).split() == decoded.split(), "poll changed the text"
+
+
+if __name__ == '__main__':
+    main()
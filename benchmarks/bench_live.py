@@ -0,0 +1,54 @@
+# ----------------------
+# Live CW decoder benchmark: per-frame processing time
+#
+#   python benchmarks/bench_live.py [--minutes 5] [--frame-ms 20] [--noise 0.5]
+# ----------------------
+
+import argparse
+import difflib
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import encode_to_morse, tone
+from morse.live import LiveDecoder
+from benchmarks.bench_audio_decode import TEXT
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--minutes', type=float, default=5)
+    parser.add_argument('--wpm', type=float, default=20)
+    parser.add_argument('--noise', type=float, default=0.5)
+    parser.add_argument('--frame-ms', type=float, default=20)
+    parser.add_argument('--rate', type=int, default=8000)
+    args = parser.parse_args()
+
+    text = (TEXT * max(1, int(args.minutes * args.wpm / 13))).strip()
+    samples = tone.render(encode_to_morse(text), wpm=args.wpm, frequency=650, sample_rate=args.rate)
+    samples += np.random.default_rng(0).normal(0, args.noise, len(samples)).astype(np.float32)
+
+    decoder = LiveDecoder(args.rate)
+    frame = int(args.rate * args.frame_ms / 1000)
+    times = []
+    pieces = []
+    for start in range(0, len(samples), frame):
+        pieces.append(decoder.feed(samples[start:start + frame]))
+        times.append(decoder.last_frame_seconds)
+    pieces.append(decoder.flush())
+    decoded = ''.join(pieces).strip()
+
+    times = np.array(times) * 1000
+    print(f"frames: {len(times)} of {args.frame_ms:g} ms")
+    print(f"per frame: mean {times.mean():.3f} ms, p99 {np.percentile(times, 99):.3f} ms, "
+          f"max {times.max():.3f} ms")
+    print(f"load: {times.sum() / (len(times) * args.frame_ms) * 100:.2f}% of real time")
+    print(f"tracked speed: {decoder.wpm:.1f} WPM (sent at {args.wpm:g})")
+    print(f"accuracy: {difflib.SequenceMatcher(None, text, decoded, autojunk=False).ratio():.3f}")
+
+
+if __name__ == "__main__":
+    main()
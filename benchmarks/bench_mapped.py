@@ -0,0 +1,59 @@
+# ----------------------
+# Memory-mapped decoder benchmark
+#
+#   python benchmarks/bench_mapped.py [--sizes 64M,256M,1G]
+#
+# Writes a synthetic Morse file of each size and decodes it with
+# morse.mapped.decode_mapped in a fresh process, reporting GB/s and the
+# peak RSS of that process, which should not grow with the file.
+# ----------------------
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_encode import parse_size
+from benchmarks.bench_parallel import write_corpus
+
+
+def child(source, output):
+    # Runs in its own process so the corpus writer's memory isn't counted
+    from morse.mapped import decode_mapped
+    start = time.perf_counter()
+    written = decode_mapped(source, output)
+    seconds = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(json.dumps({'seconds': seconds, 'written': written, 'peak': peak}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='64M,256M,1G')
+    parser.add_argument('--child', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(*args.child)
+
+    print(f"{'size':>8} {'seconds':>10} {'GB/s':>8} {'peak RSS MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.morse')
+        output = os.path.join(tmp, 'out.txt')
+        for label in args.sizes.split(','):
+            write_corpus(source, parse_size(label))
+            size = os.path.getsize(source)
+            result = json.loads(subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', source, output],
+                check=True, capture_output=True, text=True).stdout)
+            print(f"{label:>8} {result['seconds']:>10.3f} {size / result['seconds'] / 1e9:>8.3f}"
+                  f" {result['peak'] / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# ----------------------
+# Packed vs string Morse benchmark
+#
+#   python benchmarks/bench_packed.py [--sizes 1M,16M] [--repeat 3]
+#
+# Reports the memory held by the Morse form of a text corpus as a str
+# and as PackedMorse, and the throughput of encoding and decoding
+# through each form.
+# ----------------------
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import decode_from_morse, encode_to_morse
+from morse.packed import decode_packed, encode_packed, pack_morse, unpack_morse
+from benchmarks.bench_encode import best_time, make_corpus, parse_size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='1M,16M')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for label in args.sizes.split(','):
+        size = parse_size(label)
+        corpus = make_corpus(size)
+        code = encode_to_morse(corpus)
+        packed = encode_packed(corpus)
+        assert decode_packed(packed) == decode_from_morse(code)
+
+        print(f"{label} of text: Morse string {sys.getsizeof(code) / 1e6:.2f} MB, "
+              f"packed {packed.nbytes / 1e6:.2f} MB "
+              f"({sys.getsizeof(code) / packed.nbytes:.1f}x smaller)")
+        print(f"  {'operation':<28} {'seconds':>10} {'Mchars/s':>10}")
+        for name, func, arg in [
+            ('encode_to_morse', encode_to_morse, corpus),
+            ('encode_packed', encode_packed, corpus),
+            ('decode_from_morse', decode_from_morse, code),
+            ('decode_packed', decode_packed, packed),
+            ('pack_morse (str -> packed)', pack_morse, code),
+            ('unpack_morse (packed -> str)', unpack_morse, packed),
+        ]:
+            seconds = best_time(func, arg, args.repeat)
+            print(f"  {name:<28} {seconds:>10.4f} {size / seconds / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# ----------------------
+# Parallel decoding scaling benchmark
+#
+#   python benchmarks/bench_parallel.py [--size 64M] [--workers 1,2,4,8]
+#
+# Writes a synthetic Morse corpus to a temporary file, then decodes it
+# with morse.decode_file at each worker count.
+# ----------------------
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import decode_file
+from morse.parallel import CHUNK_SIZE
+from benchmarks.bench_decode import make_morse_corpus
+from benchmarks.bench_encode import parse_size
+
+
+def write_corpus(path, size):
+    block = make_morse_corpus(1 << 20) + '\n'
+    with open(path, 'w', encoding='ascii') as f:
+        for _ in range(max(1, size // len(block))):
+            f.write(block)
+
+
+def main():
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', default='64M')
+    parser.add_argument('--workers', default=','.join(map(str, default_workers)))
+    parser.add_argument('--chunk-size', default=str(CHUNK_SIZE))
+    args = parser.parse_args()
+
+    chunk_size = parse_size(args.chunk_size)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'corpus.morse')
+        write_corpus(source, parse_size(args.size))
+        size = os.path.getsize(source)
+        print(f"corpus: {size / 1e6:.1f} MB, {cores} cores")
+        print(f"{'workers':>8} {'seconds':>10} {'MB/s':>10} {'speedup':>8}")
+        baseline = None
+        for workers in map(int, args.workers.split(',')):
+            start = time.perf_counter()
+            decode_file(source, os.path.join(tmp, 'out.txt'), workers, chunk_size)
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            print(f"{workers:>8} {seconds:>10.3f} {size / seconds / 1e6:>10.2f} {baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# ----------------------
+# Pulse view per-frame cost benchmark
+#
+#   python benchmarks/bench_pulse.py [--symbols 100000] [--frames 2000]
+#
+# Compares the data work done per animation frame by the old pulse view
+# (extend a list, rebuild the x range) with the precomputed waveform and
+# fixed-width slice the embedded visualizer uses.  Drawing is left out:
+# with blitting it is a constant-size redraw of one line either way.
+# ----------------------
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_decode import make_morse_corpus
+
+WINDOW = 120
+
+
+def legacy_pulses(morse_code):
+    for symbol in morse_code:
+        if symbol == '.':
+            yield [1] + [0]
+        elif symbol == '-':
+            yield [1] * 3 + [0]
+        elif symbol == ' ':
+            yield [0] * 3
+        elif symbol == '/':
+            yield [0] * 7
+
+
+def legacy_frames(morse_code, frames):
+    # What PulseVisualizer.animate used to do, one symbol per frame
+    y_data = []
+    pulses = legacy_pulses(morse_code)
+    timings = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        y_data.extend(next(pulses))
+        x_data = list(range(len(y_data)))
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def window_frames(morse_code, frames):
+    translate = {ord('.'): '10', ord('-'): '1110', ord(' '): '0000', ord('/'): '00000000'}
+    start = time.perf_counter()
+    units = np.frombuffer(morse_code.translate(translate).encode('ascii'), dtype=np.uint8) - ord('0')
+    y_data = np.zeros(len(units) + WINDOW + 1, dtype=np.float32)
+    y_data[WINDOW:WINDOW + len(units)] = units
+    setup = time.perf_counter() - start
+    step = max(1, len(units) // frames)
+    timings = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        position = frame * step
+        view = y_data[position:position + WINDOW + 1]
+        timings.append(time.perf_counter() - start)
+    return setup, timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--symbols', type=int, default=100000)
+    parser.add_argument('--frames', type=int, default=2000)
+    args = parser.parse_args()
+
+    code = make_morse_corpus(args.symbols)
+    frames = min(args.frames, len(code))
+    legacy = legacy_frames(code, frames)
+    setup, window = window_frames(code, frames)
+
+    print(f"message: {len(code)} symbols, {frames} frames")
+    print(f"{'':>10} {'first ms':>10} {'last ms':>10} {'total ms':>10}")
+    print(f"{'legacy':>10} {legacy[0] * 1000:10.4f} {legacy[-1] * 1000:10.4f} {sum(legacy) * 1000:10.1f}")
+    print(f"{'window':>10} {window[0] * 1000:10.4f} {window[-1] * 1000:10.4f} {sum(window) * 1000:10.1f}"
+          f"   (+{setup * 1000:.1f} ms setup)")
+
+
+if __name__ == '__main__':
+    main()
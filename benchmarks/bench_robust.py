@@ -0,0 +1,117 @@
+# ----------------------
+# Error-tolerant decoder accuracy and speed benchmark
+#
+#   python benchmarks/bench_robust.py [--chars 5000] [--order 3] [--seed 0]
+#
+# English prose (the help topics shipped with Python, pydoc_data) is
+# encoded, corrupted in a few ways, and decoded by decode_from_morse and
+# by RobustDecoder with and without a character n-gram model trained on
+# a separate part of the same prose.  Word gaps are left intact, so the
+# score is the share of words decoded exactly.
+# ----------------------
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydoc_data.topics import topics
+
+from morse import MORSE_CODE_DICT, REVERSE_MORSE_CODE_DICT, decode_from_morse, encode_to_morse
+from morse.robust import CharNGramModel, RobustDecoder
+
+
+def load_prose():
+    text = ' '.join(topics.values()).upper()
+    text = ''.join(char if char in MORSE_CODE_DICT else ' ' for char in text)
+    return ' '.join(text.split())
+
+
+def drop_gaps(code, rng, rate):
+    letters = code.split(' ')
+    out = [letters[0]]
+    for letter in letters[1:]:
+        if letter != '/' and out[-1] != '/' and rng.random() < rate:
+            out[-1] += letter
+        else:
+            out.append(letter)
+    return ' '.join(out)
+
+
+def element_errors(code, rng, rate):
+    out = []
+    for char in code:
+        if char in '.-' and rng.random() < rate:
+            kind = rng.randrange(3)
+            if kind == 0:
+                out.append('-' if char == '.' else '.')
+            elif kind == 1:
+                out.append(char + rng.choice('.-'))
+            continue
+        out.append(char)
+    return ''.join(out)
+
+
+CORRUPTIONS = [
+    ('clean', lambda code, rng: code),
+    ('30% letter gaps lost', lambda code, rng: drop_gaps(code, rng, 0.3)),
+    ('no letter gaps', lambda code, rng: drop_gaps(code, rng, 1.0)),
+    ('1% element errors', lambda code, rng: element_errors(code, rng, 0.01)),
+    ('both (30% + 1%)', lambda code, rng: element_errors(drop_gaps(code, rng, 0.3), rng, 0.01)),
+]
+
+
+def word_accuracy(expected, got):
+    expected, got = expected.split(' '), got.split(' ')
+    if len(expected) != len(got):
+        return 0.0
+    return sum(a == b for a, b in zip(expected, got)) / len(expected)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--chars', type=int, default=5000)
+    parser.add_argument('--order', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    prose = load_prose()
+    test = prose[-args.chars:]
+    test = test[test.find(' ') + 1:]
+    start = time.perf_counter()
+    model = CharNGramModel.from_text(prose[:-args.chars], args.order)
+    print(f"model: order {args.order}, trained on {len(prose) - args.chars} chars "
+          f"in {time.perf_counter() - start:.2f} s; test text {len(test)} chars")
+
+    decoders = [
+        ('decode_from_morse', decode_from_morse),
+        ('robust', lambda code: plain.decode(code, 0)[0].text),
+        ('robust + n-gram', lambda code: weighted.decode(code, 0)[0].text),
+    ]
+    plain = RobustDecoder(REVERSE_MORSE_CODE_DICT)
+    weighted = RobustDecoder(REVERSE_MORSE_CODE_DICT, model)
+
+    code = encode_to_morse(test)
+    print(f"\n{'input':<22}" + ''.join(f"{name:>20}" for name, _ in decoders) + "   (word accuracy)")
+    for label, corrupt in CORRUPTIONS:
+        noisy = corrupt(code, random.Random(args.seed))
+        scores = [word_accuracy(test, decode(noisy)) for _, decode in decoders]
+        print(f"{label:<22}" + ''.join(f"{score:>20.1%}" for score in scores))
+
+    # Speed, and that it stays linear in the input
+    print(f"\n{'elements':>10} {'seconds':>10} {'elements/s':>12}")
+    noisy = CORRUPTIONS[-1][1](code, random.Random(args.seed))
+    for repeat in (1, 4):
+        sample = ' / '.join([noisy] * repeat)
+        elements = sum(map(sample.count, '.-'))
+        start = time.perf_counter()
+        weighted.decode(sample)
+        seconds = time.perf_counter() - start
+        print(f"{elements:>10} {seconds:>10.3f} {elements / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
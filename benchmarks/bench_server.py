@@ -0,0 +1,137 @@
+# ----------------------
+# Load test for the local Morse service
+#
+#   python benchmarks/bench_server.py [--connections 32] [--duration 5]
+#                                     [--path /encode] [--size 64] [--ws]
+#                                     [--port PORT]
+#
+# Starts python -m morse.server on a free localhost port (or uses one
+# already listening on --port), then keeps --connections keep-alive
+# clients busy for --duration seconds and reports requests/s and
+# latency percentiles.  --ws sends the same bodies as WebSocket
+# messages to /ws/encode or /ws/decode instead.
+# ----------------------
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import encode_to_morse
+from morse.server import frame, read_frame
+from benchmarks.bench_encode import make_corpus
+from benchmarks.bench_incremental import percentile
+
+HOST = '127.0.0.1'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_server(port, timeout=20.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def http_client(port, path, body, stop, latencies, statuses):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    request = (f"POST {path} HTTP/1.1\r\nHost: {HOST}\r\n"
+               f"Content-Length: {len(body)}\r\n\r\n").encode('ascii') + body
+    while time.perf_counter() < stop:
+        start = time.perf_counter()
+        writer.write(request)
+        head = await reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        length = next(int(line.split(':')[1]) for line in lines
+                      if line.lower().startswith('content-length'))
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+        status = int(lines[0].split()[1])
+        statuses[status] = statuses.get(status, 0) + 1
+    writer.close()
+
+
+async def ws_client(port, path, body, stop, latencies, statuses):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(f"GET /ws{path} HTTP/1.1\r\nHost: {HOST}\r\nUpgrade: websocket\r\n"
+                 "Connection: Upgrade\r\nSec-WebSocket-Key: bW9yc2UtbG9hZC10ZXN0IQ==\r\n"
+                 "Sec-WebSocket-Version: 13\r\n\r\n".encode('ascii'))
+    await reader.readuntil(b'\r\n\r\n')
+    message = frame(0x1, body, os.urandom(4))
+    while time.perf_counter() < stop:
+        start = time.perf_counter()
+        writer.write(message)
+        await read_frame(reader)
+        latencies.append(time.perf_counter() - start)
+        statuses[101] = statuses.get(101, 0) + 1
+    writer.write(frame(0x8, b'\x03\xe8', os.urandom(4)))
+    writer.close()
+
+
+async def run(args, port):
+    await wait_for_server(port)
+    text = make_corpus(args.size)
+    body = (text if args.path == '/encode' else encode_to_morse(text)).encode('utf-8')
+    client = ws_client if args.ws else http_client
+    latencies = []
+    statuses = {}
+    start = time.perf_counter()
+    stop = start + args.duration
+    await asyncio.gather(*(client(port, args.path, body, stop, latencies, statuses)
+                           for _ in range(args.connections)))
+    elapsed = time.perf_counter() - start
+
+    kind = 'WebSocket' if args.ws else 'HTTP'
+    print(f"{kind} {args.path}, {len(body)} byte bodies, {args.connections} connections, "
+          f"{elapsed:.1f} s")
+    print(f"requests/s {len(latencies) / elapsed:10.0f}")
+    for label, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99)):
+        print(f"{label} ms     {percentile(latencies, fraction) * 1000:10.2f}")
+    print("statuses   " + ', '.join(f"{status}: {count}" for status, count in sorted(statuses.items())))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--connections', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--path', default='/encode', choices=['/encode', '/decode', '/render'])
+    parser.add_argument('--size', type=int, default=64, help="characters of text per request")
+    parser.add_argument('--ws', action='store_true')
+    parser.add_argument('--port', type=int, help="use a server already listening here")
+    args = parser.parse_args()
+    if args.ws and args.path == '/render':
+        parser.error("--ws streams /encode or /decode")
+
+    server = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        server = subprocess.Popen([sys.executable, '-m', 'morse.server', '--port', str(port)],
+                                  cwd=root, stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(run(args, port))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
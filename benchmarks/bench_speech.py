@@ -0,0 +1,113 @@
+# ----------------------
+# Speech pipeline benchmark
+#
+#   python benchmarks/bench_speech.py [--phrases 8] [--latency 0.3] [--per-char 0.02]
+#                                     [--interval 0.0]
+#
+# Runs against FakeBackend (no network, no audio device), with a fresh
+# cache so every phrase is synthesized:
+#   - blocking: cache.get() then play, one phrase after another, on the
+#     calling thread, which is what the GUIs used to do on the Tk thread
+#   - pipeline: the same phrases through SpeechPipeline.say(), one every
+#     --interval seconds; reports how long say() holds the caller,
+#     time to first audio, queue wait and the silence between phrases
+#   - cancel: stop() with a queue full of phrases, until the pipeline is idle
+# ----------------------
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse.speech import CachedVoice, FakeBackend, SpeechCache, SpeechPipeline
+from benchmarks.bench_incremental import percentile
+
+PHRASES = ['salaam', 'how are you', 'the signal is weak', 'please repeat your call sign',
+           'thank you', 'good morning', 'my name is ali', 'see you later on this frequency']
+
+
+def make_backend(args):
+    return FakeBackend(args.latency, args.synth_per_char, args.per_char)
+
+
+def wait_idle(pipeline, timeout=600):
+    end = time.perf_counter() + timeout
+    while pipeline.busy and time.perf_counter() < end:
+        time.sleep(0.002)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--phrases', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.3, help="fake synthesis round trip")
+    parser.add_argument('--synth-per-char', type=float, default=0.002)
+    parser.add_argument('--per-char', type=float, default=0.02, help="fake audio seconds per char")
+    parser.add_argument('--interval', type=float, default=0.0,
+                        help="seconds between requests (0: all at once)")
+    args = parser.parse_args()
+    texts = [PHRASES[i % len(PHRASES)] + f" {i}" for i in range(args.phrases)]
+    audio = sum(len(text) for text in texts) * args.per_char
+    print(f"{len(texts)} phrases, {audio:.2f} s of fake audio, "
+          f"{args.latency * 1000:.0f} ms synthesis round trip")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SpeechCache(os.path.join(directory, 'blocking'), backend=make_backend(args))
+        blocked = []
+        start = time.perf_counter()
+        for text in texts:
+            began = time.perf_counter()
+            cache.backend.play(cache.get(text, 'ur'), _never())
+            blocked.append(time.perf_counter() - began)
+        total = time.perf_counter() - start
+        print(f"blocking   total {total:6.2f} s   caller blocked {sum(blocked):6.2f} s   "
+              f"longest freeze {max(blocked) * 1000:7.1f} ms")
+
+        cache = SpeechCache(os.path.join(directory, 'pipeline'), backend=make_backend(args))
+        pipeline = SpeechPipeline({None: CachedVoice(cache)})
+        calls = []
+        start = time.perf_counter()
+        for text in texts:
+            began = time.perf_counter()
+            pipeline.say(text, 'ur')
+            calls.append(time.perf_counter() - began)
+            if args.interval:
+                time.sleep(args.interval)
+        wait_idle(pipeline)
+        total = time.perf_counter() - start
+        stats = pipeline.stats()
+        print(f"pipeline   total {total:6.2f} s   caller blocked {sum(calls):6.4f} s   "
+              f"longest say() {max(calls) * 1000:7.3f} ms   p50 say() "
+              f"{percentile(calls, 0.5) * 1e6:.0f} us")
+        for name in ('first_audio', 'queue_wait', 'synthesis', 'gap'):
+            if name in stats:
+                entry = stats[name]
+                print(f"  {name:<12} mean {entry['mean'] * 1000:8.1f} ms   "
+                      f"p95 {entry['p95'] * 1000:8.1f} ms   max {entry['max'] * 1000:8.1f} ms")
+        print(f"  spoken {stats['spoken']}, cancelled {stats['cancelled']}, "
+              f"failed {stats['failed']}")
+
+        # Cancel: a fresh cache, so the stop lands mid-synthesis or mid-play
+        cache = SpeechCache(os.path.join(directory, 'cancel'), backend=make_backend(args))
+        pipeline = SpeechPipeline({None: CachedVoice(cache)})
+        for text in texts:
+            pipeline.say(text, 'ur')
+        while pipeline.current is None:
+            time.sleep(0.002)
+        start = time.perf_counter()
+        pipeline.stop()
+        wait_idle(pipeline)
+        stats = pipeline.stats()
+        print(f"cancel     idle {(time.perf_counter() - start) * 1000:7.1f} ms after stop()   "
+              f"spoken {stats['spoken']}, cancelled {stats['cancelled']}")
+
+
+def _never():
+    import threading
+    return threading.Event()
+
+
+if __name__ == '__main__':
+    main()
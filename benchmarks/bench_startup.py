@@ -0,0 +1,137 @@
+# ----------------------
+# GUI start-up benchmark
+#
+#   python benchmarks/bench_startup.py [--repeat 5] [--top 8] [--eager]
+#
+# For each GUI script, in a fresh interpreter each time:
+#   - import time from `python -X importtime -c "import <script>"`, and
+#     which heavy optional packages (numpy, matplotlib, TTS) it pulled in
+#   - time to first window: interpreter start until the MorseCodeApp
+#     window has been drawn once (needs a display)
+#
+# --eager imports the heavy packages up front as well, which is what the
+# scripts used to do, for a before/after comparison.
+# ----------------------
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from morse.warmup import PLOT_MODULES, SPEECH_MODULES
+
+SCRIPTS = ['moreEncode1', 'MorseEncode2', 'MorseEncode3', 'MorseGoogleTrans', 'morse_gui_visual']
+HEAVY = ('numpy', 'matplotlib', 'pyttsx3', 'gtts', 'playsound')
+
+WINDOW_SNIPPET = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+import {module}
+root = tk.Tk()
+app = {module}.MorseCodeApp(root)
+root.update()
+print(time.perf_counter() - start)
+root.destroy()
+"""
+
+
+def eager_prelude():
+    lines = []
+    for name in PLOT_MODULES + SPEECH_MODULES:
+        lines.append(f"try:\n    import {name}\nexcept Exception:\n    pass\n")
+    return ''.join(lines)
+
+
+def run_python(args):
+    return subprocess.run([sys.executable] + args, cwd=ROOT, capture_output=True, text=True)
+
+
+def _import_lines(code):
+    # -> [(self seconds, cumulative seconds, name, top level)], and the
+    #    heavy packages that ended up loaded (importtime also lists
+    #    imports that failed)
+    code += (f"\nimport sys\nprint(' '.join(sorted({{name.split('.')[0] for name in sys.modules}}"
+             f" & {set(HEAVY)!r})))")
+    result = run_python(['-X', 'importtime', '-c', code])
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    lines = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        own, cumulative, field = line[len('import time:'):].split('|')
+        lines.append((int(own) / 1e6, int(cumulative) / 1e6, field.strip(),
+                      not field.startswith('  ')))
+    return lines, result.stdout.split()
+
+
+def import_profile(module, prelude='', startup=()):
+    # -> (total seconds, [(self seconds, name)] slowest first, heavy
+    #    packages imported); modules the interpreter loads anyway are
+    #    left out
+    total = 0
+    entries = []
+    lines, heavy = _import_lines(f"{prelude}import {module}")
+    for own, cumulative, name, top_level in lines:
+        if name in startup:
+            continue
+        entries.append((own, name))
+        if top_level:
+            total += cumulative
+    entries.sort(reverse=True)
+    return total, entries, heavy
+
+
+def first_window(module, prelude, repeat):
+    # -> (best wall seconds from process start, best in-process seconds)
+    best_wall = best_inside = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run_python(['-c', prelude + WINDOW_SNIPPET.format(module=module)])
+        wall = time.perf_counter() - start
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1]
+        best_wall = min(best_wall, wall)
+        best_inside = min(best_inside, float(result.stdout.split()[-1]))
+    return best_wall, best_inside
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8, help="slowest modules to list per script")
+    parser.add_argument('--eager', action='store_true',
+                        help="also import the heavy packages up front, as the scripts used to")
+    args = parser.parse_args()
+
+    variants = [('lazy', '')]
+    if args.eager:
+        variants.append(('eager', eager_prelude()))
+    startup = {name for _, _, name, _ in _import_lines('pass')[0]}
+
+    for module in SCRIPTS:
+        for label, prelude in variants:
+            totals = []
+            for _ in range(args.repeat):
+                total, entries, heavy = import_profile(module, prelude, startup)
+                totals.append(total)
+            print(f"{module} ({label}): import {min(totals) * 1000:.1f} ms, "
+                  f"heavy packages: {', '.join(heavy) or 'none'}")
+            for seconds, name in entries[:args.top]:
+                print(f"    {seconds * 1000:8.2f} ms  {name}")
+            wall, inside = first_window(module, prelude, args.repeat)
+            if wall is None:
+                print(f"  first window: n/a ({inside})")
+            else:
+                print(f"  first window: {wall * 1000:.0f} ms from process start, "
+                      f"{inside * 1000:.0f} ms after interpreter start-up")
+        print()
+
+
+if __name__ == "__main__":
+    main()
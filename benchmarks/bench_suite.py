@@ -0,0 +1,145 @@
+# ----------------------
+# Benchmark and regression suite
+#
+#   python benchmarks/bench_suite.py [--size 1M] [--repeat 3]
+#                                    [--output results.json]
+#                                    [--baseline benchmarks/baseline.json]
+#                                    [--threshold 0.2] [--update-baseline]
+#
+# Times each encode/decode path over the standard corpora
+# (benchmarks.bench_encode make_corpus) and writes the results as JSON.
+# With a baseline file, any path whose throughput fell more than
+# --threshold below it fails the run.  Baselines are per machine: record
+# one with --update-baseline before comparing.  That the paths agree
+# with each other is checked by tests/test_consistency.py.
+# ----------------------
+
+import argparse
+import json
+import os
+import platform
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import decode_from_morse, decode_packed, encode_packed, encode_to_morse, pack_morse
+from morse import audio, tone
+from morseEncode import text_to_morse
+from benchmarks.bench_encode import best_time, make_corpus, parse_size
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+THRESHOLD = 0.2
+
+
+def gui_pulse_units():
+    # The pulse view lives in the Tk script and needs numpy
+    try:
+        import numpy
+        from morse_gui_visual import pulse_units
+    except ImportError:
+        return None
+    return pulse_units
+
+
+# ----------------------
+# Throughput
+# ----------------------
+
+def cases(size):
+    corpus = make_corpus(size)
+    code = encode_to_morse(corpus)
+    packed = pack_morse(code)
+    # Audio is far bulkier than text: render and decode a shorter message
+    audio_code = encode_to_morse(make_corpus(max(1, size // 256)))
+    samples = tone.render(audio_code)
+    found = [
+        ('encode_to_morse', encode_to_morse, corpus, len(corpus), 'chars/s'),
+        ('text_to_morse', text_to_morse, corpus, len(corpus), 'chars/s'),
+        ('encode_packed', encode_packed, corpus, len(corpus), 'chars/s'),
+        ('decode_from_morse', decode_from_morse, code, len(code), 'symbols/s'),
+        ('decode_packed', decode_packed, packed, len(code), 'symbols/s'),
+        ('tone.render', tone.render, audio_code, len(samples) / tone.SAMPLE_RATE,
+         'audio s/s'),
+        ('audio.decode_samples', lambda s: audio.decode_samples(s, tone.SAMPLE_RATE),
+         samples, len(samples) / tone.SAMPLE_RATE, 'audio s/s'),
+    ]
+    pulse_units = gui_pulse_units()
+    if pulse_units is not None:
+        found.append(('pulse_units', pulse_units, code, len(code), 'symbols/s'))
+    return found
+
+
+def run(size, repeat):
+    results = {}
+    for name, func, arg, amount, unit in cases(size):
+        seconds = best_time(func, arg, repeat)
+        results[name] = {'seconds': seconds, 'throughput': amount / seconds, 'unit': unit}
+    return results
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        ratio = result['throughput'] / before['throughput']
+        result['vs_baseline'] = ratio
+        if ratio < 1 - threshold:
+            regressions.append(f"{name}: {ratio:.0%} of baseline throughput")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', default='1M')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="write the results here as JSON")
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="allowed throughput drop against the baseline (0.2 = 20%%)")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    if gui_pulse_units() is None:
+        print("pulse view skipped: needs tkinter and numpy")
+
+    size = parse_size(args.size)
+    results = run(size, args.repeat)
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            stored = json.load(f)
+        if stored['size'] == size:
+            baseline = stored['results']
+        else:
+            print(f"baseline was recorded with --size {stored['size']}; not comparing")
+    regressions = compare(results, baseline, args.threshold)
+
+    print(f"\n{'path':<22} {'seconds':>10} {'throughput':>14} {'':<10} {'vs base':>8}")
+    for name, result in results.items():
+        ratio = result.get('vs_baseline')
+        print(f"{name:<22} {result['seconds']:>10.4f} {result['throughput']:>14,.0f} "
+              f"{result['unit']:<10} {f'{ratio:.0%}' if ratio else '-':>8}")
+
+    report = {'python': platform.python_version(), 'machine': platform.machine(),
+              'size': size, 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nbaseline written to {args.baseline}")
+    elif not os.path.exists(args.baseline):
+        print(f"\nno baseline at {args.baseline}; record one with --update-baseline")
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
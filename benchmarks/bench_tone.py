@@ -0,0 +1,39 @@
+# ----------------------
+# Tone synthesizer benchmark
+#
+#   python benchmarks/bench_tone.py [--minutes 60] [--wpm 20] [--rates 8000,44100]
+# ----------------------
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse import encode_to_morse
+from morse import tone
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--minutes', type=float, default=60)
+    parser.add_argument('--wpm', type=float, default=20)
+    parser.add_argument('--farnsworth', type=float, default=None)
+    parser.add_argument('--rates', default='8000,44100')
+    args = parser.parse_args()
+
+    # PARIS is exactly 50 units long, the standard word for WPM timing
+    morse = encode_to_morse('PARIS ' * int(args.minutes * (args.farnsworth or args.wpm)))
+
+    print(f"{'rate':>8} {'audio s':>10} {'render s':>10} {'x realtime':>12}")
+    for rate in map(int, args.rates.split(',')):
+        start = time.perf_counter()
+        samples = tone.render(morse, wpm=args.wpm, farnsworth_wpm=args.farnsworth, sample_rate=rate)
+        seconds = time.perf_counter() - start
+        audio = len(samples) / rate
+        print(f"{rate:>8} {audio:>10.1f} {seconds:>10.3f} {audio / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# ----------------------
+# English to Urdu phrase translation benchmark
+#
+#   python benchmarks/bench_translate.py [--entries 150000] [--sentences 2000]
+#
+# Writes a synthetic dictionary of one to four word phrases, then times
+# parsing it into the trie, loading the trie back from the cache file,
+# and translating sentences of 8 to 20 words through it.
+# ----------------------
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from morse.translate import PhraseTranslator, build_trie, load_trie, read_dictionary
+from benchmarks.bench_incremental import percentile
+
+URDU = 'ابپتٹثجچحخدڈذرڑزژسشصضطظعغفقکگلمنوہھیے'
+
+
+def make_words(count, rng):
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choices('ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=rng.randint(2, 9))))
+    return sorted(words)
+
+
+def write_dictionary(path, words, entries, rng):
+    common = words[:2000]       # phrases are built mostly from common words
+    with open(path, 'w', encoding='utf-8') as f:
+        for word in words:
+            f.write(f"{word}\t{''.join(rng.choices(URDU, k=rng.randint(2, 8)))}\n")
+        for _ in range(entries - len(words)):
+            phrase = ' '.join(rng.choices(common, k=rng.randint(2, 4)))
+            f.write(f"{phrase}\t{''.join(rng.choices(URDU, k=rng.randint(4, 16)))}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--entries', type=int, default=150000)
+    parser.add_argument('--sentences', type=int, default=2000)
+    args = parser.parse_args()
+    rng = random.Random(18)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dictionary.tsv')
+        words = make_words(args.entries // 3, rng)
+        write_dictionary(path, words, args.entries, rng)
+        print(f"dictionary: {args.entries} entries, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        trie = build_trie(read_dictionary(path))
+        print(f"  parse + build trie     {time.perf_counter() - start:8.3f} s")
+
+        cache_dir = os.path.join(tmp, 'cache')
+        start = time.perf_counter()
+        load_trie(path, cache_dir)
+        print(f"  first load (+ cache)   {time.perf_counter() - start:8.3f} s")
+        start = time.perf_counter()
+        cached = load_trie(path, cache_dir)
+        print(f"  load from cache        {time.perf_counter() - start:8.3f} s")
+        assert cached == trie
+
+        translator = PhraseTranslator(cached)
+        common = words[:2000]
+        sentences = [' '.join(rng.choices(common if rng.random() < 0.7 else words,
+                                          k=rng.randint(8, 20))) + '.'
+                     for _ in range(args.sentences)]
+        times = []
+        for sentence in sentences:
+            start = time.perf_counter()
+            translator.translate(sentence)
+            times.append(time.perf_counter() - start)
+        print(f"  translate per sentence median {percentile(times, 0.5) * 1e6:.0f} us, "
+              f"p99 {percentile(times, 0.99) * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
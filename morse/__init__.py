@@ -0,0 +1,42 @@
+# Lightweight Morse core: the code table and the encode/decode engines.
+# GUI, sound and speech layers live in the scripts and in morse.sound /
+# morse.speech, and import their heavy dependencies only when used.
+#
+# Only the core (codec, stream, table) is imported with the package; the
+# other engines load on first access to one of their names (__getattr__),
+# so `import morse` stays cheap for scripts that only encode and decode.
+
+import importlib
+
+from .codec import MorseDecoder, MorseEncoder, decode_from_morse, encode_to_morse
+from .stream import iter_decode, iter_encode
+from .table import MORSE_CODE_DICT, REVERSE_MORSE_CODE_DICT
+
+_LAZY = {
+    'ALPHABETS': 'alphabets', 'Alphabet': 'alphabets', 'get_alphabet': 'alphabets',
+    'PackedMorse': 'packed', 'decode_packed': 'packed', 'encode_packed': 'packed',
+    'pack_morse': 'packed', 'unpack_morse': 'packed',
+    'decode_file': 'parallel', 'decode_parallel': 'parallel',
+    'decode_robust': 'robust',
+}
+
+__all__ = [
+    'ALPHABETS', 'Alphabet', 'MORSE_CODE_DICT', 'MorseDecoder', 'MorseEncoder', 'PackedMorse',
+    'REVERSE_MORSE_CODE_DICT', 'decode_file', 'decode_from_morse', 'decode_packed',
+    'decode_parallel', 'decode_robust', 'encode_packed', 'encode_to_morse', 'get_alphabet', 'iter_decode',
+    'iter_encode',
+    'pack_morse', 'unpack_morse',
+]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
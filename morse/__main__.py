@@ -0,0 +1,64 @@
+import argparse
+import sys
+
+from .alphabets import ALPHABETS, get_alphabet
+from .mapped import decode_mapped, iter_decode_mapped
+from .parallel import iter_decode_file
+from .stream import CHUNK_SIZE, iter_decode, iter_encode, positive_int
+
+# ----------------------
+# Headless command line: python -m morse encode|decode [FILE]
+# ----------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m morse',
+                                     description="Encode or decode Morse code from a file or stdin.")
+    parser.add_argument('command', choices=['encode', 'decode'])
+    parser.add_argument('input', nargs='?', help="input file (default: stdin)")
+    parser.add_argument('-o', '--output', help="output file (default: stdout)")
+    parser.add_argument('--chunk-size', type=positive_int, default=CHUNK_SIZE)
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help="decode a FILE on this many processes (0: one per core)")
+    parser.add_argument('--mmap', action='store_true',
+                        help="decode a FILE through mmap, for files too large for memory")
+    parser.add_argument('-a', '--alphabet', default='international', choices=list(ALPHABETS))
+    args = parser.parse_intermixed_args(argv)
+    alphabet = get_alphabet(args.alphabet)
+    if alphabet.name != 'international' and (args.mmap or args.workers != 1):
+        parser.error("--mmap and --workers use the International table only")
+
+    if args.mmap:
+        if args.command != 'decode' or not args.input:
+            parser.error("--mmap decodes an input FILE")
+        if args.output:
+            decode_mapped(args.input, args.output)
+        else:
+            for piece in iter_decode_mapped(args.input):
+                sys.stdout.buffer.write(piece)
+            sys.stdout.buffer.flush()
+        return
+
+    source = None
+    if args.command == 'decode' and args.input and args.workers != 1:
+        pieces = iter_decode_file(args.input, args.workers or None, max(args.chunk_size, 1 << 20))
+    else:
+        source = open(args.input, encoding='utf-8') if args.input else sys.stdin
+        if args.command == 'encode':
+            pieces = iter_encode(source, args.chunk_size, alphabet.encoder)
+        else:
+            pieces = iter_decode(source, args.chunk_size, alphabet.decoder)
+    target = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for piece in pieces:
+            target.write(piece)
+        target.flush()
+    finally:
+        if source is not None and args.input:
+            source.close()
+        if args.output:
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import unicodedata
+
+from . import codec
+from .codec import MorseDecoder, MorseEncoder
+from .table import (AMERICAN_MORSE_DICT, ARABIC_MORSE_DICT, CYRILLIC_MORSE_DICT,
+                    GREEK_MORSE_DICT, MORSE_CODE_DICT, WABUN_MORSE_DICT)
+
+# ----------------------
+# Alphabet registry
+#
+# Each Alphabet wraps a code table and builds its MorseEncoder and
+# MorseDecoder the first time they are used; after that every call with
+# the same alphabet reuses them, so switching alphabets never rebuilds a
+# table.  Aliases are extra characters that encode like a table entry
+# (Urdu ک as Arabic ك, hiragana as katakana) but never come out of the
+# decoder.
+# ----------------------
+
+
+class _ComposingDecoder(MorseDecoder):
+    # Wabun sends voicing marks after the kana; join them back up
+    _MARKS = str.maketrans({'゛': '\u3099', '゜': '\u309a'})
+
+    def __init__(self, reverse_dict):
+        super().__init__(reverse_dict)
+        combining = ''.join(self._MARKS.values())
+        self.marks = frozenset(code for code, char in reverse_dict.items()
+                               if char.translate(self._MARKS) in combining)
+        self.joinable = frozenset(
+            code for code, char in reverse_dict.items()
+            if any(len(unicodedata.normalize('NFC', char + mark)) == 1 for mark in combining))
+
+    def decode_tokens(self, text):
+        decoded = super().decode_tokens(text)
+        return unicodedata.normalize('NFC', decoded.translate(self._MARKS))
+
+
+class Alphabet:
+    def __init__(self, name, label, table, aliases=None, fold_case=True,
+                 decoder_class=MorseDecoder, encoder=None, decoder=None):
+        self.name = name
+        self.label = label
+        self.table = table
+        self.aliases = aliases or {}
+        self.fold_case = fold_case
+        self.decoder_class = decoder_class
+        self._encoder = encoder
+        self._decoder = decoder
+
+    @property
+    def encoder(self):
+        if self._encoder is None:
+            self._encoder = MorseEncoder({**self.aliases, **self.table}, self.fold_case)
+        return self._encoder
+
+    @property
+    def decoder(self):
+        if self._decoder is None:
+            reverse = {}
+            for char, code in self.table.items():
+                reverse.setdefault(code, char)
+            self._decoder = self.decoder_class(reverse)
+        return self._decoder
+
+    def encode(self, text):
+        return self.encoder.encode(text)
+
+    def decode(self, code):
+        return self.decoder.decode(code)
+
+    def __repr__(self):
+        return f"Alphabet({self.name!r})"
+
+
+ALPHABETS = {}
+
+
+def register(alphabet):
+    ALPHABETS[alphabet.name] = alphabet
+    return alphabet
+
+
+def get_alphabet(name):
+    """Return a registered Alphabet by name (an Alphabet passes through)."""
+    if isinstance(name, Alphabet):
+        return name
+    try:
+        return ALPHABETS[name]
+    except KeyError:
+        raise ValueError(f"unknown Morse alphabet {name!r}; "
+                         f"choose from {', '.join(ALPHABETS)}") from None
+
+
+# ----------------------
+# Built-in alphabets
+# ----------------------
+
+def _digit_aliases(zero):
+    return {chr(ord(zero) + n): MORSE_CODE_DICT[str(n)] for n in range(10)}
+
+
+def _accent_aliases(table, first, last):
+    # Accented letters sent as the bare letter (Greek tonos, dialytika)
+    aliases = {}
+    for point in range(ord(first), ord(last) + 1):
+        char = chr(point)
+        base = unicodedata.normalize('NFD', char)[0].upper()
+        if char not in table and base != char.upper() and base in table:
+            aliases[char] = table[base]
+    return aliases
+
+
+def _kana_aliases(table):
+    aliases = {}
+    for point in range(ord('ァ'), ord('ヺ') + 1):
+        kana = chr(point)
+        if kana in table:
+            continue
+        # Voiced kana: the base kana, then its mark
+        base, *marks = unicodedata.normalize('NFD', kana)
+        marks = ''.join(marks).translate({0x3099: '゛', 0x309a: '゜'})
+        if base not in table:
+            # Small kana are sent as the full-size one
+            name = unicodedata.name(base, '')
+            if name.startswith('KATAKANA LETTER SMALL '):
+                base = unicodedata.lookup(name.replace('SMALL ', ''))
+        if base in table and all(mark in table for mark in marks):
+            aliases[kana] = ' '.join(table[char] for char in base + marks)
+    # Hiragana: the same sounds, sent as katakana
+    for kana, code in list(table.items()) + list(aliases.items()):
+        if 'ァ' <= kana <= 'ヶ':
+            aliases[chr(ord(kana) - 0x60)] = code
+    aliases['\u3099'] = table['゛']
+    aliases['\u309a'] = table['゜']
+    aliases['。'] = table['」']
+    return aliases
+
+
+INTERNATIONAL = register(Alphabet(
+    'international', "International", MORSE_CODE_DICT,
+    encoder=codec.encoder, decoder=codec.decoder))
+AMERICAN = register(Alphabet('american', "American (Railroad)", AMERICAN_MORSE_DICT))
+CYRILLIC = register(Alphabet('cyrillic', "Cyrillic (Russian)", CYRILLIC_MORSE_DICT,
+                             aliases={'Ё': CYRILLIC_MORSE_DICT['Е']}))
+GREEK = register(Alphabet('greek', "Greek", GREEK_MORSE_DICT,
+                          aliases={'ς': GREEK_MORSE_DICT['Σ'],
+                                   **_accent_aliases(GREEK_MORSE_DICT, 'Ά', 'ώ')}))
+ARABIC = register(Alphabet('arabic', "Arabic / Urdu", ARABIC_MORSE_DICT, aliases={
+    'ک': ARABIC_MORSE_DICT['ك'], 'ی': ARABIC_MORSE_DICT['ي'], 'ے': ARABIC_MORSE_DICT['ي'],
+    'ہ': ARABIC_MORSE_DICT['ه'], 'ھ': ARABIC_MORSE_DICT['ه'],
+    'أ': ARABIC_MORSE_DICT['ا'], 'إ': ARABIC_MORSE_DICT['ا'], 'آ': ARABIC_MORSE_DICT['ا'],
+    'ة': ARABIC_MORSE_DICT['ت'], 'ى': ARABIC_MORSE_DICT['ي'],
+    '،': MORSE_CODE_DICT[','], '؟': MORSE_CODE_DICT['?'], '۔': MORSE_CODE_DICT['.'],
+    **_digit_aliases('٠'), **_digit_aliases('۰'),
+}))
+WABUN = register(Alphabet('wabun', "Japanese (Wabun)", WABUN_MORSE_DICT,
+                          aliases=_kana_aliases(WABUN_MORSE_DICT), fold_case=False,
+                          decoder_class=_ComposingDecoder))
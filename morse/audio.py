@@ -0,0 +1,303 @@
+import wave
+
+import numpy as np
+
+from . import codec
+
+# ----------------------
+# CW audio decoder (WAV in, text out)
+#
+# samples -> tone frequency estimate -> squelch -> block Goertzel
+# envelope -> adaptive threshold -> key up/down runs -> dot unit
+# estimate -> dots, dashes and gaps -> decode_from_morse
+#
+# Marks are split into dots and dashes, and element gaps from the rest,
+# around two units.  Letter and word gaps are clustered on their own, by
+# two-means on log length, so stretched (Farnsworth) spacing is told
+# apart by the gaps themselves rather than by the dot length.  Only when
+# every gap is of one kind does a fixed five units decide which.
+# ----------------------
+
+BLOCK_SECONDS = 0.004     # Goertzel block; a 40 WPM dot is 30 ms
+WINDOW_SECONDS = 5.0      # threshold adapts per window of this length
+SMOOTHING_WIDTHS = (1, 2, 3, 4, 6, 8, 12, 16, 24, 32)
+HYSTERESIS = 0.15      # fraction of the tone/noise spread
+MIN_FREQUENCY = 200
+MAX_FREQUENCY = 3000
+# Tone over the median of the spectrum, averaged over many segments:
+# noise alone stays under 2, keyed CW in heavy noise is well above 5
+MIN_PROMINENCE = 4.0
+WORD_GAP = 5.0          # units; letter/word boundary when only one kind is heard
+MIN_GAP_RATIO = 1.6     # word over letter gap for two kinds (7/3 when sent evenly)
+
+
+def read_wav(source):
+    """Read a WAV file (path or file object) as mono float32 in [-1, 1]."""
+    with wave.open(source, 'rb') as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        ints = (raw[:, 0].astype(np.int32) | (raw[:, 1].astype(np.int32) << 8)
+                | (raw[:, 2].astype(np.int32) << 16))
+        samples = (ints - ((ints & 0x800000) << 1)).astype(np.float32) / 8388608
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype='<i4').astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"unsupported sample width: {width} bytes")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples, rate
+
+
+def _spectrum(samples, sample_rate, segment=4096, segments=64):
+    # Magnitude spectrum averaged over segments spread across the
+    # recording, between MIN_FREQUENCY and MAX_FREQUENCY
+    segment = min(segment, len(samples))
+    starts = np.linspace(0, len(samples) - segment, min(segments, max(1, len(samples) // segment)))
+    index = starts.astype(np.int64)[:, None] + np.arange(segment)
+    spectrum = np.abs(np.fft.rfft(samples[index] * np.hanning(segment), axis=1)).mean(axis=0)
+    freqs = np.fft.rfftfreq(segment, 1 / sample_rate)
+    band = (freqs >= MIN_FREQUENCY) & (freqs <= min(MAX_FREQUENCY, sample_rate / 2))
+    return freqs[band], spectrum[band]
+
+
+def estimate_frequency(samples, sample_rate, segment=4096, segments=64):
+    """Return the strongest tone between MIN_FREQUENCY and MAX_FREQUENCY."""
+    freqs, spectrum = _spectrum(samples, sample_rate, segment, segments)
+    return float(freqs[np.argmax(spectrum)])
+
+
+def find_tone(samples, sample_rate, frequency=None):
+    """Return (frequency, prominence): the tone (the strongest one unless
+    given) and how far it stands above the median of the spectrum."""
+    freqs, spectrum = _spectrum(samples, sample_rate)
+    if frequency is None:
+        peak = int(np.argmax(spectrum))
+        frequency = float(freqs[peak])
+    else:
+        # The tone may fall between bins
+        peak = int(np.searchsorted(freqs, frequency))
+    level = spectrum[max(0, peak - 1):peak + 2].max() if len(spectrum) else 0.0
+    median = np.median(spectrum) if len(spectrum) else 0.0
+    return frequency, float(level / median) if median > 0 else 0.0
+
+
+def tone_iq(samples, sample_rate, frequency, block_seconds=BLOCK_SECONDS):
+    """Complex Goertzel (I/Q) sum of `frequency` for consecutive blocks.
+
+    Each block is referenced to absolute time, so neighbouring blocks
+    can be summed coherently into a longer, narrower filter.  Returns
+    (iq, block_length_in_samples).
+    """
+    block = max(8, int(round(block_seconds * sample_rate)))
+    count = len(samples) // block
+    blocks = samples[:count * block].reshape(count, block)
+    omega = 2 * np.pi * frequency / sample_rate
+    iq = blocks @ np.exp(-1j * omega * np.arange(block))
+    iq *= np.exp(-1j * omega * block * np.arange(count))
+    return iq, block
+
+
+def tone_envelope(samples, sample_rate, frequency, width=1, block_seconds=BLOCK_SECONDS):
+    """Tone magnitude per block, integrated coherently over `width` blocks.
+
+    Returns (envelope, block_length_in_samples).
+    """
+    iq, block = tone_iq(samples, sample_rate, frequency, block_seconds)
+    return np.abs(smooth(iq, width)).astype(np.float32), block
+
+
+def smooth(envelope, width):
+    # Centered moving average over `width` blocks (real or complex)
+    width = int(width)
+    if width <= 1 or len(envelope) < width:
+        return envelope
+    sums = np.cumsum(np.concatenate(([0], envelope)))
+    averaged = (sums[width:] - sums[:-width]) / width
+    shift = (width - 1) // 2
+    out = np.empty_like(envelope)
+    out[shift:shift + len(averaged)] = averaged
+    out[:shift] = averaged[0]
+    out[shift + len(averaged):] = averaged[-1]
+    return out
+
+
+def adaptive_levels(envelope, blocks_per_window):
+    """Per-block (noise floor, tone level) pair, computed per window of
+    blocks and interpolated between windows so the threshold follows
+    fading and changes in background noise."""
+    window = max(1, int(blocks_per_window))
+    count = -(-len(envelope) // window)
+    padded = np.full(count * window, np.nan, dtype=np.float32)
+    padded[:len(envelope)] = envelope
+    windows = padded.reshape(count, window)
+    low = np.nanpercentile(windows, 10, axis=1)
+    high = np.nanpercentile(windows, 95, axis=1)
+    # A window with no keying in it has nothing to split; use the global
+    # levels there instead of thresholding its noise
+    global_low, global_high = np.percentile(envelope, [10, 95])
+    quiet = (high - low) < 0.25 * (global_high - global_low)
+    low[quiet], high[quiet] = global_low, global_high
+    centers = (np.arange(count) + 0.5) * window
+    blocks = np.arange(len(envelope))
+    return np.interp(blocks, centers, low), np.interp(blocks, centers, high)
+
+
+def key_states(envelope, blocks_per_window, hysteresis=HYSTERESIS):
+    """Key down/up per block with a Schmitt trigger around the midpoint.
+
+    Blocks between the two thresholds keep the state of the last block
+    that crossed one, which is a forward fill done with a running max.
+    """
+    low, high = adaptive_levels(envelope, blocks_per_window)
+    middle = (low + high) / 2
+    margin = hysteresis * (high - low)
+    down = envelope > middle + margin
+    decided = down | (envelope < middle - margin)
+    last = np.maximum.accumulate(np.where(decided, np.arange(len(envelope)), 0))
+    return down[last] & decided[last]
+
+
+def _runs(keyed):
+    edges = np.flatnonzero(np.diff(keyed.astype(np.int8))) + 1
+    starts = np.concatenate(([0], edges))
+    lengths = np.diff(np.concatenate((starts, [len(keyed)])))
+    return keyed[starts], lengths
+
+
+def _two_means(lengths):
+    # 1-D two-means on log length; returns the two cluster centers
+    logs = np.log(lengths.astype(np.float64))
+    short, long_ = logs.min(), logs.max()
+    if long_ - short > np.log(2):
+        for _ in range(10):
+            split = (short + long_) / 2
+            short, long_ = logs[logs < split].mean(), logs[logs >= split].mean()
+    return float(np.exp(short)), float(np.exp(long_))
+
+
+def estimate_timing(states, lengths):
+    """Estimate (unit, bias) in blocks from run-length statistics.
+
+    Key-down runs are split into dots and dashes by two-means on log
+    length.  Thresholding shortens every mark and lengthens every gap by
+    the same amount, so the dot and the gap between elements are averaged
+    for the unit and half their difference is the bias.  When every mark
+    is the same kind, the shortest gaps give the unit instead.
+    """
+    marks, gaps = lengths[states], lengths[~states]
+    if not len(marks):
+        return 1.0, 0.0
+    short, long_ = _two_means(marks)
+    if long_ < 2 * short:
+        if len(gaps) and short > 2 * _two_means(gaps)[0]:
+            return _two_means(gaps)[0], 0.0
+        return short, 0.0
+    intra = gaps[gaps < 2 * short]
+    if not len(intra):
+        return short, 0.0
+    gap = float(np.exp(np.log(intra.astype(np.float64)).mean()))
+    return (short + gap) / 2, (gap - short) / 2
+
+
+def word_gap(gaps):
+    """Letter/word gap boundary, for gap lengths in units: between the
+    two clusters of gaps longer than an element, when there are two."""
+    gaps = gaps[gaps >= 2]
+    if len(gaps):
+        letter, word = _two_means(gaps)
+        if word >= MIN_GAP_RATIO * letter:
+            return float(np.sqrt(letter * word))
+    return WORD_GAP
+
+
+def estimate_unit(states, lengths):
+    """Estimate the dot length in blocks (see estimate_timing)."""
+    return estimate_timing(states, lengths)[0]
+
+
+def _key(envelope, blocks_per_window):
+    states, lengths = _runs(key_states(envelope, blocks_per_window))
+    # Drop single-block glitches by merging them into their neighbours
+    if len(lengths) > 2:
+        glitch = lengths <= 1
+        glitch[[0, -1]] = False
+        if glitch.any():
+            states, lengths = _runs(np.repeat(np.where(glitch, ~states, states), lengths))
+    return states, lengths
+
+
+def _keyed_runs(samples, sample_rate, frequency):
+    # Noise breaks marks into short fragments, which drags the dot length
+    # estimate down.  Try increasingly long coherent integration and keep
+    # the longest one that is still short against the dot length it
+    # yields, then key the envelope once more integrated over half a dot.
+    if frequency is None:
+        frequency = estimate_frequency(samples, sample_rate)
+    iq, block = tone_iq(samples, sample_rate, frequency)
+    blocks_per_window = WINDOW_SECONDS * sample_rate / block
+    unit = None
+    for width in SMOOTHING_WIDTHS:
+        envelope = np.abs(smooth(iq, width))
+        estimate = estimate_unit(*_trim(*_key(envelope, blocks_per_window)))
+        if estimate >= 1.5 * width:
+            unit = estimate
+        elif unit is not None:
+            break
+    unit = unit or 1.0
+    envelope = np.abs(smooth(iq, unit / 2))
+    states, lengths = _trim(*_key(envelope, blocks_per_window))
+    unit, bias = estimate_timing(states, lengths)
+    return states, np.where(states, lengths + bias, lengths - bias), unit * block / sample_rate, block
+
+
+def _trim(states, lengths):
+    # Leading and trailing key-up runs carry no information
+    if len(states) and not states[0]:
+        states, lengths = states[1:], lengths[1:]
+    if len(states) and not states[-1]:
+        states, lengths = states[:-1], lengths[:-1]
+    return states, lengths
+
+
+def samples_to_morse(samples, sample_rate, frequency=None):
+    """Turn CW audio into a Morse string ('.', '-', ' ' and ' / ')."""
+    if len(samples) < sample_rate * BLOCK_SECONDS * 3:
+        return ''
+    frequency, prominence = find_tone(samples, sample_rate, frequency)
+    if prominence < MIN_PROMINENCE:
+        return ''           # squelch: no tone above the noise
+    states, lengths, unit, block = _keyed_runs(samples, sample_rate, frequency)
+    if not len(states):
+        return ''
+    units = lengths * (block / sample_rate / unit)
+    word = word_gap(units[~states])
+    symbols = np.full(len(states), '', dtype=object)
+    symbols[states & (units < 2)] = '.'
+    symbols[states & (units >= 2)] = '-'
+    symbols[~states & (units >= 2) & (units < word)] = ' '
+    symbols[~states & (units >= word)] = ' / '
+    return ''.join(symbols)
+
+
+def estimate_wpm(samples, sample_rate, frequency=None):
+    unit = _keyed_runs(samples, sample_rate, frequency)[2]
+    return 1.2 / unit
+
+
+def decode_samples(samples, sample_rate, frequency=None, decoder=None):
+    decoder = decoder or codec.decoder
+    return decoder.decode(samples_to_morse(samples, sample_rate, frequency))
+
+
+def decode_wav(source, frequency=None, decoder=None):
+    """Decode a CW recording (WAV path or file object) to text."""
+    samples, sample_rate = read_wav(source)
+    return decode_samples(samples, sample_rate, frequency, decoder)
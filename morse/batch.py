@@ -0,0 +1,263 @@
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .alphabets import ALPHABETS, get_alphabet
+from .stream import CHUNK_SIZE, check_chunk_size, iter_decode, iter_encode, positive_int
+
+# ----------------------
+# Batch encode / decode of directory trees
+#
+#   python -m morse.batch encode|decode SOURCE_DIR OUTPUT_DIR [-j N]
+#
+# Every matching file under SOURCE_DIR is converted line by line, as
+# encode_to_morse / decode_from_morse would convert each line, into the
+# same relative path under OUTPUT_DIR.  Outputs are written to a temporary
+# name and renamed into place, so a file is either complete or absent.
+#
+# Each finished file is appended to a manifest in OUTPUT_DIR.  A rerun
+# skips files the manifest lists with the same size, mtime, alphabet and
+# output suffix, so an interrupted run picks up where it stopped and a
+# run with other settings converts everything again.
+# ----------------------
+
+MANIFEST = '.morse-batch.jsonl'
+PATTERNS = {'encode': '*.txt', 'decode': '*.morse'}
+SUFFIXES = {'encode': '.morse', 'decode': '.txt'}
+PROGRESS_SECONDS = 0.5
+
+
+def convert_file(command, alphabet, source, target, chunk_size=CHUNK_SIZE):
+    """Convert one file; returns (bytes read, bytes written)."""
+    check_chunk_size(chunk_size)
+    alphabet = get_alphabet(alphabet)
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    partial = f"{target}.{os.getpid()}.tmp"
+    try:
+        with open(source, encoding='utf-8') as src, \
+                open(partial, 'w', encoding='utf-8') as out:
+            if command == 'encode':
+                pieces = iter_encode(src, chunk_size, alphabet.encoder)
+            else:
+                pieces = iter_decode(src, chunk_size, alphabet.decoder)
+            for piece in pieces:
+                out.write(piece)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(partial, target)
+    except BaseException:
+        if os.path.exists(partial):
+            os.unlink(partial)
+        raise
+    return os.path.getsize(source), os.path.getsize(target)
+
+
+# ----------------------
+# Manifest
+# ----------------------
+
+class Manifest:
+    """Append-only JSON Lines record of finished files."""
+
+    def __init__(self, path):
+        self.path = path
+        self.done = {}          # (command, relative path) -> entry
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue        # a line cut short by a crash
+                    self.done[entry['command'], entry['path']] = entry
+        self._file = None
+
+    def finished(self, command, relative, stat, target, alphabet, suffix):
+        entry = self.done.get((command, relative))
+        return (entry is not None and entry['size'] == stat.st_size
+                and entry['mtime_ns'] == stat.st_mtime_ns
+                and entry['alphabet'] == alphabet and entry['suffix'] == suffix
+                and os.path.exists(target))
+
+    def add(self, entry):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.done[entry['command'], entry['path']] = entry
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def find_files(source_dir, pattern):
+    """Yield paths relative to source_dir, in a stable order."""
+    for directory, subdirs, files in os.walk(source_dir):
+        subdirs.sort()
+        for name in sorted(files):
+            if fnmatch.fnmatch(name, pattern):
+                yield os.path.relpath(os.path.join(directory, name), source_dir)
+
+
+def output_name(relative, suffix):
+    return os.path.splitext(relative)[0] + suffix
+
+
+# ----------------------
+# Runner
+# ----------------------
+
+class Progress:
+    def __init__(self, total, stream=sys.stderr):
+        self.total = total
+        self.stream = stream
+        self.files = 0
+        self.bytes = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self._shown = 0.0
+
+    def add(self, size):
+        self.files += 1
+        self.bytes += size
+        now = time.perf_counter()
+        if now - self._shown >= PROGRESS_SECONDS:
+            self._shown = now
+            self.show('\r')
+
+    def rates(self):
+        seconds = max(time.perf_counter() - self.started, 1e-9)
+        return seconds, self.files / seconds, self.bytes / seconds
+
+    def close(self):
+        # End the progress line, if one was drawn
+        if self._shown:
+            self.show('\r', '\n')
+
+    def show(self, start='', end=''):
+        seconds, files, data = self.rates()
+        self.stream.write(f"{start}{self.files}/{self.total} files, {files:.1f} files/s, "
+                          f"{data / 1e6:.2f} MB/s{end}")
+        self.stream.flush()
+
+
+def run(command, source_dir, output_dir, workers=None, pattern=None, suffix=None,
+        alphabet='international', chunk_size=CHUNK_SIZE, stream=sys.stderr):
+    """Convert a directory tree; returns the Progress with the totals."""
+    check_chunk_size(chunk_size)
+    pattern = pattern or PATTERNS[command]
+    suffix = suffix or SUFFIXES[command]
+    workers = workers or os.cpu_count() or 1
+    alphabet = get_alphabet(alphabet).name
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = Manifest(os.path.join(output_dir, MANIFEST))
+
+    jobs = []
+    skipped = 0
+    for relative in find_files(source_dir, pattern):
+        source = os.path.join(source_dir, relative)
+        target = os.path.join(output_dir, output_name(relative, suffix))
+        stat = os.stat(source)
+        if manifest.finished(command, relative, stat, target, alphabet, suffix):
+            skipped += 1
+        else:
+            jobs.append((relative, source, target, stat))
+    if skipped:
+        stream.write(f"{skipped} files already done, skipping\n")
+
+    progress = Progress(len(jobs), stream)
+
+    def finish(job, result):
+        relative, source, target, stat = job
+        read, written = result
+        manifest.add({'command': command, 'path': relative, 'size': stat.st_size,
+                      'mtime_ns': stat.st_mtime_ns, 'alphabet': alphabet, 'suffix': suffix,
+                      'output': os.path.relpath(target, output_dir), 'bytes_out': written})
+        progress.add(read)
+
+    def fail(job, error):
+        progress.failed += 1
+        stream.write(f"\n{job[0]}: {error}\n")
+
+    try:
+        if workers == 1:
+            for job in jobs:
+                try:
+                    finish(job, convert_file(command, alphabet, job[1], job[2], chunk_size))
+                except (OSError, UnicodeDecodeError) as error:
+                    fail(job, error)
+        else:
+            _run_pool(command, alphabet, chunk_size, jobs, workers, finish, fail)
+    finally:
+        manifest.close()
+        progress.close()
+    return progress
+
+
+def _run_pool(command, alphabet, chunk_size, jobs, workers, finish, fail):
+    # At most a couple of files per worker in flight, so a huge tree
+    # never queues every job up front
+    pending = {}
+    queue = iter(jobs)
+    with ProcessPoolExecutor(workers) as executor:
+        try:
+            while True:
+                while len(pending) < 2 * workers:
+                    job = next(queue, None)
+                    if job is None:
+                        break
+                    future = executor.submit(convert_file, command, alphabet, job[1], job[2],
+                                             chunk_size)
+                    pending[future] = job
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = pending.pop(future)
+                    try:
+                        finish(job, future.result())
+                    except (OSError, UnicodeDecodeError) as error:
+                        fail(job, error)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m morse.batch',
+                                     description="Encode or decode every file in a directory tree.")
+    parser.add_argument('command', choices=['encode', 'decode'])
+    parser.add_argument('source', help="directory to read")
+    parser.add_argument('output', help="directory to write; holds the resume manifest")
+    parser.add_argument('-j', '--workers', type=int, default=0,
+                        help="worker processes (0: one per core)")
+    parser.add_argument('--pattern', help="file name pattern (default: *.txt to encode, "
+                                          "*.morse to decode)")
+    parser.add_argument('--suffix', help="output suffix (default: .morse / .txt)")
+    parser.add_argument('-a', '--alphabet', default='international', choices=list(ALPHABETS))
+    parser.add_argument('--chunk-size', type=positive_int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.source):
+        parser.error(f"{args.source} is not a directory")
+    try:
+        progress = run(args.command, args.source, args.output, args.workers or None,
+                       args.pattern, args.suffix, args.alphabet, args.chunk_size)
+    except KeyboardInterrupt:
+        sys.stderr.write("\ninterrupted; rerun the same command to resume\n")
+        sys.exit(130)
+    seconds, files, data = progress.rates()
+    sys.stderr.write(f"{progress.files} files, {progress.bytes / 1e6:.2f} MB in {seconds:.2f} s "
+                     f"({files:.1f} files/s, {data / 1e6:.2f} MB/s)"
+                     f"{f'; {progress.failed} failed' if progress.failed else ''}\n")
+    if progress.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import collections
+import re
+
+import numpy as np
+
+from . import tone
+from .table import MORSE_CODE_DICT
+
+# ----------------------
+# Clip-assembled CW audio
+#
+# tone.render synthesizes every sample of a message.  ClipRenderer
+# synthesizes each letter once, as a 16-bit PCM clip with the same
+# envelope, and builds a message by copying clips into one zeroed
+# buffer: silence costs nothing and a letter costs one memcpy.
+#
+# Timing follows tone.keying_runs exactly, Farnsworth gaps included, and
+# clips are placed at the rounded running time so nothing drifts over
+# long messages.  The carrier restarts at zero phase on each letter
+# (tone.render keeps one continuous phase); every letter starts from
+# silence through the rise ramp, so this is inaudible.
+# ----------------------
+
+MAX_CLIPS = 256         # letters kept per renderer, least recently used dropped
+MAX_RENDERERS = 8       # renderers kept by clip_renderer(), one per option set
+
+_TOKENS = re.compile(r'[.-]+|[^.-]+')
+
+
+class ClipRenderer:
+    """Per-letter PCM clips for one set of tone.render options."""
+
+    def __init__(self, wpm=tone.WPM, farnsworth_wpm=None, frequency=tone.FREQUENCY,
+                 sample_rate=tone.SAMPLE_RATE, amplitude=0.8, rise_time=tone.RISE_TIME,
+                 max_clips=MAX_CLIPS, code_dict=MORSE_CODE_DICT):
+        self.options = {'wpm': wpm, 'farnsworth_wpm': farnsworth_wpm, 'frequency': frequency,
+                        'sample_rate': sample_rate, 'amplitude': amplitude,
+                        'rise_time': rise_time}
+        self.sample_rate = sample_rate
+        self.unit = tone.unit_seconds(wpm)
+        self.gap_unit = tone.farnsworth_unit_seconds(wpm, farnsworth_wpm)
+        self.max_clips = max_clips
+        self.clips = collections.OrderedDict()     # code -> (pcm, key-down seconds)
+        self.hits = 0
+        self.misses = 0
+        # Every letter of the table up front, so typical messages never
+        # synthesize anything
+        for code in dict.fromkeys(code_dict.values()):
+            if code and not code.strip('.-'):
+                self.clip(code)
+
+    def clip(self, code):
+        """(int16 clip, key-down seconds) for one letter's dots and dashes."""
+        entry = self.clips.get(code)
+        if entry is not None:
+            self.hits += 1
+            self.clips.move_to_end(code)
+            return entry
+        self.misses += 1
+        seconds = (len(code) + 2 * code.count('-') + len(code) - 1) * self.unit
+        pcm = tone.render_pcm16(code, **self.options)
+        entry = (pcm[:round(seconds * self.sample_rate)].copy(), seconds)
+        self.clips[code] = entry
+        if len(self.clips) > self.max_clips:
+            self.clips.popitem(last=False)
+        return entry
+
+    def placements(self, morse_code):
+        """Yield (start sample, clip) per letter, then (total samples, None)."""
+        # Normalized as tone.keying_units does: ' ' is a letter gap, '/'
+        # a word gap, anything else between letters no time at all
+        code = ' '.join(morse_code.split()).replace(' / ', '/')
+        rate = self.sample_rate
+        unit = self.unit
+        gap_unit = self.gap_unit
+        clip = self.clip
+        seconds = 0.0
+        pending = 0             # key-up units since the last element
+        for token in _TOKENS.findall(code):
+            if token[0] == '.' or token[0] == '-':
+                if pending:
+                    seconds += pending * (gap_unit if pending > 1 else unit)
+                pcm, key_down = clip(token)
+                yield round(seconds * rate), pcm
+                seconds += key_down
+                pending = 1
+            else:
+                pending += 2 * token.count(' ') + 6 * token.count('/')
+        if pending:
+            seconds += pending * (gap_unit if pending > 1 else unit)
+        yield round(seconds * rate), None
+
+    def render_pcm16(self, morse_code):
+        """Like tone.render_pcm16(morse_code, **options), from the clips."""
+        placed = list(self.placements(morse_code))
+        total = placed.pop()[0]
+        samples = np.zeros(total, dtype=np.int16)
+        for start, pcm in placed:
+            end = start + len(pcm)
+            if end > total:
+                pcm = pcm[:total - start]
+                end = total
+            samples[start:end] = pcm
+        return samples
+
+    def write_wav(self, target, morse_code):
+        return tone.write_pcm16(target, self.render_pcm16(morse_code), self.sample_rate)
+
+    def stats(self):
+        return {'clips': len(self.clips), 'hits': self.hits, 'misses': self.misses}
+
+
+_renderers = collections.OrderedDict()
+
+
+def clip_renderer(**options):
+    """The shared ClipRenderer for these tone.render options."""
+    key = tuple(sorted(options.items()))
+    renderer = _renderers.get(key)
+    if renderer is None:
+        renderer = _renderers[key] = ClipRenderer(**options)
+        if len(_renderers) > MAX_RENDERERS:
+            _renderers.popitem(last=False)
+    else:
+        _renderers.move_to_end(key)
+    return renderer
+
+
+def render_pcm16(morse_code, **options):
+    return clip_renderer(**options).render_pcm16(morse_code)
+
+
+def write_wav(target, morse_code, **options):
+    return clip_renderer(**options).write_wav(target, morse_code)
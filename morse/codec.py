@@ -0,0 +1,166 @@
+import codecs
+import re
+
+from .table import MORSE_CODE_DICT, REVERSE_MORSE_CODE_DICT
+
+# ----------------------
+# Table-driven Morse encoder
+# ----------------------
+
+UNKNOWN = '?'
+_WHITESPACE = re.compile(r'\s')
+
+
+class MorseEncoder:
+    """Precompiled encoder built once from a MORSE_CODE_DICT-style table.
+
+    Text is encoded in a single C-level pass with codecs.charmap_encode,
+    using a codepoint -> b"<code> " table.  Characters not yet in the
+    table are compiled on first sight, so the output always matches
+    ' '.join(code_dict.get(char.upper(), '?') for char in text).
+    """
+
+    def __init__(self, code_dict, fold_case=True):
+        self.code_dict = code_dict
+        self.fold_case = fold_case
+        self.table = {}
+        for char in code_dict:
+            self._compile(char)
+            lower = char.lower()
+            if fold_case and len(lower) == 1 and lower.upper() == char:
+                self._compile(lower)
+
+    def _compile(self, char):
+        # An exact entry wins; some lower case letters (Greek ΐ) have no
+        # single upper case form
+        key = char.upper() if self.fold_case and char not in self.code_dict else char
+        self.table[ord(char)] = (self.code_dict.get(key, UNKNOWN) + ' ').encode('ascii')
+
+    def encode(self, text):
+        try:
+            encoded = codecs.charmap_encode(text, 'strict', self.table)[0]
+        except UnicodeEncodeError:
+            for char in set(text):
+                if ord(char) not in self.table:
+                    self._compile(char)
+            encoded = codecs.charmap_encode(text, 'strict', self.table)[0]
+        # Every character maps to "<code> ", so drop the trailing separator
+        return encoded[:-1].decode('ascii')
+
+    def encode_many(self, texts):
+        encode = self.encode
+        return [encode(text) for text in texts]
+
+
+# ----------------------
+# Table-driven Morse decoder
+# ----------------------
+
+class _DecodeTable(dict):
+    # code -> character; unknown codes decode to '?'
+    def __missing__(self, code):
+        return UNKNOWN
+
+
+class MorseDecoder:
+    """Precompiled decoder built once from a REVERSE_MORSE_CODE_DICT table.
+
+    Letters are whitespace separated and a lone '/' is the word gap, so
+    the input is decoded token by token without first splitting it into
+    words.  Large inputs are scanned in windows cut at whitespace, which
+    keeps the intermediate token list bounded no matter the input size.
+    """
+
+    window = 1 << 20
+    # Codes of letters that may combine with a following letter, and of
+    # the letters that combine with the one before (see LetterStream)
+    joinable = marks = frozenset()
+
+    def __init__(self, reverse_dict):
+        self.table = _DecodeTable(reverse_dict)
+        self.table['/'] = ' '
+        self.longest = max(map(len, self.table))
+
+    def decode_tokens(self, text):
+        return ''.join(map(self.table.__getitem__, text.split()))
+
+    def decode(self, code):
+        if len(code) <= self.window:
+            return self.decode_tokens(code)
+        parts = []
+        for start, end in _windows(code, self.window):
+            parts.append(self.decode_tokens(code[start:end]))
+        return ''.join(parts)
+
+    def decode_many(self, codes):
+        decode = self.decode
+        return [decode(code) for code in codes]
+
+
+class LetterStream:
+    """Text for letters completed one at a time, as decoder.decode would
+    give for them all at once.  For decoders that combine letters (Wabun
+    voicing marks), a letter that could take a mark is held back until
+    the next letter, or flush(), shows whether one follows."""
+
+    def __init__(self, decoder):
+        self.decoder = decoder
+        self.table = decoder.table
+        self.joinable = decoder.joinable
+        self.held = ''
+
+    def letter(self, code):
+        if not self.joinable:
+            return self.table[code]
+        held, self.held = self.held, ''
+        if held and code in self.decoder.marks:
+            return self.decoder.decode_tokens(f"{held} {code}")
+        text = self.decoder.decode_tokens(held) if held else ''
+        if code in self.joinable:
+            self.held = code
+            return text
+        return text + self.decoder.decode_tokens(code)
+
+    def flush(self):
+        held, self.held = self.held, ''
+        return self.decoder.decode_tokens(held) if held else ''
+
+
+def _windows(text, size):
+    # Yield (start, end) slices of roughly `size` characters that never
+    # cut through a Morse letter.
+    pos = 0
+    length = len(text)
+    while pos < length:
+        end = pos + size
+        if end >= length:
+            yield pos, length
+            return
+        cut = max(text.rfind(' ', pos, end), text.rfind('\n', pos, end))
+        if cut <= pos:
+            match = _WHITESPACE.search(text, end)
+            cut = match.start() if match else length
+        yield pos, cut
+        pos = cut
+
+
+# ----------------------
+# Default engines
+# ----------------------
+
+encoder = MorseEncoder(MORSE_CODE_DICT)
+decoder = MorseDecoder(REVERSE_MORSE_CODE_DICT)
+
+
+def encode_to_morse(text, alphabet=None):
+    if alphabet is None:
+        return encoder.encode(text)
+    from .alphabets import get_alphabet
+    return get_alphabet(alphabet).encode(text)
+
+
+def decode_from_morse(code, alphabet=None):
+    if alphabet is None:
+        return decoder.decode(code)
+    from .alphabets import get_alphabet
+    return get_alphabet(alphabet).decode(code)
@@ -0,0 +1,40 @@
+import queue
+
+# ----------------------
+# Callbacks from worker threads to the Tk thread
+#
+# Tk widgets must only be touched from the thread running mainloop().
+# Classes that run callbacks from a worker (PlaybackScheduler,
+# SpeechPipeline) mix this in: until attach() is called a callback runs
+# straight away on the worker; after it, callbacks are queued and run by
+# poll(), which attach() schedules with root.after.
+# ----------------------
+
+
+class UIDispatch:
+    _events = None
+
+    def attach(self, root, interval=30):
+        """Run callbacks on the Tk thread by polling from root.after."""
+        self._events = queue.SimpleQueue()
+
+        def poll():
+            self.poll()
+            root.after(interval, poll)
+        root.after(interval, poll)
+
+    def poll(self):
+        while self._events is not None:
+            try:
+                callback, args = self._events.get_nowait()
+            except queue.Empty:
+                return
+            callback(*args)
+
+    def _dispatch(self, callback, *args):
+        if callback is None:
+            return
+        if self._events is None:
+            callback(*args)
+        else:
+            self._events.put((callback, args))
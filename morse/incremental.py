@@ -0,0 +1,125 @@
+# ----------------------
+# Incremental, as-you-type conversion
+#
+# LineMirror keeps the converted output of a text one line per input
+# line, and on each update re-converts only the lines touched by the
+# edit.  The edited span is found with C-level slice comparisons, so an
+# update costs a couple of passes over memory plus the converted lines,
+# not a full re-encode.  TkLiveMirror wires one up between two tk.Text
+# widgets with a debounce.
+# ----------------------
+
+DEBOUNCE_MS = 150
+
+
+def _common_prefix(a, b):
+    # Binary search on slice equality: O(n) memcmp work in C, O(log n)
+    # Python steps
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix(a, b, limit):
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle:len(a) - low] == b[len(b) - middle:len(b) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class LineMirror:
+    def __init__(self, convert, text=''):
+        self.convert = convert
+        self.reset(text)
+
+    def reset(self, text):
+        self.source = text
+        self.output = [self.convert(line) for line in text.split('\n')]
+
+    @property
+    def text(self):
+        return '\n'.join(self.output)
+
+    def update(self, text):
+        """Bring the mirror up to date with text.
+
+        Returns (start, end, lines): output lines start..end-1 (of the
+        previous output) are to be replaced by lines, or None if nothing
+        changed.
+        """
+        old = self.source
+        if text == old:
+            return None
+        prefix = _common_prefix(old, text)
+        suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+
+        start = old.count('\n', 0, prefix)
+        old_end = start + old.count('\n', prefix, len(old) - suffix) + 1
+
+        # The changed region of the new text, widened to whole lines
+        first = text.rfind('\n', 0, prefix) + 1
+        last = text.find('\n', len(text) - suffix)
+        lines = text[first:last if last >= 0 else len(text)].split('\n')
+
+        converted = [self.convert(line) for line in lines]
+        self.output[start:old_end] = converted
+        self.source = text
+        return start, old_end, converted
+
+
+class TkLiveMirror:
+    """Keep target (a tk.Text) converted from source as the user types."""
+
+    def __init__(self, root, source, target, convert, delay=DEBOUNCE_MS):
+        self.root = root
+        self.source = source
+        self.target = target
+        self.mirror = LineMirror(convert)
+        self.delay = delay
+        self.enabled = False
+        self._job = None
+        source.bind("<<Modified>>", self._on_modified, add="+")
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+        if enabled:
+            self.refresh()
+
+    def refresh(self):
+        """Re-convert everything into target.  Call it whenever anything
+        but the mirror has written to target while enabled."""
+        self.mirror.reset(self.source.get("1.0", "end-1c"))
+        self.target.delete("1.0", "end")
+        self.target.insert("1.0", self.mirror.text)
+
+    def _on_modified(self, event=None):
+        self.source.edit_modified(False)
+        if not self.enabled:
+            return
+        # Debounce: a burst of keystrokes is applied once it settles
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+        self._job = self.root.after(self.delay, self.apply)
+
+    def apply(self):
+        self._job = None
+        total = len(self.mirror.output)
+        patch = self.mirror.update(self.source.get("1.0", "end-1c"))
+        if patch is None:
+            return
+        start, end, lines = patch
+        if end < total:
+            self.target.delete(f"{start + 1}.0", f"{end + 1}.0")
+            self.target.insert(f"{start + 1}.0", '\n'.join(lines) + '\n')
+        else:
+            self.target.delete(f"{start + 1}.0", "end-1c")
+            self.target.insert(f"{start + 1}.0", '\n'.join(lines))
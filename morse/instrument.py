@@ -0,0 +1,256 @@
+import functools
+import sys
+import threading
+import time
+
+# ----------------------
+# Opt-in instrumentation
+#
+# Nothing is measured until enable() is called.  enable() swaps timing
+# wrappers in for the hot functions (table lookups in the encoder and
+# decoder, winsound.Beep, tone rendering, pyttsx3 start-up and speech,
+# gTTS synthesis, playsound) and disable() puts the originals back, so
+# while it is off the code runs exactly as if this module did not
+# exist.
+#
+# enable() never imports anything: modules already loaded are patched
+# at once, and the rest by an import hook when something first imports
+# them, so turning it on does not undo the GUIs' lazy start-up.
+# Third-party modules that are never installed are never patched.
+#
+# Each wrapped function records calls, total and worst seconds and a
+# count of the work done (characters of text or Morse, audio seconds).
+# ----------------------
+
+_lock = threading.Lock()
+_stats = {}
+_patch_lock = threading.RLock()
+_patched = []           # (owner, attribute, original, name)
+_waiting = set()        # target modules not imported yet
+_hook = None
+_profiler = None
+
+
+class CallStats:
+    __slots__ = ('calls', 'seconds', 'worst', 'amount', 'unit')
+
+    def __init__(self, unit=None):
+        self.calls = 0
+        self.seconds = 0.0
+        self.worst = 0.0
+        self.amount = 0
+        self.unit = unit
+
+    def as_dict(self):
+        return {'calls': self.calls, 'seconds': self.seconds, 'worst': self.worst,
+                'amount': self.amount, 'unit': self.unit}
+
+
+def record(name, seconds, amount=0, unit=None):
+    """Add one call to the stats for name; safe from any thread."""
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = CallStats(unit)
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.amount += amount
+        if seconds > stats.worst:
+            stats.worst = seconds
+
+
+def _timed(name, func, measure=None, unit=None):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        record(name, seconds, measure(args, kwargs, result) if measure else 0, unit)
+        return result
+    return wrapper
+
+
+# ----------------------
+# What gets wrapped
+# ----------------------
+
+def _text_length(args, kwargs, result):
+    # Bound methods: args[0] is the instance
+    return len(args[1])
+
+
+def _beep_seconds(args, kwargs, result):
+    return args[1] / 1000.0
+
+
+def _rendered_seconds(args, kwargs, result):
+    from .tone import SAMPLE_RATE
+    return len(result) / kwargs.get('sample_rate', SAMPLE_RATE)
+
+
+# (module, attribute path, stats name, measure, unit)
+TARGETS = [
+    ('morse.codec', 'MorseEncoder.encode', 'encode', _text_length, 'chars'),
+    ('morse.codec', 'MorseDecoder.decode', 'decode', _text_length, 'Morse chars'),
+    ('morse.tone', 'render', 'tone.render', _rendered_seconds, 'audio s'),
+    ('winsound', 'Beep', 'beep', _beep_seconds, 'audio s'),
+    ('morse.speech', 'SpeechCache.get', 'tts.cache_get', _text_length, 'chars'),
+    ('morse.speech', 'GTTSBackend.synthesize', 'tts.gtts_synthesize', _text_length, 'chars'),
+    ('pyttsx3', 'init', 'tts.pyttsx3_init', None, None),
+    ('pyttsx3.engine', 'Engine.runAndWait', 'tts.pyttsx3_speak', None, None),
+    ('playsound', 'playsound', 'tts.playsound', None, None),
+]
+
+
+def _patch(module):
+    # Wrap every target in a freshly loaded module
+    for module_name, path, name, measure, unit in TARGETS:
+        if module_name != module.__name__:
+            continue
+        owner = module
+        *parents, attribute = path.split('.')
+        try:
+            for parent in parents:
+                owner = getattr(owner, parent)
+            original = getattr(owner, attribute)
+        except AttributeError:
+            continue
+        setattr(owner, attribute, _timed(name, original, measure, unit))
+        _patched.append((owner, attribute, original, name))
+
+
+class _PatchOnImport:
+    """sys.meta_path finder that hands target modules to _patch() as
+    soon as they have been executed."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in _waiting:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _PatchingLoader(spec.loader)
+        return spec
+
+
+class _PatchingLoader:
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        with _patch_lock:
+            if module.__name__ in _waiting:
+                _waiting.discard(module.__name__)
+                _patch(module)
+
+
+def enabled():
+    return _hook is not None
+
+
+def enable():
+    """Start recording; returns the stats names measured so far (more
+    follow as their modules are imported)."""
+    global _hook
+    with _patch_lock:
+        if _hook is None:
+            _hook = _PatchOnImport()
+            sys.meta_path.insert(0, _hook)
+            for module_name in dict.fromkeys(target[0] for target in TARGETS):
+                module = sys.modules.get(module_name)
+                if module is None:
+                    _waiting.add(module_name)
+                else:
+                    _patch(module)
+        return [entry[3] for entry in _patched]
+
+
+def disable():
+    """Stop recording and restore the original functions; keeps the stats."""
+    global _hook
+    with _patch_lock:
+        if _hook is not None:
+            sys.meta_path.remove(_hook)
+            _hook = None
+        _waiting.clear()
+        while _patched:
+            owner, attribute, original, _ = _patched.pop()
+            setattr(owner, attribute, original)
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def stats():
+    """{name: {'calls', 'seconds', 'worst', 'amount', 'unit'}} so far."""
+    with _lock:
+        result = {name: entry.as_dict() for name, entry in _stats.items()}
+    speech = sys.modules.get('morse.speech')
+    if speech is not None and speech._cache is not None:
+        result['tts.cache'] = speech._cache.stats()
+    return result
+
+
+def report():
+    """The stats as a fixed-width table."""
+    lines = [f"{'':<22} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'worst ms':>9}  work"]
+    for name, entry in sorted(stats().items()):
+        if 'calls' not in entry:
+            lines.append(f"{name:<22} " + ', '.join(f"{key} {value}" for key, value in entry.items()))
+            continue
+        calls = entry['calls']
+        work = f"{entry['amount']:,.0f} {entry['unit']}" if entry['unit'] else ''
+        lines.append(f"{name:<22} {calls:>7} {entry['seconds'] * 1000:>10.1f} "
+                     f"{entry['seconds'] * 1000 / calls:>9.3f} {entry['worst'] * 1000:>9.3f}  {work}")
+    return '\n'.join(lines)
+
+
+# ----------------------
+# cProfile sessions
+#
+# cProfile only sees the thread that started it (the Tk thread in the
+# GUI); playback and speech threads show up in the stats above instead.
+# ----------------------
+
+def start_profile():
+    global _profiler
+    if _profiler is None:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def profiling():
+    return _profiler is not None
+
+
+def stop_profile(path=None, limit=25):
+    """Stop profiling; dump the raw stats to path (for snakeviz, pstats)
+    and return the top entries by cumulative time as text."""
+    global _profiler
+    if _profiler is None:
+        return ''
+    profiler, _profiler = _profiler, None
+    profiler.disable()
+    if path:
+        profiler.dump_stats(path)
+    import io
+    import pstats
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+    return out.getvalue()
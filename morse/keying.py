@@ -0,0 +1,285 @@
+import argparse
+import math
+import sys
+
+from . import codec
+
+# ----------------------
+# Key event decoder
+#
+# Straight keys and paddles are logged as (state, timestamp) events:
+# state true when the key goes down, false when it comes up, timestamps
+# in seconds.  KeyDecoder turns that stream into text as it arrives.
+#
+# Each key-down is classed as a dot or a dash and each key-up as an
+# element, letter or word gap by online k-means in log time: an interval
+# joins the nearest centre and moves it a step towards itself.  Gaps are
+# learned separately from marks, so Farnsworth spacing and uneven fists
+# are followed as they are sent; every move of a mark centre shifts the
+# others half as far, so a change of speed carries over to all classes.
+#
+# A centre whose members spread wider than hand jitter explains, next to
+# one that has stopped winning any, has two real classes on its side of
+# the boundary (after a big change of speed, or stretched gaps): it is
+# split in two, taking over the starved neighbour.
+#
+# Everything is a few float operations per event.  Contact bounce
+# shorter than `debounce` is merged into the surrounding interval, which
+# is why an interval is only classed once the event after it arrives.
+# Letters are turned into text by a codec.LetterStream, so Wabun
+# voicing marks are joined to their kana as decode_from_morse joins them.
+# ----------------------
+
+RATIOS = {'dot': 1.0, 'dash': 3.0, 'element': 1.0, 'letter': 3.0, 'word': 7.0}
+MARKS = ('dot', 'dash')
+GAPS = ('element', 'letter', 'word')
+ADAPT = 0.15            # weight of each new interval in its centre, once settled
+COUPLE = 0.5            # share of each mark centre's move applied to the others
+STEP_LIMIT = math.log(2.0)      # largest move of a centre per interval
+SPREAD_ADAPT = 0.05     # weight of each new interval in its class's spread
+SPLIT = 0.25            # mean log deviation beyond which a class is split
+SPLIT_AFTER = 16        # members a class needs before it can be split
+STARVED = 0.05          # ... and a neighbour winning less than this share
+DEBOUNCE = 0.005        # seconds; shorter key-downs and key-ups are bounce
+
+
+def _nearest(x, low, high):
+    # Log-space centres: the boundary is their geometric mean
+    return x >= (low + high) / 2
+
+
+class KeyDecoder:
+    """Incremental key event decoder: feed() (state, timestamp) events,
+    get text back."""
+
+    def __init__(self, decoder=None, wpm=20, debounce=DEBOUNCE):
+        self.letters = codec.LetterStream(decoder or codec.decoder)
+        self.debounce = debounce
+        dot = math.log(1.2 / wpm)
+        self.centres = {name: dot + math.log(ratio) for name, ratio in RATIOS.items()}
+        self.counts = dict.fromkeys(RATIOS, 0)
+        self.spread = dict.fromkeys(RATIOS, 0.0)
+        self.share = {name: 1.0 / (len(MARKS) if name in MARKS else len(GAPS))
+                      for name in RATIOS}
+        self._update_bounds()
+
+        self._down = False
+        self._start = None      # committed start of the current interval
+        self._pending = None    # time of the last transition, not yet committed
+        self._code = ''
+        self._word_closed = True
+        self.events = 0
+
+    # ----------------------
+    # Public API
+    # ----------------------
+
+    @property
+    def wpm(self):
+        return 1.2 / math.exp(self.centres['dot'])
+
+    def boundaries(self):
+        """Seconds that split dot/dash, element/letter and letter/word gaps."""
+        c = self.centres
+        return {'dash': math.exp((c['dot'] + c['dash']) / 2),
+                'letter': self._letter_gap, 'word': self._word_gap}
+
+    def feed(self, down, timestamp):
+        """Process one key event and return the text completed by it."""
+        down = bool(down)
+        if down == self._down:
+            return ''               # auto-repeat, or a duplicate log line
+        self.events += 1
+        if self._pending is not None and timestamp - self._pending < self.debounce:
+            # Bounce: undo the last transition
+            self._down = down
+            self._pending = None
+            return ''
+        text = self._commit() if self._pending is not None else ''
+        if down and self._start is not None:
+            text += self._gap_progress(timestamp - self._start)
+        self._down = down
+        self._pending = timestamp
+        if self._start is None:
+            self._start = timestamp
+        return text
+
+    def poll(self, now):
+        """Text completed by the key staying up until now; call it from
+        a timer when decoding live."""
+        if self._pending is not None and now - self._pending >= self.debounce:
+            text = self._commit()
+        else:
+            text = ''
+        if not self._down and self._start is not None and self._pending is None:
+            text += self._gap_progress(now - self._start)
+        return text
+
+    def flush(self):
+        """Close the letter and word in progress and return their text."""
+        text = ''
+        if self._pending is not None:
+            if self._down:
+                self._down = False          # a key held at the end of the log
+            else:
+                text = self._commit()
+        text += self.letters.letter(self._code) if self._code else ''
+        text += self.letters.flush()
+        self._code = ''
+        self._word_closed = True
+        self._start = self._pending = None
+        return text
+
+    # ----------------------
+    # Internals
+    # ----------------------
+
+    def _learn(self, name, x, group):
+        centres = self.centres
+        self.counts[name] += 1
+        # Plain running mean for the first few members, then a fixed step
+        rate = max(1.0 / (self.counts[name] + 1), ADAPT)
+        deviation = x - centres[name]
+        step = max(-STEP_LIMIT, min(STEP_LIMIT, rate * deviation))
+        centres[name] += step
+        self.spread[name] += (max(1.0 / self.counts[name], SPREAD_ADAPT)
+                              * (abs(deviation) - self.spread[name]))
+        share = self.share
+        for other in group:
+            share[other] += ADAPT * ((other == name) - share[other])
+        if group is MARKS:
+            for other in centres:
+                if other != name:
+                    centres[other] += COUPLE * step
+        if self.spread[name] > SPLIT and self.counts[name] >= SPLIT_AFTER:
+            self._split(name, group)
+        self._update_bounds()
+
+    def _split(self, name, group):
+        index = group.index(name)
+        neighbours = [group[i] for i in (index - 1, index + 1) if 0 <= i < len(group)]
+        other = min(neighbours, key=self.share.__getitem__)
+        if self.share[other] >= STARVED:
+            return
+        centre, offset = self.centres[name], self.spread[name]
+        if group.index(other) < index:
+            offset = -offset
+        self.centres[other] = centre + offset
+        self.centres[name] = centre - offset
+        for changed in (name, other):
+            self.counts[changed] = 0
+            self.spread[changed] = 0.0
+
+    def _update_bounds(self):
+        c = self.centres
+        self._letter_gap = math.exp((c['element'] + c['letter']) / 2)
+        self._word_gap = math.exp((c['letter'] + c['word']) / 2)
+
+    def _commit(self):
+        # The interval from _start to _pending stands: class it
+        length = self._pending - self._start
+        text = ''
+        if length > 0:
+            x = math.log(length)
+            c = self.centres
+            if not self._down:
+                # The key came up at _pending: a mark
+                if _nearest(x, c['dot'], c['dash']):
+                    self._code += '-'
+                    self._learn('dash', x, MARKS)
+                else:
+                    self._code += '.'
+                    self._learn('dot', x, MARKS)
+                self._word_closed = False
+            else:
+                # The key went down at _pending: a gap
+                text = self._gap_progress(length)
+                if not _nearest(x, c['element'], c['letter']):
+                    self._learn('element', x, GAPS)
+                elif not _nearest(x, c['letter'], c['word']):
+                    self._learn('letter', x, GAPS)
+                elif x < c['word'] + 2 * STEP_LIMIT:
+                    self._learn('word', x, GAPS)    # pauses much longer teach nothing
+        self._start = self._pending
+        self._pending = None
+        return text
+
+    def _gap_progress(self, length):
+        # Letters and words are emitted the moment their gap is long
+        # enough, without waiting for the next key-down.
+        text = ''
+        if self._code and length >= self._letter_gap:
+            text = self.letters.letter(self._code)
+            self._code = ''
+        if not self._word_closed and not self._code and length >= self._word_gap:
+            self._word_closed = True
+            text += self.letters.flush() + ' '
+        return text
+
+
+def iter_decode_events(events, decoder=None, wpm=20, debounce=DEBOUNCE):
+    """Yield text as (state, timestamp) events are decoded."""
+    keys = KeyDecoder(decoder, wpm, debounce)
+    feed = keys.feed
+    for down, timestamp in events:
+        text = feed(down, timestamp)
+        if text:
+            yield text
+    text = keys.flush()
+    if text:
+        yield text
+
+
+def decode_events(events, decoder=None, wpm=20, debounce=DEBOUNCE):
+    """Decode a whole capture of (state, timestamp) events to text."""
+    return ''.join(iter_decode_events(events, decoder, wpm, debounce)).strip()
+
+
+# ----------------------
+# Captures on disk
+#
+#   python -m morse.keying CAPTURE [-a ALPHABET] [--wpm 20]
+#
+# One event per line, "<timestamp> <state>", where state is 1/0,
+# down/up or press/release; blank lines and # comments are skipped.
+# ----------------------
+
+STATES = {'1': True, 'down': True, 'press': True, '0': False, 'up': False, 'release': False}
+
+
+def read_events(lines):
+    for number, line in enumerate(lines, 1):
+        line = line.split('#', 1)[0].split()
+        if not line:
+            continue
+        try:
+            yield STATES[line[1].lower()], float(line[0])
+        except (IndexError, KeyError, ValueError):
+            raise ValueError(f"line {number}: expected '<timestamp> <state>'") from None
+
+
+def main(argv=None):
+    from .alphabets import ALPHABETS, get_alphabet
+    parser = argparse.ArgumentParser(prog='python -m morse.keying',
+                                     description="Decode a log of key-down/key-up events.")
+    parser.add_argument('capture', help="event log, or - for stdin")
+    parser.add_argument('-a', '--alphabet', default='international', choices=list(ALPHABETS))
+    parser.add_argument('--wpm', type=float, default=20, help="starting speed guess")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE)
+    args = parser.parse_args(argv)
+    source = sys.stdin if args.capture == '-' else open(args.capture, encoding='utf-8')
+    try:
+        for text in iter_decode_events(read_events(source), get_alphabet(args.alphabet).decoder,
+                                       args.wpm, args.debounce):
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    except ValueError as error:
+        sys.exit(f"{args.capture}: {error}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    sys.stdout.write('\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import time
+
+import numpy as np
+
+from . import codec
+from .audio import BLOCK_SECONDS, estimate_frequency
+
+# ----------------------
+# Real-time CW decoder
+#
+# Audio arrives in frames of any size.  Each frame is cut into Goertzel
+# blocks and integrated coherently in one NumPy pass; a small state
+# machine then walks the block envelope, tracking the noise floor, tone
+# level and dot length as it goes so it follows QSB and changes in speed.
+# Letters become text through a codec.LetterStream, which joins Wabun
+# voicing marks to their kana.
+# ----------------------
+
+LETTER_GAP = 2.0        # gaps longer than this many units close a letter
+WORD_GAP = 5.0          # ... and this many close a word
+DEBOUNCE = 0.25         # state changes must hold for this many units
+HYSTERESIS = 0.15
+LEVEL_ADAPT = 0.02      # per block; about 0.2 s time constant at 4 ms
+SPEED_ADAPT = 0.2       # weight of each new element in the dot length
+WARMUP_SECONDS = 0.5    # audio buffered to find the tone and initial levels
+MIN_PROMINENCE = 10.0   # tone peak over median spectrum to lock on
+
+
+class LiveDecoder:
+    """Incremental CW decoder: feed() audio frames, get text back."""
+
+    def __init__(self, sample_rate, frequency=None, wpm=20, decoder=None,
+                 block_seconds=BLOCK_SECONDS):
+        self.sample_rate = sample_rate
+        self.frequency = frequency
+        self.block = max(8, int(round(block_seconds * sample_rate)))
+        self.letters = codec.LetterStream(decoder or codec.decoder)
+        self.unit = 1.2 / wpm / (self.block / sample_rate)    # in blocks
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._history = np.zeros(0, dtype=np.complex128)
+        self._block_index = 0
+        self._low = None
+        self._high = None
+        self._down = False
+        self._run = 0
+        self._flip = 0
+        self._code = ''
+        self._word_closed = True
+
+        self.frames = 0
+        self.last_frame_seconds = 0.0
+        self.total_seconds = 0.0
+
+    # ----------------------
+    # Public API
+    # ----------------------
+
+    @property
+    def wpm(self):
+        return 1.2 / (self.unit * self.block / self.sample_rate)
+
+    @property
+    def threshold(self):
+        if self._low is None:
+            return None
+        return (self._low + self._high) / 2
+
+    def feed(self, frame):
+        """Process one frame (float array, or 16-bit little-endian PCM
+        bytes) and return the text completed by it."""
+        start = time.perf_counter()
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            frame = np.frombuffer(frame, dtype='<i2').astype(np.float32) / 32768
+        samples = np.concatenate((self._pending, np.asarray(frame, dtype=np.float32)))
+
+        if self._low is None:
+            # Warm up on the first half second that carries a tone: lock
+            # on to its frequency and seed the noise floor and tone level.
+            if len(samples) < WARMUP_SECONDS * self.sample_rate:
+                self._pending = samples
+                return self._timed('', start)
+            if self.frequency is None:
+                self.frequency = self._find_tone(samples)
+                if self.frequency is None:
+                    self._pending = samples[-int(WARMUP_SECONDS * self.sample_rate):]
+                    self._block_index += (len(samples) - len(self._pending)) // self.block
+                    return self._timed('', start)
+
+        count = len(samples) // self.block
+        self._pending = samples[count * self.block:]
+        if not count:
+            return self._timed('', start)
+        envelope = self._envelope(samples[:count * self.block])
+        if self._low is None:
+            self._low, self._high = np.percentile(envelope, [10, 95]).tolist()
+        return self._timed(''.join(self._step(envelope.tolist())), start)
+
+    def flush(self):
+        """Close the letter and word in progress and return their text."""
+        text = self._close_letter()
+        self._down, self._run, self._flip = False, 0, 0
+        return text
+
+    # ----------------------
+    # Internals
+    # ----------------------
+
+    def _timed(self, text, start):
+        self.last_frame_seconds = time.perf_counter() - start
+        self.total_seconds += self.last_frame_seconds
+        self.frames += 1
+        return text
+
+    def _find_tone(self, samples):
+        frequency = estimate_frequency(samples, self.sample_rate)
+        spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+        bin_ = int(round(frequency * len(samples) / self.sample_rate))
+        if not spectrum[bin_] > MIN_PROMINENCE * np.median(spectrum):
+            return None
+        return frequency
+
+    def _envelope(self, samples):
+        count = len(samples) // self.block
+        omega = 2 * np.pi * self.frequency / self.sample_rate
+        iq = samples.reshape(count, self.block) @ np.exp(-1j * omega * np.arange(self.block))
+        iq *= np.exp(-1j * omega * self.block * (self._block_index + np.arange(count)))
+        self._block_index += count
+
+        # Trailing coherent sum over a third of a dot, carried across frames
+        width = max(1, int(self.unit / 3))
+        joined = np.concatenate((self._history, iq))
+        sums = np.cumsum(np.concatenate(([0], joined)))
+        first = len(self._history)
+        lows = np.maximum(np.arange(first, len(joined)) + 1 - width, 0)
+        tops = np.arange(first, len(joined)) + 1
+        envelope = np.abs(sums[tops] - sums[lows]) / width
+        self._history = joined[-max(width, 64):]
+        return envelope
+
+    def _step(self, envelope):
+        low, high = self._low, self._high
+        for level in envelope:
+            middle = (low + high) / 2
+            margin = HYSTERESIS * (high - low)
+            down = level > (middle - margin if self._down else middle + margin)
+            # Decision-directed levels: each follows the blocks of its state
+            if down:
+                high += LEVEL_ADAPT * (level - high)
+            else:
+                low += LEVEL_ADAPT * (level - low)
+
+            if down == self._down:
+                self._run += self._flip + 1
+                self._flip = 0
+            else:
+                self._flip += 1
+                if self._flip >= DEBOUNCE * self.unit:
+                    if self._down:
+                        self._end_mark(self._run)
+                    else:
+                        self._end_gap(self._run)
+                    self._down, self._run, self._flip = down, self._flip, 0
+            if not self._down:
+                text = self._gap_progress()
+                if text:
+                    yield text
+        self._low, self._high = low, high
+
+    def _end_mark(self, length):
+        # Snap quickly when the sender is far off the current estimate: a
+        # mark this short must be a dot, one this long a dash.
+        if length < 0.6 * self.unit:
+            self.unit = length
+        elif length > WORD_GAP * self.unit:
+            self.unit = length / 3
+        if length < LETTER_GAP * self.unit:
+            self._code += '.'
+            self.unit += SPEED_ADAPT * (length - self.unit)
+        else:
+            self._code += '-'
+            self.unit += SPEED_ADAPT * (length / 3 - self.unit)
+        self._word_closed = False
+
+    def _end_gap(self, length):
+        if length < LETTER_GAP * self.unit and self._code:
+            self.unit += SPEED_ADAPT * (length - self.unit)
+
+    def _gap_progress(self):
+        # Letters and words are emitted the moment their gap is long
+        # enough, without waiting for the next mark.
+        if self._code and self._run >= LETTER_GAP * self.unit:
+            return self._close_letter(word=False)
+        if not self._word_closed and self._run >= WORD_GAP * self.unit:
+            self._word_closed = True
+            return self.letters.flush() + ' '
+        return ''
+
+    def _close_letter(self, word=True):
+        text = self.letters.letter(self._code) if self._code else ''
+        self._code = ''
+        if word:
+            text += self.letters.flush()
+            self._word_closed = True
+        return text
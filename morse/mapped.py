@@ -0,0 +1,95 @@
+import mmap
+import os
+import re
+
+from .codec import UNKNOWN
+from .table import REVERSE_MORSE_CODE_DICT
+
+# ----------------------
+# Memory-mapped batch decoding
+#
+# The input file is mapped, never read into a str: it is scanned as
+# bytes in windows cut at whitespace, each window is decoded through a
+# bytes -> UTF-8 bytes table, and the result goes out through a buffered
+# binary writer.  Pages already decoded are handed back to the kernel,
+# so peak RSS stays at about one window whatever the file size.
+# ----------------------
+
+WINDOW = 1 << 20
+BUFFER_SIZE = 1 << 20
+FAULT_AROUND = 1 << 16
+_WHITESPACE = re.compile(rb'\s')
+
+
+class _ByteDecodeTable(dict):
+    # code bytes -> UTF-8 bytes; unknown codes decode to b'?'
+    def __missing__(self, code):
+        return UNKNOWN.encode('ascii')
+
+
+class ByteDecoder:
+    """MorseDecoder over bytes, built from a REVERSE_MORSE_CODE_DICT table.
+
+    Lines are kept: every line decodes as decode_from_morse(line).
+    """
+
+    def __init__(self, reverse_dict):
+        self.table = _ByteDecodeTable(
+            (code.encode('ascii'), char.encode('utf-8')) for code, char in reverse_dict.items())
+        self.table[b'/'] = b' '
+
+    def decode_tokens(self, code):
+        return b''.join(map(self.table.__getitem__, code.split()))
+
+    def decode(self, code):
+        if b'\n' not in code:
+            return self.decode_tokens(code)
+        return b'\n'.join(map(self.decode_tokens, code.split(b'\n')))
+
+
+byte_decoder = ByteDecoder(REVERSE_MORSE_CODE_DICT)
+
+
+def _release(mapped, start, end):
+    # Drop decoded pages from this process; they stay in the page cache.
+    # The kernel maps pages around each fault, including some before the
+    # window, so the range reaches back a little.
+    if hasattr(mmap, 'MADV_DONTNEED'):
+        start = max(0, start - FAULT_AROUND)
+        start -= start % mmap.PAGESIZE
+        if end > start:
+            mapped.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+
+def iter_decode_mapped(path, window=WINDOW, decoder=None):
+    """Decode a Morse file through mmap, yielding UTF-8 bytes in order."""
+    decoder = decoder or byte_decoder
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        size = len(mapped)
+        start = 0
+        while start < size:
+            end = start + window
+            if end >= size:
+                end = size
+            else:
+                cut = max(mapped.rfind(b' ', start, end), mapped.rfind(b'\n', start, end))
+                if cut <= start:
+                    match = _WHITESPACE.search(mapped, end)
+                    cut = match.start() if match else size
+                end = cut
+            yield decoder.decode(mapped[start:end])
+            _release(mapped, start, end)
+            start = end
+
+
+def decode_mapped(path, output, window=WINDOW, decoder=None):
+    """Decode the Morse file at path into output; returns bytes written."""
+    written = 0
+    with open(output, 'wb', buffering=BUFFER_SIZE) as out:
+        for piece in iter_decode_mapped(path, window, decoder):
+            written += out.write(piece)
+    return written
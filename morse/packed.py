@@ -0,0 +1,261 @@
+import codecs
+import re
+import struct
+
+from .codec import UNKNOWN, MorseEncoder
+from .table import MORSE_CODE_DICT, REVERSE_MORSE_CODE_DICT
+
+# ----------------------
+# Bit-packed Morse
+#
+# Four 2-bit symbols per byte, first symbol in the low bits:
+#
+#   0 dot   1 dash   2 end of letter   3 word gap
+#
+# Every letter is terminated by a 2, and a letter with no elements is a
+# character the table does not have (the '?' of the string form).  So
+# ".- / -... ?" packs as 0 1 2 3 1 0 0 0 2 2: ten symbols in three bytes
+# instead of eleven characters.  Any other token that is not made of
+# dots and dashes packs as an unknown letter too, as decode_from_morse
+# reads it; codes with other marks (American's '_', '=' and '#') cannot
+# be packed.
+#
+# On disk the symbols follow a 12 byte header: b'MPK', a version byte
+# and the symbol count as a little-endian uint64.
+# ----------------------
+
+DOT, DASH, LETTER, WORD = range(4)
+MAGIC = b'MPK'
+VERSION = 1
+HEADER = struct.Struct('<3sBQ')
+WINDOW = 1 << 20      # symbols packed / unpacked per step, a multiple of 4
+
+# Symbol <-> string form, after '?' tokens are dropped and '/' tokens
+# have lost their trailing space (see _symbols)
+_TO_SYMBOLS = bytes.maketrans(b'.- /', bytes((DOT, DASH, LETTER, WORD)))
+_NOT_SYMBOL = bytes(c for c in range(256) if c not in b'.- /')
+_FROM_SYMBOLS = bytes.maketrans(bytes((DOT, DASH, LETTER, WORD)), b'.- /')
+_EMPTY_LETTER = re.compile(r'(?<![.-]) ')
+_LETTER = re.compile(r'[.-]+')
+
+# Lane i of a packed byte holds every 4th symbol, shifted up by 2*i bits
+_SHIFT = [bytes((c << 2 * i) & 0xFF if c < 4 else 0 for c in range(256)) for i in range(4)]
+_UNSHIFT = [bytes((c >> 2 * i) & 3 for c in range(256)) for i in range(4)]
+
+
+def _canonical(code):
+    # Letters separated by single spaces, as encode_to_morse writes them
+    return (code.isascii() and code[:1] != ' ' and code[-1:] != ' ' and '  ' not in code
+            and not any(space in code for space in '\t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'))
+
+
+def _symbols(code):
+    # Morse string -> one symbol per byte
+    if not _canonical(code):
+        code = ' '.join(code.split())
+    if not code:
+        return b''
+    if code.isascii():
+        data = code.encode('ascii')
+        joined = (data + b' ').replace(b'/ ', b'/')
+        # Counting is far quicker than a regex: every '/' and '?' must be
+        # a token of its own, and then nothing else can be malformed
+        slashes = data.count(b'/')
+        if (not data.translate(None, b'.- /?') and len(data) + 1 - len(joined) == slashes
+                and data.count(b' /') + data.startswith(b'/') == slashes
+                and (b'?' not in data or _alone(data, b'?'))):
+            return joined.translate(_TO_SYMBOLS, _NOT_SYMBOL)
+    # Tokens other than letters and '/' are unknown letters, as
+    # decode_from_morse reads them
+    code = ' '.join(token if token == '/' or _LETTER.fullmatch(token) else UNKNOWN
+                    for token in code.split(' '))
+    return (code + ' ').replace('/ ', '/').encode('ascii').translate(_TO_SYMBOLS, _NOT_SYMBOL)
+
+
+def _alone(data, mark):
+    count = data.count(mark)
+    return (data.count(b' ' + mark) + data.startswith(mark) == count
+            and data.count(mark + b' ') + data.endswith(mark) == count)
+
+
+def _pack(symbols):
+    # The lanes have disjoint bits, so OR-ing them as big integers packs
+    # the whole window in a few C-level passes.
+    packed = bytearray()
+    for start in range(0, len(symbols), WINDOW):
+        chunk = symbols[start:start + WINDOW]
+        chunk += bytes(-len(chunk) % 4)
+        value = 0
+        for i in range(4):
+            value |= int.from_bytes(chunk[i::4].translate(_SHIFT[i]), 'little')
+        packed += value.to_bytes(len(chunk) // 4, 'little')
+    return packed
+
+
+def _unpack(packed, count):
+    symbols = bytearray(len(packed) * 4)
+    for i in range(4):
+        symbols[i::4] = packed.translate(_UNSHIFT[i])
+    del symbols[count:]
+    return bytes(symbols)
+
+
+class PackedMorse:
+    """Morse held as 2-bit symbols in a bytearray."""
+
+    def __init__(self, data=None, count=0):
+        self.data = bytearray() if data is None else bytearray(data)
+        self.count = count
+
+    @classmethod
+    def from_symbols(cls, symbols):
+        return cls(_pack(symbols), len(symbols))
+
+    def symbols(self):
+        return _unpack(self.data, self.count)
+
+    def __len__(self):
+        return self.count
+
+    def __eq__(self, other):
+        if not isinstance(other, PackedMorse):
+            return NotImplemented
+        return self.count == other.count and self.data == other.data
+
+    @property
+    def nbytes(self):
+        return HEADER.size + len(self.data)
+
+    def to_bytes(self):
+        return HEADER.pack(MAGIC, VERSION, self.count) + bytes(self.data)
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        if len(buffer) < HEADER.size:
+            raise ValueError("not packed Morse: too short")
+        magic, version, count = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("not packed Morse: bad magic")
+        if version != VERSION:
+            raise ValueError(f"unsupported packed Morse version {version}")
+        data = buffer[HEADER.size:]
+        if len(data) != (count + 3) // 4:
+            raise ValueError("packed Morse is truncated")
+        return cls(data, count)
+
+
+def pack_morse(code):
+    """Pack a Morse string as produced by encode_to_morse."""
+    return PackedMorse.from_symbols(_symbols(code))
+
+
+def unpack_morse(packed):
+    """Return the string form, as encode_to_morse would have written it."""
+    code = packed.symbols().translate(_FROM_SYMBOLS).decode('ascii')
+    if code[:1] == ' ' or '  ' in code or '/ ' in code:
+        code = _EMPTY_LETTER.sub(UNKNOWN + ' ', code)
+    code = code.replace('/', '/ ')
+    return code.rstrip(' ')
+
+
+# ----------------------
+# Encoding and decoding on the packed form
+# ----------------------
+
+class PackedEncoder(MorseEncoder):
+    """MorseEncoder whose table maps each character to its symbols."""
+
+    def _compile(self, char):
+        # The exact-entry rule of MorseEncoder._compile
+        key = char.upper() if self.fold_case and char not in self.code_dict else char
+        self.table[ord(char)] = _symbols(self.code_dict.get(key, UNKNOWN))
+
+    def encode(self, text):
+        symbols = self.encode_symbols(text)
+        return PackedMorse.from_symbols(symbols)
+
+    def encode_symbols(self, text):
+        # charmap_encode with the symbol table, as MorseEncoder.encode
+        try:
+            return codecs.charmap_encode(text, 'strict', self.table)[0]
+        except UnicodeEncodeError:
+            for char in set(text):
+                if ord(char) not in self.table:
+                    self._compile(char)
+            return codecs.charmap_encode(text, 'strict', self.table)[0]
+
+
+class _PackedDecodeTable(dict):
+    # letter symbols -> character.  Pieces split on LETTER may begin with
+    # word gaps; those are worked out on first sight and remembered while
+    # they stay letter-sized.
+    def __init__(self, reverse_dict, longest):
+        for code, char in reverse_dict.items():
+            if _LETTER.fullmatch(code):
+                self[_symbols(code)[:-1]] = char
+        self.limit = longest + 4
+
+    def __missing__(self, piece):
+        letter = piece.lstrip(bytes((WORD,)))
+        text = ' ' * (len(piece) - len(letter)) + (dict.get(self, letter) or UNKNOWN)
+        if len(piece) <= self.limit:
+            self[piece] = text
+        return text
+
+
+class PackedDecoder:
+    """Decode PackedMorse straight from its symbols, without the string form."""
+
+    window = 1 << 20
+
+    def __init__(self, reverse_dict):
+        longest = max(map(len, reverse_dict))
+        self.table = _PackedDecodeTable(reverse_dict, longest)
+        # An element-less letter is the unknown character
+        self.table[b''] = UNKNOWN
+
+    def decode_symbols(self, symbols):
+        parts = []
+        table = self.table
+        start = 0
+        length = len(symbols)
+        while start < length:
+            # Windows end just after a letter, so no letter is cut
+            end = start + self.window
+            if end >= length:
+                end = length
+            else:
+                cut = symbols.rfind(LETTER, start, end)
+                if cut < start:
+                    cut = symbols.find(LETTER, end)
+                end = cut + 1 if cut >= 0 else length
+            pieces = symbols[start:end].split(bytes((LETTER,)))
+            tail = pieces.pop()
+            parts.append(''.join(map(table.__getitem__, pieces)))
+            if tail:
+                # Trailing word gaps, or a letter missing its terminator
+                letter = tail.lstrip(bytes((WORD,)))
+                parts.append(' ' * (len(tail) - len(letter)))
+                if letter:
+                    parts.append(table[letter])
+            start = end
+        return ''.join(parts)
+
+    def decode(self, packed):
+        return self.decode_symbols(packed.symbols())
+
+
+# ----------------------
+# Default engines
+# ----------------------
+
+packed_encoder = PackedEncoder(MORSE_CODE_DICT)
+packed_decoder = PackedDecoder(REVERSE_MORSE_CODE_DICT)
+
+
+def encode_packed(text):
+    return packed_encoder.encode(text)
+
+
+def decode_packed(packed):
+    return packed_decoder.decode(packed)
@@ -0,0 +1,85 @@
+import collections
+import os
+import re
+
+from . import codec
+
+# ----------------------
+# Multiprocess decoding
+# ----------------------
+
+CHUNK_SIZE = 4 << 20
+_WHITESPACE = re.compile(rb'\s')
+
+
+def _decode_text(code):
+    return codec.decoder.decode(code)
+
+
+def _decode_range(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    return '\n'.join(map(codec.decoder.decode_tokens, text.split('\n')))
+
+
+def _ordered(executor, func, jobs, workers):
+    # Like executor.map, but with at most a couple of jobs per worker in
+    # flight so finished chunks never pile up ahead of the writer.
+    pending = collections.deque()
+    for args in jobs:
+        pending.append(executor.submit(func, *args))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def decode_parallel(code, workers=None, chunk_size=CHUNK_SIZE):
+    """decode_from_morse(code), with the input split at letter boundaries
+    and the pieces decoded on a process pool."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(code) <= chunk_size:
+        return codec.decode_from_morse(code)
+    # concurrent.futures pulls in multiprocessing: about half of the time
+    # `import morse` would take, so it is imported on first use
+    from concurrent.futures import ProcessPoolExecutor
+    jobs = ((code[start:end],) for start, end in codec._windows(code, chunk_size))
+    with ProcessPoolExecutor(workers) as executor:
+        return ''.join(_ordered(executor, _decode_text, jobs, workers))
+
+
+def split_file(path, chunk_size=CHUNK_SIZE):
+    """Yield (start, end) byte ranges of a Morse file cut at whitespace."""
+    size = os.path.getsize(path)
+    start = 0
+    with open(path, 'rb') as f:
+        while start < size:
+            end = start + chunk_size
+            while end < size:
+                f.seek(end)
+                block = f.read(1 << 12)
+                match = _WHITESPACE.search(block)
+                if match:
+                    end += match.start()
+                    break
+                end += len(block)
+            end = min(end, size)
+            yield start, end
+            start = end
+
+
+def iter_decode_file(path, workers=None, chunk_size=CHUNK_SIZE):
+    """Decode a Morse file on a process pool, yielding the decoded text in
+    order.  Line breaks are passed through, as with stream.iter_decode."""
+    workers = workers or os.cpu_count() or 1
+    from concurrent.futures import ProcessPoolExecutor
+    jobs = ((path, start, end) for start, end in split_file(path, chunk_size))
+    with ProcessPoolExecutor(workers) as executor:
+        yield from _ordered(executor, _decode_range, jobs, workers)
+
+
+def decode_file(path, output, workers=None, chunk_size=CHUNK_SIZE):
+    with open(output, 'w', encoding='utf-8') as out:
+        for piece in iter_decode_file(path, workers, chunk_size):
+            out.write(piece)
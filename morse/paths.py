@@ -0,0 +1,10 @@
+import os
+
+# ----------------------
+# Per-user cache directories ($XDG_CACHE_HOME, or ~/.cache)
+# ----------------------
+
+
+def cache_dir(name):
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, name)
@@ -0,0 +1,108 @@
+import collections
+import itertools
+import threading
+
+from . import sound
+from .dispatch import UIDispatch
+
+# ----------------------
+# Non-blocking playback scheduler
+#
+# One long-lived worker thread plays queued Morse strings in order.
+# Stopping is immediate: silences wait on an Event instead of sleeping,
+# and the worker checks it between elements.  Progress and completion
+# callbacks are dispatched to the UI thread when attach() is used, since
+# Tk widgets must only be touched from the thread running mainloop().
+# ----------------------
+
+
+class PlaybackJob:
+    def __init__(self, job_id, morse_code, on_progress, on_done):
+        self.id = job_id
+        self.morse_code = morse_code
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.cancelled = threading.Event()
+
+
+class PlaybackScheduler(UIDispatch):
+    def __init__(self, unit=sound.UNIT, frequency=sound.FREQUENCY, beep=None):
+        self.unit = unit
+        self.frequency = frequency
+        self._beep = beep
+        # Queued jobs and the current one change together under _lock,
+        # so stop() and cancel() never miss a job being picked up
+        self._jobs = collections.deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._ids = itertools.count(1)
+        self._thread = None
+        self.current = None
+
+    def play(self, morse_code, on_progress=None, on_done=None):
+        """Queue a Morse string; returns its job id.
+
+        on_progress(index, total) is called as each symbol starts and
+        on_done(completed) when the job finishes or is cancelled.
+        """
+        job = PlaybackJob(next(self._ids), morse_code, on_progress, on_done)
+        with self._lock:
+            self._jobs.append(job)
+            self._wakeup.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="morse-playback", daemon=True)
+                self._thread.start()
+        return job.id
+
+    def cancel(self, job_id):
+        with self._lock:
+            for job in itertools.chain((self.current,), self._jobs):
+                if job is not None and job.id == job_id:
+                    job.cancelled.set()
+
+    def stop(self):
+        """Cancel the playing job and everything queued behind it."""
+        with self._lock:
+            for job in itertools.chain((self.current,), self._jobs):
+                if job is not None:
+                    job.cancelled.set()
+
+    @property
+    def busy(self):
+        with self._lock:
+            return self.current is not None or bool(self._jobs)
+
+    # ----------------------
+    # Worker
+    # ----------------------
+
+    def _resolve_beep(self):
+        # Looked up per job, so a Beep swapped in later (morse.instrument)
+        # is picked up
+        if self._beep is None and sound.AVAILABLE:
+            import winsound
+            return winsound.Beep
+        return self._beep
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._jobs:
+                    self._wakeup.wait()
+                job = self.current = self._jobs.popleft()
+            beep = self._resolve_beep()
+            total = len(job.morse_code)
+            last = -1
+            for index, tone, ms in sound.timeline(job.morse_code, self.unit):
+                if job.cancelled.is_set():
+                    break
+                if index != last:
+                    last = index
+                    self._dispatch(job.on_progress, index, total)
+                if tone and beep is not None:
+                    beep(self.frequency, ms)
+                else:
+                    job.cancelled.wait(ms / 1000.0)
+            with self._lock:
+                self.current = None
+            self._dispatch(job.on_done, not job.cancelled.is_set())
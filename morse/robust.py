@@ -0,0 +1,279 @@
+import collections
+import heapq
+import math
+
+from .codec import UNKNOWN
+from .table import REVERSE_MORSE_CODE_DICT
+
+# ----------------------
+# Error-tolerant decoding
+#
+# decode_from_morse trusts every space.  RobustDecoder instead treats the
+# dots and dashes as the signal and the spaces as evidence: it searches
+# all ways of cutting the element stream into letters (Viterbi over the
+# code table) and scores each cut by
+#
+#   - how far each piece is from a real code (one dot/dash substituted,
+#     dropped or added costs EDIT),
+#   - whether a space was seen where it cuts, and not cutting where one
+#     was seen (EXTRA_GAP).  How much a missing space costs depends on
+#     how many spaces the input has: in a stream sent with no letter
+#     spacing at all, it costs next to nothing,
+#   - optionally, a character n-gram model of the language.
+#
+# Costs are negative log-likelihoods, so lower is better.  A '/' is
+# taken as a word gap and always cuts.  Each element position keeps a
+# bounded beam of hypotheses, so the work is linear in the input.
+# ----------------------
+
+EDIT = 5.0
+EXTRA_GAP = 5.0
+MODEL_WEIGHT = 0.5          # language model scale against the signal costs
+ELEMENTS_PER_LETTER = 2.5   # English text averages about this many
+UNKNOWN_COST = 9.0
+BEAM = 16            # hypotheses kept per element position
+OPTIONS = 10         # letters tried from each position
+MARGIN = 10.0        # ...and only those within this cost of the best
+MAX_DECODERS = 4     # decoders kept by decode_robust(), one per model
+
+Hypothesis = collections.namedtuple('Hypothesis', 'text cost')
+
+
+class CharNGramModel:
+    """Character n-gram model with stupid backoff, as costs in nats."""
+
+    backoff = -math.log(0.4)
+
+    def __init__(self, counts, order):
+        self.order = order
+        self.counts = counts          # context -> Counter of next chars
+        self.totals = {context: sum(following.values()) for context, following in counts.items()}
+        # A character never seen at all costs as if seen once
+        self.floor = math.log(self.totals.get('', 0) + 1)
+        self._costs = {}
+
+    @classmethod
+    def from_text(cls, text, order=3):
+        text = ' '.join(text.upper().split())
+        counts = collections.defaultdict(collections.Counter)
+        for n in range(order):
+            for i in range(len(text) - n):
+                counts[text[i:i + n]][text[i + n]] += 1
+        return cls(dict(counts), order)
+
+    def cost(self, context, char):
+        key = (context, char)
+        cost = self._costs.get(key)
+        if cost is None:
+            cost = self._cost(context, char)
+            self._costs[key] = cost
+        return cost
+
+    def _cost(self, context, char):
+        penalty = 0.0
+        while True:
+            following = self.counts.get(context)
+            if following and following[char]:
+                return penalty + math.log(self.totals[context] / following[char])
+            if not context:
+                return penalty + self.floor
+            context = context[1:]
+            penalty += self.backoff
+
+
+def _cost(entry):
+    return entry[0]
+
+
+class _Uniform:
+    # No language model: every character costs the same
+    order = 1
+
+    def cost(self, context, char):
+        return 0.0
+
+
+def _variants(code):
+    # Every dot/dash string one substitution, deletion or insertion away
+    for i in range(len(code)):
+        yield code[:i] + ('-' if code[i] == '.' else '.') + code[i + 1:]
+        if len(code) > 1:
+            yield code[:i] + code[i + 1:]
+    for i in range(len(code) + 1):
+        yield code[:i] + '.' + code[i:]
+        yield code[:i] + '-' + code[i:]
+
+
+class RobustDecoder:
+    """Viterbi decoder over a REVERSE_MORSE_CODE_DICT-style table."""
+
+    def __init__(self, reverse_dict, model=None, beam=BEAM, model_weight=MODEL_WEIGHT):
+        self.model = model or _Uniform()
+        self.model_weight = model_weight
+        self._scores = {}           # (context, char) -> weighted model cost
+        self.beam = beam
+        # observed piece -> [(char, cost)], best first
+        candidates = collections.defaultdict(dict)
+        for code, char in reverse_dict.items():
+            if not code or code.strip('.-'):
+                continue
+            candidates[code][char] = 0.0
+            for variant in _variants(code):
+                candidates[variant].setdefault(char, EDIT)
+        self.candidates = {piece: sorted(chars.items(), key=lambda item: item[1])
+                           for piece, chars in candidates.items()}
+        self.longest = max(map(len, self.candidates))
+
+    def _parse(self, code):
+        # -> element string, gaps[k] (letter gap seen before element k),
+        #    words[k] (number of '/' before element k), for k in 0..N
+        elements = []
+        gaps = [False]
+        words = [0]
+        for char in code:
+            if char == '.' or char == '-':
+                elements.append(char)
+                gaps.append(False)
+                words.append(0)
+            elif char == '/':
+                words[-1] += 1
+            else:
+                gaps[-1] = True
+        return ''.join(elements), gaps, words
+
+    @staticmethod
+    def _cut_costs(elements, gaps, words):
+        # (cost of a cut at a seen gap, cost of a cut where none was seen),
+        # from the share of letter boundaries that show a space
+        boundaries = len(elements) / ELEMENTS_PER_LETTER - sum(words)
+        seen = min(0.98, max(0.02, sum(gaps) / max(1.0, boundaries)))
+        return -math.log(seen), -math.log(1 - seen)
+
+    def _options(self, elements, gaps, words, start, cuts):
+        # (length, char, cost) for every letter that may start at `start`
+        seen, missing = cuts
+        options = []
+        inside = 0.0
+        end = len(elements)
+        for length in range(1, self.longest + 1):
+            stop = start + length
+            if stop > end:
+                break
+            if length > 1:
+                if words[stop - 1]:
+                    break
+                if gaps[stop - 1]:
+                    inside += EXTRA_GAP
+            if stop == end or words[stop]:
+                cut = 0.0
+            else:
+                cut = seen if gaps[stop] else missing
+            piece = elements[start:stop]
+            found = self.candidates.get(piece)
+            if found:
+                for char, cost in found:
+                    options.append((length, char, cost + inside + cut))
+            else:
+                options.append((length, UNKNOWN, UNKNOWN_COST + inside + cut))
+        options = heapq.nsmallest(OPTIONS, options, key=lambda option: option[2])
+        return [option for option in options if option[2] <= options[0][2] + MARGIN]
+
+    def decode(self, code, alternatives=2):
+        """Return [Hypothesis(text, cost)]: the best reading first, then up
+        to `alternatives` runners-up."""
+        elements, gaps, words = self._parse(code)
+        cuts = self._cut_costs(elements, gaps, words)
+        model = self.model
+        weight = self.model_weight
+        keep = alternatives + 1
+        scores = self._scores
+        span = model.order - 1
+        # beams[k]: context -> [(cost, node)] for hypotheses ending before
+        # element k; a node is (char, parent node)
+        beams = collections.defaultdict(dict)
+        beams[0][''] = [(0.0, None)]
+        for position in range(len(elements) + 1):
+            beam = beams.pop(position, None)
+            if not beam:
+                continue
+            hypotheses = self._prune(beam)
+            for _ in range(words[position]):
+                hypotheses = [self._extend(model, weight, span, cost, context, node, ' ')
+                              for cost, context, node in hypotheses]
+            if position == len(elements):
+                return self._finish(hypotheses, keep)
+            for length, char, emission in self._options(elements, gaps, words, position, cuts):
+                target = beams[position + length]
+                for cost, context, node in hypotheses:
+                    score = scores.get((context, char))
+                    if score is None:
+                        score = scores[context, char] = weight * model.cost(context, char)
+                    cost += emission + score
+                    next_context = (context + char)[-span:] if span else ''
+                    # Up to `keep` hypotheses per context, cheapest first,
+                    # for the alternatives
+                    entries = target.get(next_context)
+                    if entries is None:
+                        target[next_context] = [(cost, (char, node))]
+                    elif len(entries) < keep:
+                        entries.append((cost, (char, node)))
+                        entries.sort(key=_cost)
+                    elif cost < entries[-1][0]:
+                        entries[-1] = (cost, (char, node))
+                        entries.sort(key=_cost)
+        return [Hypothesis('', 0.0)]
+
+    @staticmethod
+    def _extend(model, weight, span, cost, context, node, char):
+        cost += weight * model.cost(context, char)
+        context = (context + char)[-span:] if span else ''
+        return cost, context, (char, node)
+
+    def _prune(self, beam):
+        hypotheses = [(cost, context, node)
+                      for context, entries in beam.items() for cost, node in entries]
+        hypotheses = heapq.nsmallest(self.beam, hypotheses, key=_cost)
+        best = hypotheses[0][0]
+        return [h for h in hypotheses if h[0] <= best + MARGIN]
+
+    def _finish(self, hypotheses, keep):
+        results = []
+        seen = set()
+        for cost, _, node in sorted(hypotheses, key=_cost):
+            chars = []
+            while node is not None:
+                chars.append(node[0])
+                node = node[1]
+            text = ''.join(reversed(chars))
+            if text not in seen:
+                seen.add(text)
+                results.append(Hypothesis(text, cost))
+                if len(results) == keep:
+                    break
+        return results
+
+
+robust_decoder = None                      # no model; built on first use
+_decoders = collections.OrderedDict()      # model -> RobustDecoder
+
+
+def model_decoder(model):
+    """The shared RobustDecoder for a language model, so its candidate
+    table and scores are built once per model."""
+    global robust_decoder
+    if model is None:
+        if robust_decoder is None:
+            robust_decoder = RobustDecoder(REVERSE_MORSE_CODE_DICT)
+        return robust_decoder
+    decoder = _decoders.get(model)
+    if decoder is None:
+        decoder = _decoders[model] = RobustDecoder(REVERSE_MORSE_CODE_DICT, model)
+        if len(_decoders) > MAX_DECODERS:
+            _decoders.popitem(last=False)
+    else:
+        _decoders.move_to_end(model)
+    return decoder
+
+
+def decode_robust(code, alternatives=2, model=None):
+    return model_decoder(model).decode(code, alternatives)
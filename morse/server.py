@@ -0,0 +1,352 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import os
+import signal
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+from . import codec
+
+# ----------------------
+# Local encode / decode / render service (stdlib asyncio, no framework)
+#
+#   python -m morse.server [--host 127.0.0.1] [--port 8765]
+#
+#   POST /encode               text in, Morse out
+#   POST /decode               Morse in, text out
+#   POST /render?wpm=20&...    Morse in (or text with ?text=1), WAV out;
+#                              ?clips=1 assembles it from cached letter clips
+#   GET  /ws/encode, /ws/decode
+#                              WebSocket: every text message is converted
+#                              and answered in order
+#
+# Rendering, and encoding/decoding of large bodies, run on a process
+# pool so the event loop keeps serving.  At most max_pending HTTP
+# requests are in flight; past that the server answers 503 straight
+# away instead of queueing without bound.  A WebSocket handles one
+# message at a time and waits for the client to drain each reply.
+# ----------------------
+
+HOST = '127.0.0.1'
+PORT = 8765
+MAX_PENDING = 256
+MAX_BODY = 16 << 20
+INLINE_LIMIT = 64 << 10       # bodies above this are converted off the loop
+# Render options and the range each must fall in; slower keying or a
+# higher rate would let one small request ask for gigabytes of audio
+RENDER_OPTIONS = {'wpm': (float, 5, 60), 'farnsworth_wpm': (float, 5, 60),
+                  'frequency': (float, 100, 4000), 'sample_rate': (int, 8000, 48000),
+                  'amplitude': (float, 0, 1)}
+FLAGS = {'1': True, 'true': True, 'yes': True, 'on': True,
+         '0': False, 'false': False, 'no': False, 'off': False, '': False}
+_WEBSOCKET_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC11B85'
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            411: 'Length Required', 413: 'Payload Too Large', 500: 'Internal Server Error',
+            503: 'Service Unavailable'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=''):
+        super().__init__(message or _REASONS.get(status, ''))
+        self.status = status
+
+
+# Run in the worker processes
+def _convert(command, text):
+    if command == 'encode':
+        return codec.encode_to_morse(text)
+    return codec.decode_from_morse(text)
+
+
+def _render_wav(text, options, clips=False, encode=False):
+    # encode: text is plain text, encoded here rather than on the loop.
+    # clips: assemble from cached per-letter clips (kept per worker
+    # process) instead of synthesizing every sample
+    morse_code = codec.encode_to_morse(text) if encode else text
+    if clips:
+        from .clips import write_wav
+    else:
+        from .tone import write_wav
+    target = io.BytesIO()
+    write_wav(target, morse_code, **options)
+    return target.getvalue()
+
+
+def _option(query, name):
+    kind, low, high = RENDER_OPTIONS[name]
+    try:
+        value = kind(query[name])
+    except ValueError:
+        raise ValueError(f"{name} must be a number") from None
+    if not low <= value <= high:
+        raise ValueError(f"{name} must be between {low} and {high}")
+    return value
+
+
+def _flag(query, name):
+    value = query.get(name, '0').strip().lower()
+    if value not in FLAGS:
+        raise ValueError(f"{name} must be 1 or 0")
+    return FLAGS[value]
+
+
+class MorseServer:
+    def __init__(self, host=HOST, port=PORT, workers=None, max_pending=MAX_PENDING):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.pending = 0
+        self.executor = None
+        self.server = None
+        self.connections = set()
+
+    async def start(self):
+        self.executor = ProcessPoolExecutor(self.workers)
+        self.server = await asyncio.start_server(self.handle, self.host, self.port,
+                                                 limit=MAX_BODY)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        # Keep-alive and WebSocket connections would otherwise stay open
+        for task in self.connections:
+            task.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def _offload(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    # ----------------------
+    # HTTP
+    # ----------------------
+
+    async def handle(self, reader, writer):
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, query, headers, body = request
+                if headers.get('upgrade', '').lower() == 'websocket':
+                    await self._websocket(reader, writer, path, headers)
+                    break
+                status, content_type, payload = await self._dispatch(method, path, query, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._respond(writer, status, content_type, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except HTTPError as error:
+            self._respond(writer, error.status, 'text/plain; charset=utf-8',
+                          str(error).encode('utf-8'), False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass                          # close(); end the connection quietly
+        finally:
+            self.connections.discard(task)
+            writer.close()
+
+    async def _read_request(self, reader):
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise HTTPError(413, "headers too large")
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, _ = lines[0].split(' ', 2)
+        except ValueError:
+            raise HTTPError(400, "bad request line")
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        length = headers.get('content-length')
+        if length is None:
+            if method == 'POST':
+                raise HTTPError(411)
+            body = b''
+        else:
+            if not length.isdigit():
+                raise HTTPError(400, "bad Content-Length")
+            if int(length) > MAX_BODY:
+                raise HTTPError(413)
+            body = await reader.readexactly(int(length))
+        url = urlsplit(target)
+        return method, url.path, dict(parse_qsl(url.query)), headers, body
+
+    async def _dispatch(self, method, path, query, body):
+        if path not in ('/encode', '/decode', '/render'):
+            return 404, 'text/plain; charset=utf-8', b'not found'
+        if method != 'POST':
+            return 405, 'text/plain; charset=utf-8', b'use POST'
+        if self.pending >= self.max_pending:
+            return 503, 'text/plain; charset=utf-8', b'busy, retry later'
+        self.pending += 1
+        try:
+            text = body.decode('utf-8', 'replace')
+            if path == '/render':
+                return 200, 'audio/wav', await self._render(text, query)
+            command = path[1:]
+            if len(text) > INLINE_LIMIT:
+                result = await self._offload(_convert, command, text)
+            else:
+                result = _convert(command, text)
+            return 200, 'text/plain; charset=utf-8', result.encode('utf-8')
+        except ValueError as error:
+            return 400, 'text/plain; charset=utf-8', str(error).encode('utf-8')
+        except Exception as error:
+            return 500, 'text/plain; charset=utf-8', repr(error).encode('utf-8')
+        finally:
+            self.pending -= 1
+
+    async def _render(self, text, query):
+        options = {name: _option(query, name) for name in RENDER_OPTIONS if name in query}
+        return await self._offload(_render_wav, text, options, _flag(query, 'clips'),
+                                   _flag(query, 'text'))
+
+    @staticmethod
+    def _respond(writer, status, content_type, payload, keep_alive):
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode('latin-1') + b'\r\n' + payload)
+
+    # ----------------------
+    # WebSocket (RFC 6455, text messages only)
+    # ----------------------
+
+    async def _websocket(self, reader, writer, path, headers):
+        command = {'/ws/encode': 'encode', '/ws/decode': 'decode'}.get(path)
+        key = headers.get('sec-websocket-key')
+        if command is None or key is None:
+            raise HTTPError(404 if command is None else 400)
+        accept = base64.b64encode(hashlib.sha1(key.encode('ascii') + _WEBSOCKET_GUID).digest())
+        writer.write(b'HTTP/1.1 101 Switching Protocols\r\n'
+                     b'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+                     b'Sec-WebSocket-Accept: ' + accept + b'\r\n\r\n')
+        await writer.drain()
+        while True:
+            try:
+                opcode, payload = await read_frame(reader)
+            except ValueError:
+                writer.write(frame(0x8, struct.pack('!H', 1009)))
+                await writer.drain()
+                return
+            if opcode == 0x8:
+                writer.write(frame(0x8, payload[:2]))
+                await writer.drain()
+                return
+            if opcode == 0x9:
+                writer.write(frame(0xA, payload))
+            elif opcode in (0x1, 0x2):
+                text = payload.decode('utf-8', 'replace')
+                if len(text) > INLINE_LIMIT:
+                    result = await self._offload(_convert, command, text)
+                else:
+                    result = _convert(command, text)
+                writer.write(frame(0x1, result.encode('utf-8')))
+            await writer.drain()
+
+
+def frame(opcode, payload, mask=None):
+    """Build one final WebSocket frame; clients pass a 4 byte mask."""
+    length = len(payload)
+    if length < 126:
+        head = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 1 << 16:
+        head = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        head = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    if mask is None:
+        return head + payload
+    return bytes([head[0], head[1] | 0x80]) + head[2:] + mask + _unmask(payload, mask)
+
+
+def _unmask(payload, mask):
+    # XOR against the repeated mask as one big integer, not byte by byte
+    repeated = (mask * (len(payload) // 4 + 1))[:len(payload)]
+    value = int.from_bytes(payload, 'big') ^ int.from_bytes(repeated, 'big')
+    return value.to_bytes(len(payload), 'big')
+
+
+async def read_frame(reader):
+    """Read one WebSocket message, joining fragments; returns (opcode, payload)."""
+    message = []
+    opcode = None
+    total = 0
+    while True:
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            length, = struct.unpack('!H', await reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack('!Q', await reader.readexactly(8))
+        # The whole message is held to MAX_BODY, not just each fragment
+        total += length
+        if total > MAX_BODY:
+            raise ValueError("message too large")
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(length)
+        if mask is not None:
+            payload = _unmask(payload, mask)
+        kind = first & 0x0F
+        if kind >= 0x8:
+            return kind, payload          # control frames are never fragmented
+        if kind:
+            opcode = kind
+        message.append(payload)
+        if first & 0x80:
+            return opcode, b''.join(message)
+
+
+async def serve(host=HOST, port=PORT, workers=None, max_pending=MAX_PENDING):
+    server = await MorseServer(host, port, workers, max_pending).start()
+    print(f"Morse service on http://{server.host}:{server.port}", flush=True)
+    # Shut the worker processes down cleanly on Ctrl+C or SIGTERM
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except NotImplementedError:
+            pass                          # Windows: Ctrl+C still interrupts
+    try:
+        await stop.wait()
+    finally:
+        server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m morse.server',
+                                     description="Serve Morse encode/decode/render over HTTP and WebSocket.")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('-j', '--workers', type=int, default=0,
+                        help="render processes (0: one per core)")
+    parser.add_argument('--max-pending', type=int, default=MAX_PENDING)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers or None, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import platform
+import time
+
+# ----------------------
+# Morse Sound Player (Windows only, winsound)
+# ----------------------
+
+AVAILABLE = platform.system() == 'Windows'
+UNIT = 100          # time unit in milliseconds
+FREQUENCY = 700
+
+
+def timeline(morse_code, unit=UNIT):
+    """Yield (index, tone, milliseconds) for each step of a Morse string.
+
+    Every symbol is followed by a one unit gap, as play_morse_sound does.
+    """
+    for index, char in enumerate(morse_code):
+        if char == '.':
+            yield index, True, unit             # dot = 1 unit
+        elif char == '-':
+            yield index, True, unit * 3         # dash = 3 units
+        elif char == ' ':
+            yield index, False, unit * 3        # space between letters
+        elif char == '/':
+            yield index, False, unit * 7        # space between words
+        else:
+            yield index, False, unit            # unknown
+        yield index, False, unit                # gap between symbols
+
+
+def play_morse_sound(morse_code, unit=UNIT, frequency=FREQUENCY):
+    if not AVAILABLE:
+        print("❌ Morse sound beeps supported only on Windows (winsound).")
+        return
+    import winsound
+    for _, tone, ms in timeline(morse_code, unit):
+        if tone:
+            winsound.Beep(frequency, ms)
+        else:
+            time.sleep(ms / 1000.0)
@@ -0,0 +1,488 @@
+import collections
+import hashlib
+import itertools
+import os
+import tempfile
+import threading
+import time
+
+from . import instrument
+from .dispatch import UIDispatch
+from .paths import cache_dir
+
+# ----------------------
+# Text-to-speech (pyttsx3 for English, gTTS + playsound for Urdu)
+#
+# The backends are imported on first use so the core package never
+# needs them.  Synthesized audio is kept in a content-addressed on-disk
+# cache, so repeating a phrase costs no network round trip.
+#
+# Set MORSE_TTS=fake to speak through FakeBackend instead: no network,
+# no audio device, but realistic delays.
+# ----------------------
+
+CACHE_BYTES = 64 * 1024 * 1024
+LOOKAHEAD = 1           # prepared utterances waiting behind the one playing
+METRIC_SAMPLES = 1000   # latest timings kept per pipeline metric
+
+
+def default_cache_dir():
+    return cache_dir('morse-tts')
+
+
+# ----------------------
+# Backends
+# ----------------------
+
+class GTTSBackend:
+    name = 'gtts'
+    extension = '.mp3'
+
+    def synthesize(self, text, lang, voice, path):
+        from gtts import gTTS
+        tld = voice or 'com'
+        gTTS(text=text, lang=lang, tld=tld).save(path)
+
+    def play(self, path, cancelled):
+        # playsound cannot be interrupted; cancelling waits for the end
+        import playsound
+        playsound.playsound(path)
+
+
+class StubBackend:
+    """Offline stand-in that writes the request itself as the 'audio'."""
+
+    name = 'stub'
+    extension = '.txt'
+
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize(self, text, lang, voice, path):
+        self.calls += 1
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"{lang}\n{voice}\n{text}")
+
+    def play(self, path, cancelled):
+        pass
+
+
+class FakeBackend:
+    """Offline backend with made-up but realistic timing: synthesis takes
+    latency plus synth_per_char a character (a network round trip), and
+    playing waits seconds_per_char a character, or until cancelled."""
+
+    name = 'fake'
+    extension = '.fake'
+
+    def __init__(self, latency=0.3, synth_per_char=0.002, seconds_per_char=0.06):
+        self.latency = latency
+        self.synth_per_char = synth_per_char
+        self.seconds_per_char = seconds_per_char
+        self.calls = 0
+
+    def synthesize(self, text, lang, voice, path):
+        self.calls += 1
+        time.sleep(self.latency + self.synth_per_char * len(text))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"{self.seconds_per_char * len(text)}\n{lang}\n{text}")
+
+    def play(self, path, cancelled):
+        with open(path, encoding='utf-8') as f:
+            seconds = float(f.readline())
+        cancelled.wait(seconds)
+
+
+# ----------------------
+# On-disk LRU cache
+# ----------------------
+
+class SpeechCache:
+    """Synthesized speech files keyed by (backend, text, language, voice).
+
+    Entries are evicted least recently used first once the directory
+    grows past max_bytes.  Recency is the file's mtime, refreshed on every
+    hit, so it survives restarts.  Files are written under a unique
+    temporary name and renamed into place, so concurrent requests for the
+    same phrase never see a half-written file.
+    """
+
+    def __init__(self, directory=None, max_bytes=CACHE_BYTES, backend=None):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.backend = backend or GTTSBackend()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()   # path -> size, oldest first
+        self._inflight = {}                         # path -> Event
+        self._size = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.backend.extension):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+        for _, path, size in sorted(files):
+            self._entries[path] = size
+            self._size += size
+
+    def key(self, text, lang, voice=None):
+        raw = '\0'.join((self.backend.name, lang, voice or '', text))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def path(self, text, lang, voice=None):
+        return os.path.join(self.directory, self.key(text, lang, voice) + self.backend.extension)
+
+    def get(self, text, lang='en', voice=None):
+        """Return the path of an audio file for text, synthesizing on a miss."""
+        path = self.path(text, lang, voice)
+        while True:
+            with self._lock:
+                if path in self._entries and os.path.exists(path):
+                    self._entries.move_to_end(path)
+                    self.hits += 1
+                    os.utime(path)
+                    return path
+                pending = self._inflight.get(path)
+                if pending is None:
+                    self.misses += 1
+                    self._inflight[path] = threading.Event()
+                    break
+            # Someone else is synthesizing this phrase; wait for it
+            pending.wait()
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.part')
+        os.close(fd)
+        try:
+            self.backend.synthesize(text, lang, voice, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            with self._lock:
+                self._inflight.pop(path).set()
+            raise
+
+        with self._lock:
+            self._inflight.pop(path).set()
+            self._size -= self._entries.pop(path, 0)
+            self._entries[path] = os.path.getsize(path)
+            self._size += self._entries[path]
+            self._evict(keep=path)
+        return path
+
+    def _evict(self, keep):
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            path, size = next(iter(self._entries.items()))
+            if path == keep:
+                break
+            del self._entries[path]
+            self._size -= size
+            self.evictions += 1
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._size,
+            }
+
+
+# ----------------------
+# Speaking
+# ----------------------
+
+_engine = None
+_engine_lock = threading.Lock()
+_cache = None
+
+
+def get_engine():
+    # pyttsx3.init() is slow; one engine is created and reused
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            import pyttsx3
+            _engine = pyttsx3.init()
+        return _engine
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        _cache = SpeechCache()
+    return _cache
+
+
+def speak_text(text):
+    # Blocking; the GUIs go through get_pipeline() instead
+    engine = get_engine()
+    with _engine_lock:
+        engine.say(text)
+        engine.runAndWait()
+
+
+def speak_urdu(text, cache=None):
+    import playsound
+    path = (cache or get_cache()).get(text, lang='ur')
+    playsound.playsound(path)
+
+
+# ----------------------
+# Speech pipeline
+#
+# SpeechPipeline speaks queued requests on two background threads, so
+# the Tk loop never waits on pyttsx3, gTTS or playsound.  One prepares
+# requests in order (synthesis through the cache) while the other plays
+# them, so the next phrase is ready by the time the current one ends.
+# cancel() and stop() drop queued requests at once; the one playing is
+# interrupted where the backend allows it (pyttsx3 at the next word,
+# FakeBackend at once) and otherwise runs to its end.  Jobs move between
+# the queues, `preparing` and `current` under one lock, which cancel()
+# and stop() take too, so a job is never out of their sight.  Callbacks
+# are dispatched to the Tk thread when attach() is used (UIDispatch).
+# ----------------------
+
+class EngineVoice:
+    """English through the shared pyttsx3 engine.  pyttsx3 synthesizes
+    as it speaks, so there is nothing to prepare ahead; the engine is
+    created on the playing thread and used only there."""
+
+    def prepare(self, job):
+        return None
+
+    def play(self, prepared, job):
+        engine = get_engine()
+        with _engine_lock:
+            if job.cancelled.is_set():
+                return
+
+            def word(name, location, length):
+                # Called on this thread from inside runAndWait(), the one
+                # place the engine may be stopped from
+                if job.cancelled.is_set():
+                    engine.stop()
+            token = engine.connect('started-word', word)
+            try:
+                engine.say(job.text)
+                engine.runAndWait()
+            finally:
+                engine.disconnect(token)
+
+    def interrupt(self):
+        # pyttsx3 is not thread safe: play() stops the engine itself once
+        # it sees job.cancelled
+        pass
+
+
+class CachedVoice:
+    """Speech files from a SpeechCache (the shared one by default),
+    played by the cache's backend."""
+
+    def __init__(self, cache=None):
+        self._cache = cache
+
+    @property
+    def cache(self):
+        return self._cache or get_cache()
+
+    def prepare(self, job):
+        return self.cache.get(job.text, job.lang, job.voice)
+
+    def play(self, path, job):
+        self.cache.backend.play(path, job.cancelled)
+
+    def interrupt(self):
+        pass
+
+
+class SpeechJob:
+    def __init__(self, job_id, text, lang, voice, on_start, on_done):
+        self.id = job_id
+        self.text = text
+        self.lang = lang
+        self.voice = voice
+        self.on_start = on_start
+        self.on_done = on_done
+        self.cancelled = threading.Event()
+        self.prepared = None        # what the voice made ready to play
+        self.error = None
+        # perf_counter() times of each stage
+        self.queued = time.perf_counter()
+        self.preparing = self.ready = self.started = self.finished = None
+
+
+class SpeechPipeline(UIDispatch):
+    def __init__(self, voices=None, lookahead=LOOKAHEAD):
+        # lang -> voice; the None entry speaks every other language
+        self.voices = voices if voices is not None else default_voices()
+        self.lookahead = lookahead
+        self._requests = collections.deque()
+        self._ready = collections.deque()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._requested = threading.Condition(self._lock)
+        self._readied = threading.Condition(self._lock)
+        self._taken = threading.Condition(self._lock)
+        self._threads = None
+        self.current = None
+        self.preparing = None
+        self._unfinished = 0
+        self.counts = dict.fromkeys(('spoken', 'cancelled', 'failed'), 0)
+        self.metrics = {name: collections.deque(maxlen=METRIC_SAMPLES)
+                        for name in ('queue_wait', 'synthesis', 'first_audio', 'gap')}
+        self._last_finished = None
+
+    def say(self, text, lang='en', voice=None, on_start=None, on_done=None):
+        """Queue text to be spoken; returns its job id at once.
+
+        on_start() is called when its audio starts and on_done(completed,
+        error) when it has finished, failed or been cancelled.
+        """
+        job = SpeechJob(next(self._ids), text, lang, voice, on_start, on_done)
+        with self._lock:
+            if self._threads is None:
+                self._threads = [
+                    threading.Thread(target=self._prepare_loop, name="morse-tts-prepare", daemon=True),
+                    threading.Thread(target=self._play_loop, name="morse-tts-play", daemon=True),
+                ]
+                for thread in self._threads:
+                    thread.start()
+            self._unfinished += 1
+            self._requests.append(job)
+            self._requested.notify()
+        return job.id
+
+    def cancel(self, job_id):
+        self._cancel(lambda job: job.id == job_id)
+
+    def stop(self):
+        """Cancel the utterance playing and everything queued behind it."""
+        self._cancel(lambda job: True)
+
+    def _cancel(self, matches):
+        with self._lock:
+            current = self.current
+            for job in itertools.chain((current, self.preparing), self._requests, self._ready):
+                if job is not None and matches(job):
+                    job.cancelled.set()
+        if current is not None and current.cancelled.is_set():
+            self._voice(current.lang).interrupt()
+
+    @property
+    def busy(self):
+        return self._unfinished > 0
+
+    def stats(self):
+        """Counts, and {'mean', 'p50', 'p95', 'max'} seconds per metric:
+        queue_wait (request to start of synthesis), synthesis, first_audio
+        (request to audio) and gap (silence between back-to-back
+        utterances)."""
+        result = dict(self.counts)
+        for name, values in self.metrics.items():
+            values = sorted(values)
+            if values:
+                result[name] = {'mean': sum(values) / len(values),
+                                'p50': values[len(values) // 2],
+                                'p95': values[min(len(values) - 1, int(len(values) * 0.95))],
+                                'max': values[-1]}
+        return result
+
+    # ----------------------
+    # Workers
+    # ----------------------
+
+    def _voice(self, lang):
+        return self.voices.get(lang) or self.voices[None]
+
+    def _record(self, name, seconds):
+        self.metrics[name].append(seconds)
+        if instrument.enabled():
+            instrument.record(f"tts.{name}", seconds)
+
+    def _prepare_loop(self):
+        while True:
+            with self._lock:
+                while not self._requests:
+                    self._requested.wait()
+                job = self.preparing = self._requests.popleft()
+            if not job.cancelled.is_set():
+                job.preparing = time.perf_counter()
+                self._record('queue_wait', job.preparing - job.queued)
+                try:
+                    job.prepared = self._voice(job.lang).prepare(job)
+                except Exception as error:
+                    job.error = error
+                job.ready = time.perf_counter()
+                self._record('synthesis', job.ready - job.preparing)
+            # Waits while `lookahead` utterances are already ready; a
+            # synthesis cut short by cancel() still finishes, into the cache
+            with self._lock:
+                while len(self._ready) >= self.lookahead:
+                    self._taken.wait()
+                self._ready.append(job)
+                self.preparing = None
+                self._readied.notify()
+
+    def _play_loop(self):
+        while True:
+            with self._lock:
+                while not self._ready:
+                    self._readied.wait()
+                job = self._ready.popleft()
+                self._taken.notify()
+                playing = job.error is None and not job.cancelled.is_set()
+                if playing:
+                    self.current = job
+            if playing:
+                job.started = time.perf_counter()
+                self._record('first_audio', job.started - job.queued)
+                if self._last_finished is not None and job.queued < self._last_finished:
+                    self._record('gap', job.started - self._last_finished)
+                self._dispatch(job.on_start)
+                try:
+                    self._voice(job.lang).play(job.prepared, job)
+                except Exception as error:
+                    job.error = error
+                job.finished = self._last_finished = time.perf_counter()
+                with self._lock:
+                    self.current = None
+            if job.error is not None:
+                self.counts['failed'] += 1
+            elif job.cancelled.is_set():
+                self.counts['cancelled'] += 1
+            else:
+                self.counts['spoken'] += 1
+            with self._lock:
+                self._unfinished -= 1
+            self._dispatch(job.on_done, job.error is None and not job.cancelled.is_set(),
+                           job.error)
+
+
+def default_voices():
+    if os.environ.get('MORSE_TTS') == 'fake':
+        return {None: CachedVoice(SpeechCache(backend=FakeBackend()))}
+    return {'en': EngineVoice(), None: CachedVoice()}
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def get_pipeline():
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = SpeechPipeline()
+        return _pipeline
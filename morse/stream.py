@@ -0,0 +1,85 @@
+from . import codec
+
+# ----------------------
+# Streaming encode / decode over file objects
+# ----------------------
+
+CHUNK_SIZE = 1 << 16
+
+
+def check_chunk_size(chunk_size):
+    # read(0) returns '' and read(-1) the whole file: neither is a chunk
+    if chunk_size < 1:
+        raise ValueError(f"chunk size must be at least 1, not {chunk_size}")
+
+
+def positive_int(value):
+    """argparse type for --chunk-size and the like."""
+    value = int(value)
+    if value < 1:
+        raise ValueError(value)
+    return value
+
+
+def iter_encode(fileobj, chunk_size=CHUNK_SIZE, encoder=None):
+    """Encode a text stream chunk by chunk, yielding pieces of Morse.
+
+    Line breaks are passed through, so every line comes out exactly as
+    encode_to_morse(line) would encode it, however the stream happens to
+    be chunked.
+    """
+    check_chunk_size(chunk_size)
+    return _iter_encode(fileobj, chunk_size, encoder or codec.encoder)
+
+
+def _iter_encode(fileobj, chunk_size, encoder):
+    at_line_start = True
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            return
+        out = []
+        for index, line in enumerate(chunk.split('\n')):
+            if index:
+                out.append('\n')
+                at_line_start = True
+            if line:
+                if not at_line_start:
+                    out.append(' ')
+                out.append(encoder.encode(line))
+                at_line_start = False
+        yield ''.join(out)
+
+
+def iter_decode(fileobj, chunk_size=CHUNK_SIZE, decoder=None):
+    """Decode a Morse stream chunk by chunk, yielding pieces of text.
+
+    A code cut off at the end of a chunk is carried over to the next one,
+    and line breaks are passed through, so every line comes out exactly
+    as decode_from_morse(line) would decode it.
+    """
+    check_chunk_size(chunk_size)
+    return _iter_decode(fileobj, chunk_size, decoder or codec.decoder)
+
+
+def _iter_decode(fileobj, chunk_size, decoder):
+    # Anything longer than the longest code decodes to '?' however much
+    # longer it gets, so a runaway token never needs to be kept whole.
+    carry_limit = max(chunk_size, decoder.longest + 1)
+    carry = ''
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        data = carry + chunk
+        if data[-1].isspace():
+            carry = ''
+        else:
+            carry = data.rsplit(None, 1)[-1]
+            data = data[:len(data) - len(carry)]
+            if len(carry) > carry_limit:
+                carry = carry[:carry_limit]
+        if data:
+            yield '\n'.join(map(decoder.decode_tokens, data.split('\n')))
+    if carry:
+        yield decoder.decode_tokens(carry)
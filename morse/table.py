@@ -0,0 +1,114 @@
+from types import MappingProxyType
+
+# ----------------------
+# International Morse code table
+# ----------------------
+
+MORSE_CODE_DICT = MappingProxyType({
+    'A': '.-',    'B': '-...',  'C': '-.-.',
+    'D': '-..',   'E': '.',     'F': '..-.',
+    'G': '--.',   'H': '....',  'I': '..',
+    'J': '.---',  'K': '-.-',   'L': '.-..',
+    'M': '--',    'N': '-.',    'O': '---',
+    'P': '.--.',  'Q': '--.-',  'R': '.-.',
+    'S': '...',   'T': '-',     'U': '..-',
+    'V': '...-',  'W': '.--',   'X': '-..-',
+    'Y': '-.--',  'Z': '--..',
+    '0': '-----', '1': '.----', '2': '..---',
+    '3': '...--', '4': '....-', '5': '.....',
+    '6': '-....', '7': '--...', '8': '---..',
+    '9': '----.',
+    '.': '.-.-.-', ',': '--..--', '?': '..--..',
+    "'": '.----.', '!': '-.-.--', '/': '-..-.',
+    '(': '-.--.', ')': '-.--.-', '&': '.-...',
+    ':': '---...', ';': '-.-.-.', '=': '-...-',
+    '+': '.-.-.', '-': '-....-', '_': '..--.-',
+    '"': '.-..-.', '$': '...-..-', '@': '.--.-.',
+    ' ': '/',     # space between words
+})
+
+REVERSE_MORSE_CODE_DICT = MappingProxyType({v: k for k, v in MORSE_CODE_DICT.items()})
+
+# ----------------------
+# Other Morse alphabets (see morse.alphabets for the compiled registry)
+# ----------------------
+
+# Digits and punctuation shared with International Morse
+_COMMON = {char: code for char, code in MORSE_CODE_DICT.items() if not char.isalpha()}
+
+# American (Railroad) Morse has spaced letters and long dashes, which a
+# '.'/'-' string can't show.  Here '_' is the space inside a letter,
+# '=' the long dash of L and '#' the longer dash of 0.
+AMERICAN_MORSE_DICT = MappingProxyType({
+    'A': '.-',    'B': '-...',  'C': '.._.',
+    'D': '-..',   'E': '.',     'F': '.-.',
+    'G': '--.',   'H': '....',  'I': '..',
+    'J': '-.-.',  'K': '-.-',   'L': '=',
+    'M': '--',    'N': '-.',    'O': '._.',
+    'P': '.....', 'Q': '..-.',  'R': '._..',
+    'S': '...',   'T': '-',     'U': '..-',
+    'V': '...-',  'W': '.--',   'X': '.-..',
+    'Y': '.._..', 'Z': '..._.',
+    '1': '.--.',  '2': '..-..', '3': '...-.',
+    '4': '....-', '5': '---',   '6': '......',
+    '7': '--..',  '8': '-....', '9': '-..-',
+    '0': '#',
+    '.': '..--..', ',': '.-.-', '?': '-..-.',
+    '!': '---.',  '&': '._...',
+    ' ': '/',
+})
+
+CYRILLIC_MORSE_DICT = MappingProxyType({
+    'А': '.-',    'Б': '-...',  'В': '.--',   'Г': '--.',
+    'Д': '-..',   'Е': '.',     'Ж': '...-',  'З': '--..',
+    'И': '..',    'Й': '.---',  'К': '-.-',   'Л': '.-..',
+    'М': '--',    'Н': '-.',    'О': '---',   'П': '.--.',
+    'Р': '.-.',   'С': '...',   'Т': '-',     'У': '..-',
+    'Ф': '..-.',  'Х': '....',  'Ц': '-.-.',  'Ч': '---.',
+    'Ш': '----',  'Щ': '--.-',  'Ъ': '--.--', 'Ы': '-.--',
+    'Ь': '-..-',  'Э': '..-..', 'Ю': '..--',  'Я': '.-.-',
+    **_COMMON,
+})
+
+GREEK_MORSE_DICT = MappingProxyType({
+    'Α': '.-',    'Β': '-...',  'Γ': '--.',   'Δ': '-..',
+    'Ε': '.',     'Ζ': '--..',  'Η': '....',  'Θ': '-.-.',
+    'Ι': '..',    'Κ': '-.-',   'Λ': '.-..',  'Μ': '--',
+    'Ν': '-.',    'Ξ': '-..-',  'Ο': '---',   'Π': '.--.',
+    'Ρ': '.-.',   'Σ': '...',   'Τ': '-',     'Υ': '-.--',
+    'Φ': '..-.',  'Χ': '----',  'Ψ': '--.-',  'Ω': '.--',
+    **_COMMON,
+})
+
+# Arabic Morse, with Persian پ for Urdu text
+ARABIC_MORSE_DICT = MappingProxyType({
+    'ا': '.-',    'ب': '-...',  'ت': '-',     'ث': '-.-.',
+    'ج': '.---',  'ح': '....',  'خ': '---',   'د': '-..',
+    'ذ': '--..',  'ر': '.-.',   'ز': '---.',  'س': '...',
+    'ش': '----',  'ص': '-..-',  'ض': '...-',  'ط': '..-',
+    'ظ': '-.--',  'ع': '.-.-',  'غ': '--.',   'ف': '..-.',
+    'ق': '--.-',  'ك': '-.-',   'ل': '.-..',  'م': '--',
+    'ن': '-.',    'ه': '..-..', 'و': '.--',   'ي': '..',
+    'ء': '.',     'پ': '.--.',
+    **_COMMON,
+})
+
+# Japanese Wabun code (katakana).  ゛ and ゜ are the voicing marks sent
+# after the kana they modify.
+WABUN_MORSE_DICT = MappingProxyType({
+    'ア': '--.--', 'イ': '.-',    'ウ': '..-',   'エ': '-.---', 'オ': '.-...',
+    'カ': '.-..',  'キ': '-.-..', 'ク': '...-',  'ケ': '-.--',  'コ': '----',
+    'サ': '-.-.-', 'シ': '--.-.', 'ス': '---.-', 'セ': '.---.', 'ソ': '---.',
+    'タ': '-.',    'チ': '..-.',  'ツ': '.--.',  'テ': '.-.--', 'ト': '..-..',
+    'ナ': '.-.',   'ニ': '-.-.',  'ヌ': '....',  'ネ': '--.-',  'ノ': '..--',
+    'ハ': '-...',  'ヒ': '--..-', 'フ': '--..',  'ヘ': '.',     'ホ': '-..',
+    'マ': '-..-',  'ミ': '..-.-', 'ム': '-',     'メ': '-...-', 'モ': '-..-.',
+    'ヤ': '.--',   'ユ': '-..--', 'ヨ': '--',
+    'ラ': '...',   'リ': '--.',   'ル': '-.--.', 'レ': '---',   'ロ': '.-.-',
+    'ワ': '-.-',   'ヰ': '.-..-', 'ヱ': '.--..', 'ヲ': '.---',  'ン': '.-.-.',
+    '゛': '..',    '゜': '..--.', 'ー': '.--.-', '、': '.-.-.-', '」': '.-.-..',
+    '（': '-.--.-', '）': '.-..-.',
+    '1': '.----', '2': '..---', '3': '...--', '4': '....-', '5': '.....',
+    '6': '-....', '7': '--...', '8': '---..', '9': '----.', '0': '-----',
+    ' ': '/',
+})
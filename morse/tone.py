@@ -0,0 +1,133 @@
+import math
+import wave
+
+import numpy as np
+
+# ----------------------
+# Vectorized CW tone synthesizer
+#
+# Morse is first turned into a unit-level keying string ('1' = key down,
+# '0' = key up), then into runs of on/off time, and the whole message is
+# synthesized in a few NumPy passes: one np.repeat for the envelope and
+# in-place multiplies for amplitude and carrier.
+# ----------------------
+
+WPM = 12              # 100 ms units, the speed play_morse_sound uses
+FREQUENCY = 700
+SAMPLE_RATE = 8000
+RISE_TIME = 0.005     # raised-cosine edge length in seconds
+
+_KEYING = str.maketrans({
+    '.': '10',        # dot, then the 1 unit gap between elements
+    '-': '1110',      # dash, then the 1 unit gap between elements
+    ' ': '00',        # letter gap: 3 units with the trailing element gap
+    '/': '000000',    # word gap: 7 units with the trailing element gap
+})
+_NOT_KEYING = bytes(c for c in range(256) if c not in b'01')
+
+
+def unit_seconds(wpm):
+    # PARIS timing: one dot unit is 1.2 / wpm seconds
+    return 1.2 / wpm
+
+
+def farnsworth_unit_seconds(wpm, farnsworth_wpm):
+    # ARRL Farnsworth timing: letter and word gaps are stretched so the
+    # overall speed is farnsworth_wpm while characters stay at wpm.
+    if not farnsworth_wpm or farnsworth_wpm >= wpm:
+        return unit_seconds(wpm)
+    delay = (60 * wpm - 37.2 * farnsworth_wpm) / (farnsworth_wpm * wpm)
+    return delay / 19
+
+
+def keying_units(morse_code):
+    """Return the unit-level keying of a Morse string as a uint8 array."""
+    code = ' '.join(morse_code.split()).replace(' / ', '/')
+    keyed = code.translate(_KEYING).encode('ascii', 'ignore').translate(None, _NOT_KEYING)
+    return np.frombuffer(keyed, dtype=np.uint8) - ord('0')
+
+
+def keying_runs(morse_code, wpm=WPM, farnsworth_wpm=None):
+    """Return (states, durations) for the on/off runs of a Morse string.
+
+    states is a bool array, durations the length of each run in seconds.
+    """
+    units = keying_units(morse_code)
+    if not len(units):
+        return np.zeros(0, dtype=bool), np.zeros(0)
+    edges = np.flatnonzero(np.diff(units)) + 1
+    starts = np.concatenate(([0], edges))
+    lengths = np.diff(np.concatenate((starts, [len(units)])))
+    states = units[starts].astype(bool)
+
+    durations = lengths * unit_seconds(wpm)
+    gaps = ~states & (lengths > 1)
+    durations[gaps] = lengths[gaps] * farnsworth_unit_seconds(wpm, farnsworth_wpm)
+    return states, durations
+
+
+def keying_envelope(morse_code, wpm=WPM, farnsworth_wpm=None,
+                    sample_rate=SAMPLE_RATE, rise_time=RISE_TIME):
+    """Return the keying envelope (0..1, float32) sampled at sample_rate."""
+    states, durations = keying_runs(morse_code, wpm, farnsworth_wpm)
+    # Round the running total rather than each run so timing never drifts
+    bounds = np.round(np.cumsum(durations) * sample_rate).astype(np.int64)
+    counts = np.diff(np.concatenate(([0], bounds)))
+    envelope = np.repeat(states.astype(np.float32), counts)
+
+    on = states & (counts > 1)
+    ramp_len = min(int(rise_time * sample_rate), int(counts[on].min()) // 2) if on.any() else 0
+    if ramp_len > 0:
+        starts = (bounds - counts)[on]
+        ramp = (0.5 - 0.5 * np.cos(np.pi * (np.arange(ramp_len) + 0.5) / ramp_len)).astype(np.float32)
+        envelope[starts[:, None] + np.arange(ramp_len)] = ramp
+        envelope[bounds[on][:, None] - ramp_len + np.arange(ramp_len)] = ramp[::-1]
+    return envelope
+
+
+def _apply_carrier(samples, frequency, sample_rate):
+    # A tone whose period is a whole number of samples is applied one
+    # cycle block at a time through a reshaped view, instead of
+    # evaluating sin() for every sample.
+    if float(frequency).is_integer():
+        period = sample_rate // math.gcd(int(sample_rate), int(frequency))
+        if period <= sample_rate:
+            cycle = np.sin(2 * np.pi * frequency * np.arange(period) / sample_rate).astype(np.float32)
+            whole = len(samples) - len(samples) % period
+            samples[:whole].reshape(-1, period)[...] *= cycle
+            samples[whole:] *= cycle[:len(samples) - whole]
+            return samples
+    phase = (2 * np.pi * frequency / sample_rate) * np.arange(len(samples))
+    samples *= np.sin(phase).astype(np.float32)
+    return samples
+
+
+def render(morse_code, wpm=WPM, farnsworth_wpm=None, frequency=FREQUENCY,
+           sample_rate=SAMPLE_RATE, amplitude=0.8, rise_time=RISE_TIME):
+    """Synthesize a Morse string as float32 samples in [-amplitude, amplitude]."""
+    samples = keying_envelope(morse_code, wpm, farnsworth_wpm, sample_rate, rise_time)
+    samples *= amplitude
+    return _apply_carrier(samples, frequency, sample_rate)
+
+
+def to_pcm16(samples):
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def render_pcm16(morse_code, **options):
+    return to_pcm16(render(morse_code, **options))
+
+
+def write_wav(target, morse_code, sample_rate=SAMPLE_RATE, **options):
+    """Render a Morse string to a mono 16-bit WAV file (path or file object)."""
+    pcm = render_pcm16(morse_code, sample_rate=sample_rate, **options)
+    return write_pcm16(target, pcm, sample_rate)
+
+
+def write_pcm16(target, pcm, sample_rate=SAMPLE_RATE):
+    with wave.open(target, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return len(pcm) / sample_rate
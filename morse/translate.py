@@ -0,0 +1,191 @@
+import gc
+import hashlib
+import json
+import os
+import re
+import threading
+
+from .paths import cache_dir
+
+# ----------------------
+# English to Urdu phrase translation
+#
+# The dictionary is a tab-separated file of English phrases and their
+# Urdu (morse/english_urdu.tsv, or the file named by MORSE_URDU_DICT).
+# It is read once, on the first translation, into a word trie, and the
+# trie is saved as JSON to a cache file keyed by the dictionary's path,
+# size and mtime, so later runs skip the parsing.  JSON, not pickle: the
+# cache directory is only as trusted as the user's ~/.cache, and loading
+# a pickle from it could run any code.
+#
+# Text is split into words and punctuation; at each word the longest
+# phrase in the trie wins, and a word no phrase covers is kept as it is.
+# ----------------------
+
+# Built-in sample, used when the dictionary file is missing
+ENGLISH_URDU_DICT = {
+    'HELLO': 'ہیلو',
+    'WORLD': 'دنیا',
+    'GOOD': 'اچھا',
+    'MORNING': 'صبح بخیر',
+    'TEST': 'جانچ',
+    'LOVE': 'محبت',
+    'PEACE': 'امن',
+    'HOW ARE YOU': 'آپ کیسے ہیں؟'
+}
+
+NOT_AVAILABLE = "🔍 ترجمہ دستیاب نہیں"
+
+DICTIONARY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'english_urdu.tsv')
+CACHE_VERSION = 2
+_TOKEN = re.compile(r"\w+(?:'\w+)*|\S")
+_PUNCTUATION = {',': '،', '?': '؟', ';': '؛', '.': '۔'}
+_END = ''           # trie key of a phrase's translation; never a word
+
+
+def default_cache_dir():
+    return cache_dir('morse-translate')
+
+
+def read_dictionary(path):
+    """Yield (english, urdu) pairs from a tab-separated dictionary file."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#') or '\t' not in line:
+                continue
+            english, urdu = line.rstrip('\r\n').split('\t', 1)
+            if english.strip() and urdu.strip():
+                yield english, urdu.strip()
+
+
+def build_trie(pairs):
+    # word -> child node; a node that ends a phrase holds its
+    # translation under _END
+    trie = {}
+    for english, urdu in pairs:
+        node = trie
+        for word in _TOKEN.findall(english.upper()):
+            child = node.get(word)
+            if child is None:
+                child = node[word] = {}
+            node = child
+        if node is not trie:
+            node[_END] = urdu
+    return trie
+
+
+def load_trie(path=DICTIONARY, cache_dir=None):
+    """Trie of the dictionary at path, from the cache when it is current."""
+    # Building or loading a large trie makes a few hundred thousand
+    # dicts that all live on; the cyclic GC passes on the way are wasted
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _load_trie(path, cache_dir)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _load_trie(path, cache_dir):
+    stat = os.stat(path)
+    key = repr((CACHE_VERSION, os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+    cache = os.path.join(cache_dir or default_cache_dir(),
+                         hashlib.sha256(key.encode('utf-8')).hexdigest()[:32] + '.json')
+    try:
+        with open(cache, encoding='utf-8') as f:
+            trie = json.load(f)
+        if isinstance(trie, dict):
+            return trie
+    except Exception:
+        pass            # missing, truncated or corrupt: rebuild it
+    trie = build_trie(read_dictionary(path))
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        partial = f"{cache}.{os.getpid()}.tmp"
+        with open(partial, 'w', encoding='utf-8') as f:
+            # dumps, not dump: only dumps runs the C encoder
+            f.write(json.dumps(trie, ensure_ascii=False, separators=(',', ':')))
+        os.replace(partial, cache)
+    except OSError:
+        pass            # read-only cache dir: parse again next run
+    return trie
+
+
+class PhraseTranslator:
+    """Greedy longest-match phrase translator over a word trie."""
+
+    def __init__(self, trie):
+        self.trie = trie
+
+    @classmethod
+    def from_dict(cls, phrases):
+        return cls(build_trie(phrases.items()))
+
+    def segments(self, text):
+        """Yield (english, urdu) per segment; urdu is None when no
+        phrase covers the word."""
+        tokens = _TOKEN.findall(text.upper())
+        trie = self.trie
+        count = len(tokens)
+        i = 0
+        while i < count:
+            node = trie
+            end = translation = None
+            j = i
+            while j < count:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _END in node:
+                    end, translation = j, node[_END]
+            if end is None:
+                yield tokens[i], None
+                i += 1
+            else:
+                yield ' '.join(tokens[i:end]), translation
+                i = end
+
+    def translate(self, text):
+        """Urdu for text, or NOT_AVAILABLE when no word is in the dictionary."""
+        parts = []
+        found = False
+        for english, urdu in self.segments(text):
+            if urdu is not None:
+                found = True
+                parts.append(' ' + urdu)
+            elif not english[0].isalnum():
+                mark = _PUNCTUATION.get(english, english)
+                # Phrases such as HOW ARE YOU already carry their ؟
+                if not (parts and parts[-1].endswith(mark)):
+                    parts.append(mark)
+            else:
+                parts.append(' ' + english)
+        return ''.join(parts).lstrip() if found else NOT_AVAILABLE
+
+
+# ----------------------
+# Default translator, loaded on first use
+# ----------------------
+
+_translator = None
+_lock = threading.Lock()
+
+
+def get_translator():
+    global _translator
+    if _translator is None:
+        with _lock:
+            if _translator is None:
+                path = os.environ.get('MORSE_URDU_DICT', DICTIONARY)
+                try:
+                    _translator = PhraseTranslator(load_trie(path))
+                except (OSError, UnicodeDecodeError):
+                    # Missing or not UTF-8: the built-in phrases still work
+                    _translator = PhraseTranslator.from_dict(ENGLISH_URDU_DICT)
+    return _translator
+
+
+def manual_translate_to_urdu(text):
+    return get_translator().translate(text)
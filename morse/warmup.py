@@ -0,0 +1,74 @@
+import importlib
+import os
+import threading
+import time
+
+# ----------------------
+# Background warm-up for the GUIs
+#
+# The GUI scripts import numpy, matplotlib and the speech backends on
+# first use, so the window comes up without waiting for them.  Once it
+# is up, warm_up() imports them on a daemon thread so the first click
+# does not pay for them either.  It only imports: objects tied to the
+# Tk thread (the matplotlib canvas, the pyttsx3 engine) are still made
+# there, from on_done or on first use.
+#
+# Set MORSE_WARMUP=0 to skip it.
+# ----------------------
+
+PLOT_MODULES = ('numpy', 'matplotlib.figure', 'matplotlib.animation',
+                'matplotlib.backends.backend_tkagg')
+SPEECH_MODULES = ('pyttsx3', 'gtts', 'playsound')
+DELAY_MS = 200          # let the window draw first
+POLL_MS = 100
+
+
+class WarmUp:
+    def __init__(self, modules):
+        self.modules = modules
+        self.seconds = {}       # module -> import seconds
+        self.missing = []       # modules that are not installed
+        self.done = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self.run, name="morse-warmup", daemon=True).start()
+        return self
+
+    def run(self):
+        for name in self.modules:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception:
+                # Optional backends may be missing or fail to load; the
+                # feature reports it when it is actually used
+                self.missing.append(name)
+            else:
+                self.seconds[name] = time.perf_counter() - start
+        self.done.set()
+
+
+def enabled():
+    return os.environ.get('MORSE_WARMUP', '1') != '0'
+
+
+def warm_up(root, modules, on_done=None):
+    """Import modules in the background once root's window is shown;
+    on_done(warm) then runs on the Tk thread.  Returns None when
+    MORSE_WARMUP=0."""
+    if not enabled():
+        return None
+    warm = WarmUp(modules)
+
+    def poll():
+        if warm.done.is_set():
+            if on_done is not None:
+                on_done(warm)
+        else:
+            root.after(POLL_MS, poll)
+
+    def start():
+        warm.start()
+        root.after(POLL_MS, poll)
+    root.after(DELAY_MS, start)
+    return warm
@@ -1,195 +1,452 @@
-import tkinter as tk
-from tkinter import ttk
-import time
-import platform
-import pyttsx3
-from gtts import gTTS
-import playsound
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-import threading
-
-# Windows-only sound
-if platform.system() == 'Windows':
-    import winsound
-
-# Morse Code Dictionary
-MORSE_CODE_DICT = {
-    'A': '.-',    'B': '-...',  'C': '-.-.', 
-    'D': '-..',   'E': '.',     'F': '..-.',
-    'G': '--.',   'H': '....',  'I': '..',
-    'J': '.---',  'K': '-.-',   'L': '.-..',
-    'M': '--',    'N': '-.',    'O': '---',
-    'P': '.--.',  'Q': '--.-',  'R': '.-.',
-    'S': '...',   'T': '-',     'U': '..-',
-    'V': '...-',  'W': '.--',   'X': '-..-',
-    'Y': '-.--',  'Z': '--..',
-    '0': '-----', '1': '.----', '2': '..---',
-    '3': '...--', '4': '....-', '5': '.....',
-    '6': '-....', '7': '--...', '8': '---..',
-    '9': '----.', ' ': '/', '.': '.-.-.-', ',': '--..--'
-}
-REVERSE_MORSE_CODE_DICT = {v: k for k, v in MORSE_CODE_DICT.items()}
-
-ENGLISH_URDU_DICT = {
-    'HELLO': 'ہیلو',
-    'WORLD': 'دنیا',
-    'LOVE': 'محبت',
-    'PEACE': 'امن',
-    'GOOD': 'اچھا',
-    'MORNING': 'صبح بخیر',
-    'HOW ARE YOU': 'آپ کیسے ہیں؟'
-}
-
-# Encoding and Decoding
-def encode_to_morse(text):
-    return ' '.join(MORSE_CODE_DICT.get(char.upper(), '?') for char in text)
-
-def decode_from_morse(code):
-    words = code.strip().split(' / ')
-    return ' '.join(
-        ''.join(REVERSE_MORSE_CODE_DICT.get(c, '?') for c in word.split())
-        for word in words
-    )
-
-def speak_text(text):
-    engine = pyttsx3.init()
-    engine.say(text)
-    engine.runAndWait()
-
-def manual_translate_to_urdu(text):
-    return ENGLISH_URDU_DICT.get(text.upper().strip(), "🔍 ترجمہ دستیاب نہیں")
-
-def speak_urdu(text):
-    tts = gTTS(text=text, lang='ur')
-    tts.save("urdu.mp3")
-    playsound.playsound("urdu.mp3")
-
-# Pulse visualizer logic
-class PulseVisualizer:
-    def __init__(self, morse_code):
-        self.fig, self.ax = plt.subplots()
-        self.line, = self.ax.plot([], [], lw=2)
-        self.morse_code = morse_code
-        self.x_data = []
-        self.y_data = []
-
-    def init_plot(self):
-        self.ax.set_xlim(0, 50)
-        self.ax.set_ylim(-0.5, 1.5)
-        self.line.set_data([], [])
-        return self.line,
-
-    def generate_pulse_data(self):
-        unit = 1  # 1 unit per dot
-        for symbol in self.morse_code:
-            if symbol == '.':
-                yield [1] * unit + [0] * unit
-            elif symbol == '-':
-                yield [1] * (3 * unit) + [0] * unit
-            elif symbol == ' ':
-                yield [0] * (3 * unit)
-            elif symbol == '/':
-                yield [0] * (7 * unit)
-
-    def animate(self, frame):
-        try:
-            pulse = next(self.pulse_gen)
-            self.y_data.extend(pulse)
-            self.x_data = list(range(len(self.y_data)))
-            self.line.set_data(self.x_data, self.y_data)
-            self.ax.set_xlim(0, len(self.y_data) + 10)
-            return self.line,
-        except StopIteration:
-            return self.line,
-
-    def show(self):
-        self.pulse_gen = self.generate_pulse_data()
-        ani = FuncAnimation(self.fig, self.animate, init_func=self.init_plot, interval=100, blit=True)
-        plt.title("Morse Code Pulse Visualization")
-        plt.xlabel("Time")
-        plt.ylabel("Signal")
-        plt.show()
-
-def play_morse_and_visualize(morse_code):
-    def play_and_visualize():
-        # Sound playback (only on Windows)
-        if platform.system() == 'Windows':
-            unit = 100
-            for char in morse_code:
-                if char == '.':
-                    winsound.Beep(700, unit)
-                elif char == '-':
-                    winsound.Beep(700, unit * 3)
-                elif char == ' ':
-                    time.sleep(unit / 1000.0 * 3)
-                elif char == '/':
-                    time.sleep(unit / 1000.0 * 7)
-                time.sleep(unit / 1000.0)
-        # Pulse Plot
-        visualizer = PulseVisualizer(morse_code)
-        visualizer.show()
-
-    threading.Thread(target=play_and_visualize, daemon=True).start()
-
-# GUI Class
-class MorseCodeApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Morse Code GUI with Sound, Urdu & Pulse View")
-        self.root.geometry("760x720")
-        self.root.configure(padx=20, pady=20)
-
-        # Text → Morse
-        ttk.Label(root, text="Text to Morse Code", font=("Helvetica", 14, "bold")).pack(pady=10)
-        self.text_input = tk.Text(root, height=4, width=85, font=("Courier", 11))
-        self.text_input.pack()
-        ttk.Button(root, text="Encode ➤", command=self.encode).pack(pady=5)
-        ttk.Button(root, text="🔊 Play Sound & Visualize", command=self.play_sound_and_visualize).pack(pady=5)
-        self.morse_output = tk.Text(root, height=4, width=85, bg="#f0f0f0", font=("Courier", 11))
-        self.morse_output.pack()
-
-        ttk.Separator(root, orient='horizontal').pack(fill='x', pady=20)
-
-        # Morse → Text
-        ttk.Label(root, text="Morse Code to Text", font=("Helvetica", 14, "bold")).pack(pady=10)
-        self.morse_input = tk.Text(root, height=4, width=85, font=("Courier", 11))
-        self.morse_input.pack()
-        ttk.Button(root, text="⬅ Decode", command=self.decode).pack(pady=5)
-        ttk.Button(root, text="🗣️ Speak English", command=self.speak_english).pack(pady=5)
-        ttk.Button(root, text="🇵🇰 Translate + Speak Urdu", command=self.translate_and_speak_urdu).pack(pady=5)
-        self.text_output = tk.Text(root, height=4, width=85, bg="#f0f0f0", font=("Courier", 11))
-        self.text_output.pack()
-
-    def encode(self):
-        text = self.text_input.get("1.0", tk.END).strip()
-        morse = encode_to_morse(text)
-        self.morse_output.delete("1.0", tk.END)
-        self.morse_output.insert(tk.END, morse)
-
-    def decode(self):
-        code = self.morse_input.get("1.0", tk.END).strip()
-        text = decode_from_morse(code)
-        self.text_output.delete("1.0", tk.END)
-        self.text_output.insert(tk.END, text)
-
-    def speak_english(self):
-        text = self.text_output.get("1.0", tk.END).strip()
-        if text:
-            speak_text(text)
-
-    def translate_and_speak_urdu(self):
-        text = self.text_output.get("1.0", tk.END).strip()
-        urdu = manual_translate_to_urdu(text)
-        speak_urdu(urdu)
-
-    def play_sound_and_visualize(self):
-        morse = self.morse_output.get("1.0", tk.END).strip()
-        if morse:
-            play_morse_and_visualize(morse)
-
-# Launch
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = MorseCodeApp(root)
-    root.mainloop()
+import os
+import time
+import tkinter as tk
+from tkinter import filedialog, ttk
+
+from morse import instrument, sound, warmup
+from morse.alphabets import ALPHABETS, INTERNATIONAL
+from morse.incremental import TkLiveMirror
+from morse.keying import KeyDecoder
+from morse.playback import PlaybackScheduler
+from morse.speech import get_pipeline
+from morse.translate import manual_translate_to_urdu
+
+LIVE_FRAME_SECONDS = 0.02   # audio handed to the live decoder per tick
+PULSE_WINDOW = 120          # units of signal visible in the pulse view
+PULSE_FRAME_MS = 40
+KEY_POLL_MS = 20            # how often a held-up key is checked for letter/word gaps
+
+
+# On/off units for each symbol, the same keying the playback scheduler
+# follows (sound.timeline): every symbol ends with a one unit gap.
+class _PulseUnits(dict):
+    def __missing__(self, key):
+        return '00'
+
+
+PULSE_UNITS = _PulseUnits({ord('.'): '10', ord('-'): '1110',
+                           ord(' '): '0000', ord('/'): '00000000'})
+
+
+def pulse_units(morse_code):
+    import numpy as np
+    keyed = morse_code.translate(PULSE_UNITS).encode('ascii')
+    return np.frombuffer(keyed, dtype=np.uint8) - ord('0')
+
+
+# Pulse visualizer logic
+class PulseVisualizer:
+    # The whole waveform is built once as an array; each frame only
+    # points the line at a fixed-width slice of it and blits, so the
+    # cost per frame does not grow with the message.
+    # matplotlib (and numpy) load when the view is first needed, or in
+    # the background warm-up, so they never hold up the window.
+    def __init__(self, master, unit=sound.UNIT, window=PULSE_WINDOW):
+        self.master = master
+        self.unit = unit / 1000.0
+        self.window = window
+        self.canvas = None
+        self.placeholder = ttk.Label(master, text="📈 Pulse view loads on first play")
+        self.placeholder.pack(fill='x')
+        self.ani = None
+        self.end = 0
+        self.started = 0.0
+        self.session = 0
+
+    def build(self):
+        """Create the figure; False when matplotlib is not installed."""
+        if self.canvas is not None:
+            return True
+        try:
+            import numpy as np
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+        except ImportError:
+            self.placeholder.config(text="📉 Pulse view needs numpy and matplotlib")
+            return False
+        self.fig = Figure(figsize=(7, 1.8), dpi=100)
+        self.ax = self.fig.add_subplot()
+        self.ax.set_xlim(0, self.window)
+        self.ax.set_ylim(-0.5, 1.5)
+        self.ax.set_title("Morse Code Pulse Visualization")
+        self.ax.set_xlabel("Time")
+        self.ax.set_ylabel("Signal")
+        self.fig.tight_layout()
+        self.x_data = np.arange(self.window + 1)
+        self.y_data = np.zeros(self.window + 1, dtype=np.float32)
+        self.line, = self.ax.plot(self.x_data, self.y_data, lw=2,
+                                  drawstyle='steps-post', animated=True)
+        self.placeholder.destroy()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.master)
+        self.canvas.get_tk_widget().pack(fill='x')
+        return True
+
+    def init_plot(self):
+        self.line.set_ydata(self.y_data[:self.window + 1])
+        return self.line,
+
+    def animate(self, frame):
+        # Position follows the clock rather than the frame count, so a
+        # late frame skips ahead instead of drifting from the sound.
+        position = int((time.perf_counter() - self.started) / self.unit)
+        if position >= self.end:
+            position = self.end
+            self.ani.event_source.stop()
+        self.line.set_ydata(self.y_data[position:position + self.window + 1])
+        return self.line,
+
+    def show(self, morse_code):
+        """Load a message into the view; returns the session for start()."""
+        self.stop()
+        if not self.build():
+            return None
+        import numpy as np
+        # A window of silence on the left, so the signal enters at the
+        # right edge as it plays
+        units = pulse_units(morse_code)
+        self.y_data = np.zeros(len(units) + self.window + 1, dtype=np.float32)
+        self.y_data[self.window:self.window + len(units)] = units
+        self.end = len(units)
+        self.init_plot()
+        self.canvas.draw_idle()
+        return self.session
+
+    def start(self, session):
+        # Runs when the sound actually starts; anything shown or stopped
+        # since makes the session stale
+        if session != self.session or self.ani is not None:
+            return
+        from matplotlib.animation import FuncAnimation
+        self.started = time.perf_counter()
+        self.ani = FuncAnimation(self.fig, self.animate, init_func=self.init_plot,
+                                 interval=PULSE_FRAME_MS, blit=True, cache_frame_data=False)
+        self.canvas.draw_idle()
+
+    def stop(self):
+        self.session += 1
+        if self.ani is not None:
+            self.ani.event_source.stop()
+            self.ani = None
+
+def play_morse_and_visualize(morse_code, player, visualizer):
+    # Sound plays on the scheduler's worker thread (only on Windows);
+    # the plot is embedded in the Tk window and animated by Tk timers.
+    # Whatever is still playing is cut off, and the view's clock starts
+    # with the first symbol, so the two stay in step.
+    player.stop()
+    session = visualizer.show(morse_code)
+    player.play(morse_code, on_progress=lambda index, total: visualizer.start(session))
+
+
+# Scrolling container for the main window
+class ScrolledBody:
+    def __init__(self, root, padding=20):
+        self.canvas = tk.Canvas(root, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(root, orient='vertical', command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y')
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.body = ttk.Frame(self.canvas, padding=padding)
+        window = self.canvas.create_window(0, 0, window=self.body, anchor='nw')
+        self.body.bind("<Configure>", lambda event: self.canvas.configure(
+            scrollregion=self.canvas.bbox('all')))
+        self.canvas.bind("<Configure>", lambda event: self.canvas.itemconfigure(
+            window, width=event.width))
+        root.bind_all("<MouseWheel>", self.scroll)
+        root.bind_all("<Button-4>", self.scroll)
+        root.bind_all("<Button-5>", self.scroll)
+
+    def scroll(self, event):
+        # Text boxes scroll themselves
+        if isinstance(event.widget, tk.Text) or not str(event.widget).startswith(str(self.canvas)):
+            return
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, 'units')
+        else:
+            self.canvas.yview_scroll(1, 'units')
+
+# Debug panel: live instrumentation stats and cProfile sessions
+class DebugPanel:
+    REFRESH_MS = 500
+
+    def __init__(self, root):
+        self.window = tk.Toplevel(root)
+        self.window.title("Morse Debug")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        controls = ttk.Frame(self.window)
+        controls.pack(fill='x', padx=10, pady=5)
+        self.instrumenting = tk.BooleanVar(value=instrument.enabled())
+        ttk.Checkbutton(controls, text="Record timings", variable=self.instrumenting,
+                        command=self.toggle_instrument).pack(side='left')
+        ttk.Button(controls, text="Reset", command=instrument.reset).pack(side='left', padx=5)
+        self.profile_button = ttk.Button(controls, command=self.toggle_profile)
+        self.profile_button.pack(side='left', padx=5)
+        self.output = tk.Text(self.window, height=24, width=100, font=("Courier", 9))
+        self.output.pack(fill='both', expand=True, padx=10, pady=5)
+        self.profile_text = ''
+        self.job = None
+        self.refresh()
+
+    def toggle_instrument(self):
+        if self.instrumenting.get():
+            instrument.enable()
+        else:
+            instrument.disable()
+
+    def toggle_profile(self):
+        if not instrument.profiling():
+            instrument.start_profile()
+        else:
+            path = filedialog.asksaveasfilename(defaultextension=".prof",
+                                                filetypes=[("cProfile stats", "*.prof")])
+            self.profile_text = instrument.stop_profile(path or None)
+
+    def refresh(self):
+        self.profile_button.config(text="⏹ Stop profile & save" if instrument.profiling()
+                                   else "⏺ Start cProfile")
+        text = instrument.report()
+        if self.profile_text:
+            text += "\n\n" + self.profile_text
+        self.output.delete("1.0", tk.END)
+        self.output.insert(tk.END, text)
+        self.job = self.window.after(self.REFRESH_MS, self.refresh)
+
+    def close(self):
+        if self.job:
+            self.window.after_cancel(self.job)
+        self.window.destroy()
+
+
+# GUI Class
+class MorseCodeApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Morse Code GUI with Sound, Urdu & Pulse View")
+        self.root.geometry("780x860")
+        # Everything sits in a scrolling body, so no screen is too short
+        root = ScrolledBody(root).body
+
+        # Code table; each alphabet compiles its tables once, on first use
+        self.alphabet = INTERNATIONAL
+        self.alphabet_labels = {alphabet.label: alphabet for alphabet in ALPHABETS.values()}
+        alphabet_row = ttk.Frame(root)
+        alphabet_row.pack(pady=5)
+        ttk.Label(alphabet_row, text="Alphabet:").pack(side='left', padx=5)
+        self.alphabet_choice = ttk.Combobox(alphabet_row, state="readonly", width=24,
+                                            values=list(self.alphabet_labels))
+        self.alphabet_choice.set(self.alphabet.label)
+        self.alphabet_choice.bind("<<ComboboxSelected>>", self.select_alphabet)
+        self.alphabet_choice.pack(side='left')
+
+        # Text → Morse
+        ttk.Label(root, text="Text to Morse Code", font=("Helvetica", 14, "bold")).pack(pady=5)
+        self.text_input = tk.Text(root, height=4, width=85, font=("Courier", 11))
+        self.text_input.pack()
+        encode_row = ttk.Frame(root)
+        encode_row.pack(pady=5)
+        ttk.Button(encode_row, text="Encode ➤", command=self.encode).pack(side='left', padx=5)
+        ttk.Button(encode_row, text="🔊 Play Sound & Visualize",
+                   command=self.play_sound_and_visualize).pack(side='left', padx=5)
+        ttk.Button(encode_row, text="⏹ Stop", command=self.stop_sound).pack(side='left', padx=5)
+        self.morse_output = tk.Text(root, height=4, width=85, bg="#f0f0f0", font=("Courier", 11))
+        self.morse_output.pack()
+        pulse_frame = ttk.Frame(root)
+        pulse_frame.pack(fill='x', pady=5)
+        self.visualizer = PulseVisualizer(pulse_frame)
+
+        ttk.Separator(root, orient='horizontal').pack(fill='x', pady=10)
+
+        # Morse → Text
+        ttk.Label(root, text="Morse Code to Text", font=("Helvetica", 14, "bold")).pack(pady=5)
+        self.morse_input = tk.Text(root, height=4, width=85, font=("Courier", 11))
+        self.morse_input.pack()
+        decode_row = ttk.Frame(root)
+        decode_row.pack(pady=5)
+        ttk.Button(decode_row, text="⬅ Decode", command=self.decode).pack(side='left', padx=5)
+        ttk.Button(decode_row, text="🗣️ Speak English",
+                   command=self.speak_english).pack(side='left', padx=5)
+        ttk.Button(decode_row, text="🇵🇰 Translate + Speak Urdu",
+                   command=self.translate_and_speak_urdu).pack(side='left', padx=5)
+        ttk.Button(decode_row, text="🎧 Live Decode CW Audio (WAV)",
+                   command=self.live_decode_audio).pack(side='left', padx=5)
+        self.text_output = tk.Text(root, height=4, width=85, bg="#f0f0f0", font=("Courier", 11))
+        self.text_output.pack()
+        self.status = ttk.Label(root, text="")
+        self.status.pack(pady=5)
+        self.live_job = None
+
+        # Live keying: with the pad focused the space bar is a straight key
+        self.key_pad = tk.Label(root, text="🎹 Click here, then key with the space bar",
+                                relief='groove', bg="#e8e8e8", width=50, pady=6, takefocus=1)
+        self.key_pad.pack(pady=5)
+        self.key_pad.bind("<Button-1>", lambda event: self.key_pad.focus_set())
+        self.key_pad.bind("<FocusIn>", self.start_keying)
+        self.key_pad.bind("<FocusOut>", self.stop_keying)
+        self.key_pad.bind("<KeyPress-space>", lambda event: self.key_event(True))
+        self.key_pad.bind("<KeyRelease-space>", lambda event: self.key_event(False))
+        self.keyer = None
+        self.key_job = None
+
+        self.player = PlaybackScheduler()
+        self.player.attach(self.root)
+        # Speech is queued and synthesized in the background
+        self.speech = get_pipeline()
+        self.speech.attach(self.root)
+
+        # As-you-type mode: only the edited lines are re-converted
+        options_row = ttk.Frame(root)
+        options_row.pack(pady=5)
+        self.live_typing = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_row, text="⚡ Convert as you type", variable=self.live_typing,
+                        command=self.toggle_live_typing).pack(side='left', padx=5)
+        self.encode_mirror = TkLiveMirror(self.root, self.text_input, self.morse_output,
+                                          lambda line: self.alphabet.encode(line))
+        self.decode_mirror = TkLiveMirror(self.root, self.morse_input, self.text_output,
+                                          lambda line: self.alphabet.decode(line))
+
+        # Timings for encode/decode, beeps and speech; MORSE_INSTRUMENT=1
+        # records from start-up
+        if os.environ.get('MORSE_INSTRUMENT'):
+            instrument.enable()
+        ttk.Button(options_row, text="🐞 Debug Panel",
+                   command=lambda: DebugPanel(self.root)).pack(side='left', padx=5)
+
+        # numpy, matplotlib and the speech backends load on first use;
+        # warm them up in the background once the window is showing
+        warmup.warm_up(self.root, warmup.PLOT_MODULES + warmup.SPEECH_MODULES,
+                       lambda warm: self.visualizer.build())
+
+    def select_alphabet(self, event=None):
+        self.alphabet = self.alphabet_labels[self.alphabet_choice.get()]
+        if self.live_typing.get():
+            self.encode_mirror.refresh()
+            self.decode_mirror.refresh()
+
+    def start_keying(self, event=None):
+        # Keyboard auto-repeat shows up as duplicate presses (ignored) or
+        # instant release/press pairs (debounced) in the decoder
+        if self.keyer is not None:
+            return
+        self.pause_live_typing()
+        self.keyer = KeyDecoder(self.alphabet.decoder)
+        self.key_pad.config(text="🎹 Keying: hold space for dashes, tap for dots")
+        self.key_job = self.root.after(KEY_POLL_MS, self.poll_keying)
+
+    def stop_keying(self, event=None):
+        if self.key_job:
+            self.root.after_cancel(self.key_job)
+            self.key_job = None
+        if self.keyer is not None:
+            self.show_keyed(self.keyer.flush())
+            self.keyer = None
+        self.key_pad.config(text="🎹 Click here, then key with the space bar", bg="#e8e8e8")
+
+    def key_event(self, down):
+        if self.keyer is None:
+            return
+        self.key_pad.config(bg="#ffd24d" if down else "#e8e8e8")
+        self.show_keyed(self.keyer.feed(down, time.perf_counter()))
+
+    def poll_keying(self):
+        self.show_keyed(self.keyer.poll(time.perf_counter()))
+        self.key_job = self.root.after(KEY_POLL_MS, self.poll_keying)
+
+    def show_keyed(self, text):
+        if text:
+            self.text_output.insert(tk.END, text)
+            self.text_output.see(tk.END)
+        if self.keyer is not None:
+            self.status.config(text=f"🎹 {self.keyer.wpm:.0f} WPM")
+
+    def toggle_live_typing(self):
+        enabled = self.live_typing.get()
+        self.encode_mirror.enable(enabled)
+        self.decode_mirror.enable(enabled)
+
+    def pause_live_typing(self):
+        # Live audio and keying write their own text into text_output; the
+        # mirror would then patch lines that no longer hold its output
+        if self.live_typing.get():
+            self.live_typing.set(False)
+            self.toggle_live_typing()
+
+    def encode(self):
+        if self.live_typing.get():
+            # The mirror owns morse_output while it is on
+            self.encode_mirror.refresh()
+            return
+        text = self.text_input.get("1.0", tk.END).strip()
+        morse = self.alphabet.encode(text)
+        self.morse_output.delete("1.0", tk.END)
+        self.morse_output.insert(tk.END, morse)
+
+    def decode(self):
+        if self.live_typing.get():
+            self.decode_mirror.refresh()
+            return
+        code = self.morse_input.get("1.0", tk.END).strip()
+        text = self.alphabet.decode(code)
+        self.text_output.delete("1.0", tk.END)
+        self.text_output.insert(tk.END, text)
+
+    def speak_english(self):
+        text = self.text_output.get("1.0", tk.END).strip()
+        if text:
+            self.speech.say(text, 'en', on_done=self.speech_done)
+
+    def translate_and_speak_urdu(self):
+        text = self.text_output.get("1.0", tk.END).strip()
+        urdu = manual_translate_to_urdu(text)
+        self.speech.say(urdu, 'ur', on_done=self.speech_done)
+
+    def speech_done(self, completed, error):
+        if isinstance(error, ImportError):
+            self.status.config(text=f"❌ Speech needs {error.name}: pip install {error.name}")
+        elif error is not None:
+            self.status.config(text=f"❌ Speech failed: {error}")
+
+    def live_decode_audio(self):
+        path = filedialog.askopenfilename(filetypes=[("WAV audio", "*.wav")])
+        if not path:
+            return
+        from morse.audio import read_wav
+        from morse.live import LiveDecoder
+        if self.live_job:
+            self.root.after_cancel(self.live_job)
+        self.pause_live_typing()
+        samples, rate = read_wav(path)
+        self.text_output.delete("1.0", tk.END)
+        self.feed_live(LiveDecoder(rate, decoder=self.alphabet.decoder), samples, int(rate * LIVE_FRAME_SECONDS), 0)
+
+    def feed_live(self, decoder, samples, frame, position):
+        # One frame per tick at the pace the audio would arrive, so the Tk
+        # loop stays free between frames.
+        text = decoder.feed(samples[position:position + frame])
+        position += frame
+        if position >= len(samples):
+            text += decoder.flush()
+            self.live_job = None
+        else:
+            self.live_job = self.root.after(int(LIVE_FRAME_SECONDS * 1000), self.feed_live,
+                                            decoder, samples, frame, position)
+        if text:
+            self.text_output.insert(tk.END, text)
+            self.text_output.see(tk.END)
+        self.status.config(text=f"🎧 {decoder.wpm:.0f} WPM · "
+                                f"{decoder.last_frame_seconds * 1000:.2f} ms per frame")
+
+    def play_sound_and_visualize(self):
+        morse = self.morse_output.get("1.0", tk.END).strip()
+        if morse:
+            play_morse_and_visualize(morse, self.player, self.visualizer)
+
+    def stop_sound(self):
+        self.player.stop()
+        self.speech.stop()
+        self.visualizer.stop()
+
+# Launch
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = MorseCodeApp(root)
+    root.mainloop()
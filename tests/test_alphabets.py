@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from morse import ALPHABETS, decode_from_morse, encode_to_morse, get_alphabet
+from morse.codec import UNKNOWN
+from morse.packed import PackedEncoder, pack_morse, unpack_morse
+
+# Wabun voicing marks join the kana before them when decoded
+MARKS = {'゛', '゜'}
+
+
+def _decodable(alphabet):
+    return set(alphabet.decoder.table.values()) - MARKS
+
+
+@pytest.fixture(params=list(ALPHABETS))
+def alphabet(request):
+    return ALPHABETS[request.param]
+
+
+def test_every_character_round_trips(alphabet):
+    decodable = _decodable(alphabet)
+    for char, code in alphabet.table.items():
+        assert alphabet.encode(char) == code, char
+        # Characters sharing a code decode to the first one in the table
+        if char in decodable:
+            assert alphabet.decode(code) == char, char
+
+
+def test_random_text_round_trips(alphabet):
+    rng = random.Random(17)
+    decodable = _decodable(alphabet)
+    letters = [char for char in alphabet.table if char in decodable and char != ' ']
+    for _ in range(200):
+        text = ' '.join(''.join(rng.choices(letters, k=rng.randint(1, 8)))
+                        for _ in range(rng.randint(1, 6)))
+        assert alphabet.decode(alphabet.encode(text)) == text
+
+
+def test_aliases_encode_like_their_letter(alphabet):
+    for alias, code in alphabet.aliases.items():
+        assert alphabet.encode(alias) == code, alias
+        # ... and decode to a table character with the same code
+        assert alphabet.encode(alphabet.decode(code)) == code, alias
+
+
+def _packable(code):
+    # Wabun's voiced kana are two letters
+    return all(token == '/' or set(token) <= {'.', '-'} for token in code.split(' '))
+
+
+def test_packed_matches_string_encoding(alphabet):
+    # Packing keeps only dots, dashes and '/': every other code must pack
+    # as the unknown letter rather than as some other letter
+    packed = PackedEncoder(alphabet.encoder.code_dict, alphabet.fold_case)
+    unknown = pack_morse(UNKNOWN)
+    for char in list(alphabet.table) + list(alphabet.aliases) + [c.lower() for c in alphabet.table]:
+        code = alphabet.encode(char)
+        if _packable(code):
+            assert packed.encode(char) == pack_morse(code), char
+            assert unpack_morse(packed.encode(char)) == code, char
+        else:
+            assert packed.encode(char) == pack_morse(code) == unknown, char
+
+
+def test_wrappers_take_an_alphabet_name():
+    text = "ΑΒΓ ΔΕ"
+    code = encode_to_morse(text, 'greek')
+    assert code == get_alphabet('greek').encode(text)
+    assert decode_from_morse(code, 'greek') == text
+    assert decode_from_morse(encode_to_morse("SOS")) == "SOS"
+
+
+def test_switching_reuses_tables():
+    encoders = {name: alphabet.encoder for name, alphabet in ALPHABETS.items()}
+    decoders = {name: alphabet.decoder for name, alphabet in ALPHABETS.items()}
+    for name, alphabet in ALPHABETS.items():
+        decode_from_morse(encode_to_morse(next(iter(alphabet.table)), name), name)
+    for name, alphabet in ALPHABETS.items():
+        assert alphabet.encoder is encoders[name]
+        assert alphabet.decoder is decoders[name]
+
+
+def test_unknown_alphabet():
+    with pytest.raises(ValueError, match='unknown Morse alphabet'):
+        get_alphabet('klingon')
@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from morse import audio, encode_to_morse, tone
+
+TEXTS = ["CQ CQ DE AB1CD", "THE QUICK BROWN FOX 73", "SOS 123"]
+
+
+@pytest.mark.parametrize('wpm', [12, 20, 30])
+@pytest.mark.parametrize('text', TEXTS)
+def test_noisy_round_trip(text, wpm):
+    rng = np.random.default_rng(0)
+    clean = tone.render(encode_to_morse(text), wpm=wpm, frequency=650, sample_rate=8000)
+    samples = clean + rng.normal(0, 0.3, len(clean)).astype(np.float32)
+    assert audio.decode_samples(samples, 8000) == text
+
+
+def test_wav_round_trip():
+    text = "HELLO WORLD"
+    buffer = io.BytesIO()
+    tone.write_wav(buffer, encode_to_morse(text), sample_rate=8000)
+    buffer.seek(0)
+    assert audio.decode_wav(buffer) == text
+
+
+@pytest.mark.parametrize('wpm, farnsworth_wpm', [(25, 10), (30, 15), (18, 5), (20, 15)])
+@pytest.mark.parametrize('noise', [0.0, 0.3])
+def test_farnsworth_spacing(wpm, farnsworth_wpm, noise):
+    text = "THE QUICK BROWN FOX 73"
+    rng = np.random.default_rng(1)
+    clean = tone.render(encode_to_morse(text), wpm=wpm, farnsworth_wpm=farnsworth_wpm,
+                        sample_rate=8000)
+    samples = clean + rng.normal(0, noise, len(clean)).astype(np.float32)
+    assert audio.decode_samples(samples, 8000) == text
+
+
+@pytest.mark.parametrize('seed', range(4))
+@pytest.mark.parametrize('level', [0.01, 0.3, 1.0])
+def test_noise_alone_decodes_to_nothing(seed, level):
+    rng = np.random.default_rng(seed)
+    samples = rng.normal(0, level, 8000 * 5).astype(np.float32)
+    assert audio.samples_to_morse(samples, 8000) == ''
+    assert audio.samples_to_morse(samples, 8000, frequency=650) == ''
+
+
+def test_silence_decodes_to_nothing():
+    assert audio.decode_samples(np.zeros(8000 * 3, dtype=np.float32), 8000) == ''
+
+
+def test_squelch_at_the_wrong_frequency():
+    rng = np.random.default_rng(2)
+    clean = tone.render(encode_to_morse("SOS"), frequency=650, sample_rate=8000)
+    samples = clean + rng.normal(0, 0.1, len(clean)).astype(np.float32)
+    assert audio.decode_samples(samples, 8000, frequency=650) == "SOS"
+    assert audio.decode_samples(samples, 8000, frequency=1500) == ''
@@ -0,0 +1,84 @@
+import io
+import json
+import os
+
+import pytest
+
+from morse import encode_to_morse
+from morse.alphabets import get_alphabet
+from morse.batch import MANIFEST, run
+
+TEXTS = {'a.txt': "SOS\nHELLO WORLD\n", os.path.join('sub', 'b.txt'): "ALPHA BETA\n"}
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / 'in'
+    for relative, text in TEXTS.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    return str(root)
+
+
+def convert(command, source, output, **options):
+    return run(command, source, str(output), workers=1, stream=io.StringIO(), **options)
+
+
+def manifest(output):
+    with open(os.path.join(output, MANIFEST), encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_encode_tree(source, tmp_path):
+    output = tmp_path / 'out'
+    assert convert('encode', source, output).files == len(TEXTS)
+    for relative, text in TEXTS.items():
+        target = output / (os.path.splitext(relative)[0] + '.morse')
+        assert target.read_text(encoding='utf-8') == ''.join(
+            encode_to_morse(line) + '\n' for line in text.splitlines())
+    entries = manifest(output)
+    assert {entry['alphabet'] for entry in entries} == {'international'}
+    assert {entry['suffix'] for entry in entries} == {'.morse'}
+
+
+def test_rerun_skips_finished(source, tmp_path):
+    output = tmp_path / 'out'
+    convert('encode', source, output)
+    assert convert('encode', source, output).files == 0
+
+
+def test_rerun_redoes_changed_source(source, tmp_path):
+    output = tmp_path / 'out'
+    convert('encode', source, output)
+    path = os.path.join(source, 'a.txt')
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("MORE\n")
+    assert convert('encode', source, output).files == 1
+
+
+def test_other_alphabet_is_not_skipped(source, tmp_path):
+    output = tmp_path / 'out'
+    convert('encode', source, output)
+    assert convert('encode', source, output, alphabet='american').files == len(TEXTS)
+    american = get_alphabet('american')
+    assert (output / 'a.morse').read_text(encoding='utf-8').splitlines() \
+        == [american.encode(line) for line in TEXTS['a.txt'].splitlines()]
+    # ... and switching back converts again too
+    assert convert('encode', source, output).files == len(TEXTS)
+    assert convert('encode', source, output).files == 0
+
+
+def test_other_suffix_is_not_skipped(source, tmp_path):
+    output = tmp_path / 'out'
+    convert('encode', source, output)
+    assert convert('encode', source, output, suffix='.cw').files == len(TEXTS)
+    assert (output / 'a.cw').exists()
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+def test_chunk_size_must_be_positive(source, tmp_path, chunk_size):
+    output = tmp_path / 'out'
+    with pytest.raises(ValueError, match="chunk size"):
+        convert('encode', source, output, chunk_size=chunk_size)
+    assert not (output / MANIFEST).exists()
@@ -0,0 +1,102 @@
+# Every encode/decode path agrees over the shared character set: the
+# scripts' text_to_morse, the codec, the alphabet registry, packed,
+# streamed, memory-mapped and parallel forms, the robust decoder on clean
+# input, the GUI pulse view against the sound timeline, and tone
+# rendering decoded back through morse.audio.
+
+import io
+import random
+
+import pytest
+
+from morse import (MORSE_CODE_DICT, decode_from_morse, decode_packed, decode_parallel,
+                   decode_robust, encode_packed, encode_to_morse, get_alphabet,
+                   iter_decode, iter_encode, pack_morse, unpack_morse)
+from morse import sound
+from morse.mapped import byte_decoder, decode_mapped
+from morseEncode import text_to_morse
+
+
+def shared_text(rng, words=8):
+    chars = [char for char in MORSE_CODE_DICT if char != ' ']
+    chars += [char.lower() for char in chars if char.isalpha()]
+    return ' '.join(''.join(rng.choices(chars, k=rng.randint(1, 7))) for _ in range(words))
+
+
+def texts(count, seed, words=8):
+    rng = random.Random(seed)
+    return [shared_text(rng, words) for _ in range(count)]
+
+
+SHORT = texts(200, seed=19)
+
+
+@pytest.mark.parametrize('encode', [
+    text_to_morse,
+    get_alphabet('international').encode,
+    lambda text: unpack_morse(encode_packed(text)),
+    lambda text: ''.join(iter_encode(io.StringIO(text), 7)),
+], ids=['text_to_morse', 'alphabet', 'encode_packed', 'iter_encode'])
+def test_encoders_agree(encode):
+    for text in SHORT:
+        assert encode(text) == encode_to_morse(text), text
+
+
+@pytest.mark.parametrize('decode', [
+    lambda code: decode_packed(pack_morse(code)),
+    lambda code: byte_decoder.decode(code.encode('ascii')).decode('utf-8'),
+    lambda code: ''.join(iter_decode(io.StringIO(code), 5)),
+], ids=['decode_packed', 'byte_decoder', 'iter_decode'])
+def test_decoders_agree(decode):
+    for text in SHORT:
+        code = encode_to_morse(text)
+        assert decode_from_morse(code) == text.upper()
+        assert decode(code) == text.upper(), code
+
+
+@pytest.fixture(scope='module')
+def long_codes():
+    return [encode_to_morse(' '.join(texts(200, seed))) for seed in range(3)]
+
+
+def test_decode_parallel(long_codes):
+    for code in long_codes:
+        assert decode_parallel(code, workers=2, chunk_size=512) == decode_from_morse(code)
+
+
+def test_decode_mapped(long_codes, tmp_path):
+    source, target = tmp_path / 'in.morse', tmp_path / 'out.txt'
+    for code in long_codes:
+        source.write_text(code, encoding='ascii')
+        decode_mapped(str(source), str(target), window=1000)
+        assert target.read_text(encoding='utf-8') == decode_from_morse(code)
+
+
+CLEAN = [text.upper() for text in texts(5, seed=23, words=4)]
+
+
+@pytest.mark.parametrize('text', CLEAN)
+def test_robust_on_clean_input(text):
+    code = encode_to_morse(text)
+    assert decode_robust(code)[0].text == decode_from_morse(code)
+
+
+@pytest.mark.parametrize('text', CLEAN)
+def test_tone_decodes_back(text):
+    pytest.importorskip('numpy')
+    from morse import audio, tone
+    code = encode_to_morse(text)
+    assert audio.decode_samples(tone.render(code, wpm=20), tone.SAMPLE_RATE) \
+        == decode_from_morse(code)
+
+
+def test_pulse_view_matches_timeline():
+    # The pulse view lives in the Tk script and needs numpy
+    pytest.importorskip('numpy')
+    pytest.importorskip('tkinter')
+    from morse_gui_visual import pulse_units
+    for text in SHORT:
+        code = encode_to_morse(text)
+        want = ''.join(('1' if key else '0') * (ms // sound.UNIT)
+                       for _, key, ms in sound.timeline(code))
+        assert ''.join(map(str, pulse_units(code))) == want, code
@@ -0,0 +1,58 @@
+import sys
+
+import pytest
+
+from morse import codec, decode_from_morse, encode_to_morse, instrument
+
+
+@pytest.fixture
+def target(tmp_path, monkeypatch):
+    # A module that nothing has imported yet, standing in for numpy-heavy
+    # ones like morse.tone
+    name = 'instrument_target'
+    (tmp_path / f'{name}.py').write_text("def work(text):\n    return text.upper()\n",
+                                         encoding='utf-8')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(instrument, 'TARGETS', instrument.TARGETS + [
+        (name, 'work', 'target.work', lambda args, kwargs, result: len(args[0]), 'chars')])
+    yield name
+    instrument.disable()
+    instrument.reset()
+    sys.modules.pop(name, None)
+
+
+def test_enable_imports_nothing(target):
+    before = set(sys.modules)
+    instrument.enable()
+    assert instrument.enabled()
+    assert set(sys.modules) - before == set()
+
+
+def test_patched_on_first_import(target):
+    instrument.enable()
+    module = __import__(target)
+    assert module.work('abc') == 'ABC'
+    assert instrument.stats()['target.work']['calls'] == 1
+    instrument.disable()
+    assert not hasattr(module.work, '__wrapped__')
+    module.work('abc')
+    assert instrument.stats()['target.work']['calls'] == 1
+
+
+def test_not_patched_after_disable(target):
+    instrument.enable()
+    instrument.disable()
+    module = __import__(target)
+    assert not hasattr(module.work, '__wrapped__')
+
+
+def test_loaded_modules_patched_at_once(target):
+    originals = codec.MorseEncoder.encode, codec.MorseDecoder.decode
+    assert {'encode', 'decode'} <= set(instrument.enable())
+    code = encode_to_morse("SOS")
+    decode_from_morse(code)
+    stats = instrument.stats()
+    assert stats['encode']['amount'] == 3 and stats['encode']['unit'] == 'chars'
+    assert stats['decode']['amount'] == len(code) and stats['decode']['unit'] == 'Morse chars'
+    instrument.disable()
+    assert (codec.MorseEncoder.encode, codec.MorseDecoder.decode) == originals
@@ -0,0 +1,82 @@
+import io
+
+import pytest
+
+from morse import decode_from_morse, encode_to_morse, get_alphabet
+from morse.keying import KeyDecoder, decode_events, main, read_events
+
+DOT = 0.06      # 20 WPM
+
+
+def key_events(code, dot=DOT):
+    # (state, timestamp) events for a Morse string, evenly keyed
+    events, now = [], 0.0
+    for word in code.split(' / '):
+        for letter in word.split(' '):
+            for symbol in letter:
+                events.append((True, now))
+                now += dot if symbol == '.' else 3 * dot
+                events.append((False, now))
+                now += dot
+            now += 2 * dot
+        now += 4 * dot
+    return events
+
+
+@pytest.mark.parametrize('text', ["SOS", "CQ CQ DE AB1CD", "THE QUICK BROWN FOX 73"])
+def test_decode_events(text):
+    assert decode_events(key_events(encode_to_morse(text))) == text
+
+
+@pytest.mark.parametrize('name, text', [
+    ('wabun', "ガ"), ('wabun', "パン ダ"), ('wabun', "カ゛"), ('wabun', "ウヰ"),
+    ('greek', "ΑΒΓ ΔΕ"), ('cyrillic', "ПРИВЕТ МИР"),
+])
+def test_other_alphabets_decode_as_decode_from_morse(name, text):
+    alphabet = get_alphabet(name)
+    code = alphabet.encode(text)
+    assert decode_events(key_events(code), alphabet.decoder) == alphabet.decode(code)
+
+
+def test_wabun_voicing_mark_is_composed():
+    wabun = get_alphabet('wabun')
+    assert decode_events(key_events('.-.. ..'), wabun.decoder) == 'ガ'
+    assert decode_events(key_events(wabun.encode('パ')), wabun.decoder) == 'パ'
+
+
+def test_poll_emits_held_kana_at_the_word_gap():
+    keys = KeyDecoder(get_alphabet('wabun').decoder)
+    events = key_events('.-..')
+    text = ''.join(keys.feed(down, t) for down, t in events)
+    end = events[-1][1]
+    # カ may still take a voicing mark after a letter gap...
+    text += keys.poll(end + 4 * DOT)
+    assert text == ''
+    # ... but not after a word gap
+    assert keys.poll(end + 10 * DOT) == 'カ '
+
+
+def test_feed_and_poll_agree_with_decode_from_morse():
+    code = encode_to_morse("HELLO WORLD")
+    keys = KeyDecoder()
+    pieces = []
+    for down, t in key_events(code):
+        pieces.append(keys.poll(t))
+        pieces.append(keys.feed(down, t))
+    pieces.append(keys.flush())
+    assert ''.join(pieces).strip() == decode_from_morse(code)
+
+
+def test_read_events():
+    lines = ["# capture", "0.0 down", "0.06 up", "", "0.12 1  # dot", "0.30 0"]
+    assert list(read_events(lines)) == [(True, 0.0), (False, 0.06), (True, 0.12), (False, 0.3)]
+    with pytest.raises(ValueError, match="line 2"):
+        list(read_events(["0.0 1", "nonsense"]))
+
+
+def test_command_line(tmp_path, capsys):
+    capture = tmp_path / 'capture.log'
+    capture.write_text(''.join(f"{t} {int(down)}\n" for down, t in key_events('.-.. ..')),
+                       encoding='utf-8')
+    main([str(capture), '-a', 'wabun'])
+    assert capsys.readouterr().out == 'ガ\n'
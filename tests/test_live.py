@@ -0,0 +1,43 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from morse import encode_to_morse, get_alphabet, tone
+from morse.live import LiveDecoder
+
+RATE = 8000
+
+
+def decode_live(code, decoder=None, noise=0.0, frame_seconds=0.02, seed=0):
+    # Half a second of silence on either side, fed in frames
+    samples = tone.render(code, wpm=20, frequency=650, sample_rate=RATE)
+    silence = np.zeros(RATE // 2, dtype=np.float32)
+    samples = np.concatenate((silence, samples, silence))
+    samples += np.random.default_rng(seed).normal(0, noise, len(samples)).astype(np.float32)
+    live = LiveDecoder(RATE, decoder=decoder)
+    frame = int(RATE * frame_seconds)
+    pieces = [live.feed(samples[start:start + frame]) for start in range(0, len(samples), frame)]
+    pieces.append(live.flush())
+    return ''.join(pieces).strip()
+
+
+@pytest.mark.parametrize('text', ["CQ CQ DE AB1CD", "THE QUICK BROWN FOX 73"])
+@pytest.mark.parametrize('noise', [0.0, 0.2])
+def test_live_round_trip(text, noise):
+    assert decode_live(encode_to_morse(text), noise=noise) == text
+
+
+@pytest.mark.parametrize('frame_seconds', [0.005, 0.02, 0.1])
+def test_frame_size_does_not_matter(frame_seconds):
+    assert decode_live(encode_to_morse("SOS SOS"), frame_seconds=frame_seconds) == "SOS SOS"
+
+
+@pytest.mark.parametrize('text', ["ガ", "パンダ", "ガ ギ", "カ゛"])
+def test_wabun_voicing_marks_are_composed(text):
+    wabun = get_alphabet('wabun')
+    code = wabun.encode(text)
+    assert decode_live(code, wabun.decoder) == wabun.decode(code)
+
+
+def test_wabun_as_sent():
+    assert decode_live('.-.. ..', get_alphabet('wabun').decoder) == 'ガ'
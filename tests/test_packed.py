@@ -0,0 +1,61 @@
+import pytest
+
+from morse import decode_from_morse, encode_to_morse
+from morse.packed import (HEADER, MAGIC, PackedMorse, decode_packed, encode_packed, pack_morse,
+                          unpack_morse)
+
+TEXTS = ["", "E", "SOS", "hello world", "CQ DE AB1CD 73", "a~b  cé", "1 2 3 4 5 6 7 8 9 0"]
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_string_round_trip(text):
+    code = encode_to_morse(text)
+    packed = pack_morse(code)
+    assert unpack_morse(packed) == code
+    assert encode_packed(text) == packed
+    assert decode_packed(packed) == decode_from_morse(code)
+
+
+# Tokens that are not made of dots and dashes, nor a lone '/'
+MALFORMED = [".-x .-", "-/", "/-", ".- //", "?? .-", "... ---é ...", ".._. .-.", "= #",
+             "abc", ". - x / .-", "-..-/.-"]
+
+
+@pytest.mark.parametrize('code', MALFORMED)
+def test_malformed_tokens_pack_as_unknown(code):
+    assert decode_packed(pack_morse(code)) == decode_from_morse(code)
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_bytes_round_trip(text):
+    packed = encode_packed(text)
+    data = packed.to_bytes()
+    assert data[:3] == MAGIC
+    assert len(data) == packed.nbytes == HEADER.size + (len(packed) + 3) // 4
+    restored = PackedMorse.from_bytes(data)
+    assert restored == packed
+    assert decode_packed(restored) == decode_packed(packed)
+
+
+def test_bad_magic():
+    data = bytearray(encode_packed("SOS").to_bytes())
+    data[:3] = b'XYZ'
+    with pytest.raises(ValueError, match="bad magic"):
+        PackedMorse.from_bytes(bytes(data))
+
+
+def test_unsupported_version():
+    data = bytearray(encode_packed("SOS").to_bytes())
+    data[3] = 99
+    with pytest.raises(ValueError, match="version 99"):
+        PackedMorse.from_bytes(bytes(data))
+
+
+def test_truncated():
+    data = encode_packed("hello world").to_bytes()
+    with pytest.raises(ValueError, match="truncated"):
+        PackedMorse.from_bytes(data[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        PackedMorse.from_bytes(data + b'\0')
+    with pytest.raises(ValueError, match="too short"):
+        PackedMorse.from_bytes(data[:HEADER.size - 1])
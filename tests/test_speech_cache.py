@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+
+from morse.speech import SpeechCache, StubBackend
+
+
+class SlowStub(StubBackend):
+    def synthesize(self, text, lang, voice, path):
+        time.sleep(0.05)
+        super().synthesize(text, lang, voice, path)
+
+
+def test_hit_and_miss(tmp_path):
+    backend = StubBackend()
+    cache = SpeechCache(str(tmp_path), backend=backend)
+    path = cache.get("salaam", lang='ur')
+    assert cache.get("salaam", lang='ur') == path
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == "ur\nNone\nsalaam"
+    assert backend.calls == 1
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_key_covers_language_and_voice(tmp_path):
+    cache = SpeechCache(str(tmp_path), backend=StubBackend())
+    paths = {cache.get("hello", 'en'), cache.get("hello", 'ur'), cache.get("hello", 'en', 'co.uk')}
+    assert len(paths) == 3
+    assert cache.stats()['misses'] == 3
+
+
+def test_evicts_least_recently_used(tmp_path):
+    backend = StubBackend()
+    # Each stub file is "en\nNone\n" plus the text: 12 bytes here
+    cache = SpeechCache(str(tmp_path), max_bytes=30, backend=backend)
+    first = cache.get("aaaa")
+    second = cache.get("bbbb")
+    cache.get("aaaa")                   # now the most recently used
+    cache.get("cccc")
+    assert cache.stats()['evictions'] == 1
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['bytes'] <= 30
+
+
+def test_rescan_on_restart(tmp_path):
+    cache = SpeechCache(str(tmp_path), backend=StubBackend())
+    path = cache.get("hello")
+    size = cache.stats()['bytes']
+
+    backend = StubBackend()
+    reopened = SpeechCache(str(tmp_path), backend=backend)
+    assert reopened.stats()['entries'] == 1
+    assert reopened.stats()['bytes'] == size
+    assert reopened.get("hello") == path
+    assert backend.calls == 0
+    assert reopened.stats()['hits'] == 1
+
+
+def test_concurrent_misses_synthesize_once(tmp_path):
+    backend = SlowStub()
+    cache = SpeechCache(str(tmp_path), backend=backend)
+    paths = []
+    start = threading.Barrier(4)
+
+    def worker():
+        start.wait()
+        paths.append(cache.get("same phrase"))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert backend.calls == 1
+    assert len(set(paths)) == 1
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hits'] == 3
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.part')]
@@ -0,0 +1,128 @@
+import threading
+import time
+
+import pytest
+
+from morse import speech
+from morse.speech import CachedVoice, EngineVoice, FakeBackend, SpeechCache, SpeechPipeline
+
+
+def wait_idle(pipeline, timeout=10):
+    end = time.perf_counter() + timeout
+    while pipeline.busy:
+        assert time.perf_counter() < end, "pipeline never went idle"
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    backend = FakeBackend(latency=0.01, synth_per_char=0, seconds_per_char=0.005)
+    return SpeechPipeline({None: CachedVoice(SpeechCache(str(tmp_path), backend=backend))})
+
+
+def say_all(pipeline, texts):
+    done = []
+    for text in texts:
+        pipeline.say(text, 'ur', on_done=lambda ok, error, text=text: done.append((text, ok)))
+    return done
+
+
+def test_spoken_in_order(pipeline):
+    texts = [f"phrase {i}" for i in range(8)]
+    done = say_all(pipeline, texts)
+    wait_idle(pipeline)
+    assert done == [(text, True) for text in texts]
+    assert pipeline.stats()['spoken'] == len(texts)
+
+
+def test_cancel_one(pipeline):
+    texts = [f"phrase {i}" for i in range(6)]
+    done = []
+    ids = [pipeline.say(text, on_done=lambda ok, error, text=text: done.append((text, ok)))
+           for text in texts]
+    pipeline.cancel(ids[4])
+    wait_idle(pipeline)
+    assert done == [(text, text != "phrase 4") for text in texts]
+
+
+def test_stop_cancels_everything(pipeline):
+    texts = [f"a rather longer phrase {i}" for i in range(10)]
+    done = say_all(pipeline, texts)
+    while pipeline.current is None:
+        time.sleep(0.001)
+    started = time.perf_counter()
+    pipeline.stop()
+    wait_idle(pipeline)
+    # The playing phrase is cut short rather than waited out
+    assert time.perf_counter() - started < 0.1
+    assert [text for text, _ in done] == texts
+    assert not any(ok for _, ok in done)
+    stats = pipeline.stats()
+    assert stats['cancelled'] == len(texts) and stats['spoken'] == 0
+
+
+def test_stop_never_misses_a_job(pipeline):
+    # stop() at any moment, including while a job is between a queue and
+    # `preparing` or `current`, cancels everything said before it
+    for attempt in range(30):
+        done = say_all(pipeline, [f"round {attempt} phrase {i}" for i in range(3)])
+        time.sleep(attempt * 0.0005)
+        pipeline.stop()
+        wait_idle(pipeline)
+        assert len(done) == 3
+        assert not any(ok for _, ok in done[1:]), attempt
+
+
+class FakeEngine:
+    """pyttsx3 lookalike that speaks one word every `word_seconds` and
+    records which thread calls stop()."""
+
+    def __init__(self, word_seconds=0.01):
+        self.word_seconds = word_seconds
+        self.callbacks = {}
+        self.text = ''
+        self.spoken = []
+        self.stop_threads = []
+        self._stopped = False
+
+    def connect(self, topic, callback):
+        self.callbacks[callback] = topic
+        return callback
+
+    def disconnect(self, token):
+        del self.callbacks[token]
+
+    def say(self, text):
+        self.text = text
+
+    def runAndWait(self):
+        self._stopped = False
+        for location, word in enumerate(self.text.split()):
+            for callback, topic in list(self.callbacks.items()):
+                if topic == 'started-word':
+                    callback(None, location, len(word))
+            if self._stopped:
+                return
+            self.spoken.append(word)
+            time.sleep(self.word_seconds)
+
+    def stop(self):
+        self.stop_threads.append(threading.current_thread())
+        self._stopped = True
+
+
+def test_engine_is_stopped_on_the_play_thread(monkeypatch):
+    engine = FakeEngine()
+    monkeypatch.setattr(speech, '_engine', engine)
+    pipeline = SpeechPipeline({None: EngineVoice()})
+    done = []
+    pipeline.say(' '.join(['word'] * 100), on_done=lambda ok, error: done.append(ok))
+    while len(engine.spoken) < 3:
+        time.sleep(0.001)
+    pipeline.stop()
+    wait_idle(pipeline)
+    assert done == [False]
+    assert len(engine.spoken) < 100
+    assert engine.stop_threads and all(thread.name == 'morse-tts-play'
+                                       for thread in engine.stop_threads)
+    assert not engine.callbacks
@@ -0,0 +1,34 @@
+import io
+
+import pytest
+
+from morse import decode_from_morse, encode_to_morse
+from morse.__main__ import main
+from morse.stream import iter_decode, iter_encode
+
+TEXT = "CQ CQ DE AB1CD\nhello world\n\nthe quick brown fox 73\n"
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64, 1 << 16])
+def test_chunking_does_not_change_the_result(chunk_size):
+    code = ''.join(iter_encode(io.StringIO(TEXT), chunk_size))
+    assert code.split('\n') == [encode_to_morse(line) for line in TEXT.split('\n')]
+    text = ''.join(iter_decode(io.StringIO(code), chunk_size))
+    assert text.split('\n') == [decode_from_morse(line) for line in code.split('\n')]
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+@pytest.mark.parametrize('convert', [iter_encode, iter_decode])
+def test_chunk_size_must_be_positive(convert, chunk_size):
+    with pytest.raises(ValueError, match="chunk size"):
+        convert(io.StringIO(TEXT), chunk_size)
+
+
+@pytest.mark.parametrize('value', ['0', '-1', 'many'])
+def test_command_line_rejects_bad_chunk_size(value, tmp_path, capsys):
+    source = tmp_path / 'in.txt'
+    source.write_text(TEXT, encoding='utf-8')
+    with pytest.raises(SystemExit) as raised:
+        main(['encode', str(source), '--chunk-size', value])
+    assert raised.value.code == 2
+    assert '--chunk-size' in capsys.readouterr().err
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from morse import translate
+from morse.translate import NOT_AVAILABLE, PhraseTranslator, load_trie
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    path = tmp_path / 'phrases.tsv'
+    path.write_text("# test phrases\nHELLO\tہیلو\nHOW ARE YOU\tآپ کیسے ہیں؟\nTHANK YOU\tشکریہ\n",
+                    encoding='utf-8')
+    return str(path)
+
+
+def test_longest_phrase_wins(dictionary, tmp_path):
+    translator = PhraseTranslator(load_trie(dictionary, str(tmp_path / 'cache')))
+    assert translator.translate("hello, how are you?") == "ہیلو، آپ کیسے ہیں؟"
+    assert translator.translate("thank you friend") == "شکریہ FRIEND"
+    assert translator.translate("nothing here") == NOT_AVAILABLE
+
+
+def test_cache_is_reused(dictionary, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    first = load_trie(dictionary, str(cache_dir))
+    assert len(os.listdir(cache_dir)) == 1
+    assert load_trie(dictionary, str(cache_dir)) == first
+
+
+@pytest.mark.parametrize('damage', [b'', b'{"HELLO": {', b'not json at all', b'[1, 2]',
+                                    b'\xff\xfe{}'])
+def test_corrupt_cache_is_rebuilt(dictionary, tmp_path, damage):
+    cache_dir = tmp_path / 'cache'
+    expected = load_trie(dictionary, str(cache_dir))
+    cache, = cache_dir.iterdir()
+    cache.write_bytes(damage)
+    assert load_trie(dictionary, str(cache_dir)) == expected
+    assert load_trie(dictionary, str(cache_dir)) == expected
+
+
+def test_truncated_cache_is_rebuilt(dictionary, tmp_path):
+    cache_dir = tmp_path / 'cache'
+    expected = load_trie(dictionary, str(cache_dir))
+    cache, = cache_dir.iterdir()
+    data = cache.read_bytes()
+    for cut in range(1, len(data), max(1, len(data) // 20)):
+        cache.write_bytes(data[:cut])
+        assert load_trie(dictionary, str(cache_dir)) == expected
+
+
+def test_dictionary_not_utf8_falls_back(tmp_path, monkeypatch):
+    path = tmp_path / 'utf16.tsv'
+    path.write_bytes("CAFÉ\tکیفے\n".encode('utf-16'))
+    monkeypatch.setenv('MORSE_URDU_DICT', str(path))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(translate, '_translator', None)
+    assert translate.manual_translate_to_urdu("hello") == translate.ENGLISH_URDU_DICT['HELLO']